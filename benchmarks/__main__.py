@@ -0,0 +1,77 @@
+"""Run the tekmoney benchmark suite.
+
+Run from the repository root:
+
+    python -m benchmarks                          # run and print every scenario
+    python -m benchmarks "currency.*" "flat_tax.*"  # run matching scenarios
+    python -m benchmarks --save baseline.json     # store a baseline
+    python -m benchmarks --compare baseline.json  # flag regressions
+
+The exit status is 1 when --compare finds a scenario slower than the
+baseline by more than --threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+
+from .suite import compare, run, select
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("patterns", nargs="*", help="shell-style scenario names")
+    parser.add_argument("--save", metavar="FILE", help="write results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="compare with a baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown before flagging a regression (default: 0.1)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    scenarios = select(args.patterns)
+    if not scenarios:
+        parser.error("no scenario matches the given patterns")
+    results = {}
+    for item in scenarios:
+        results.update(run([item], repeat=args.repeat))
+        print(f"{item.name:<45} {results[item.name] * 1e6:10.3f} us/op", flush=True)
+
+    if args.save:
+        document = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "unit": "seconds per operation",
+            "results": results,
+        }
+        with open(args.save, "w") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        rows = compare(baseline, results, args.threshold)
+        regressions = [row for row in rows if row[4]]
+        print()
+        for name, before, after, ratio, regressed in rows:
+            flag = "REGRESSION" if regressed else ""
+            print(
+                f"{name:<45} {before * 1e6:10.3f} -> {after * 1e6:10.3f} us/op"
+                f" {ratio:6.2f}x {flag}"
+            )
+        if regressions:
+            print(
+                f"\n{len(regressions)} scenario(s) slower than baseline by more"
+                f" than {args.threshold:.0%}"
+            )
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Measure concurrent conversions through async rate providers.
+
+Every round starts REQUESTS conversions at once on one event loop, against
+a source that takes DELAY seconds per load. Compares loading from the
+source for every request, a cold CachedRateProvider, where all requests
+share one load, and a warm one, where no request waits.
+
+Run from the repository root with: python -m benchmarks.bench_async_rates
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+
+from tekmoney.async_rates import CachedRateProvider, LocalAsyncRateProvider
+from tekmoney.currency import Currency
+from tekmoney.exchange import InMemoryRateProvider
+
+DELAY = 0.005
+RATES = {"USD": Decimal("1.0812"), "JPY": "161.53", "GBP": Decimal("0.8571")}
+
+
+async def _round(provider, requests):
+    price = Currency(Decimal("19.99"), "USD")
+    start = time.perf_counter()
+    await asyncio.gather(*(provider.convert(price, "JPY") for _ in range(requests)))
+    return time.perf_counter() - start
+
+
+async def _measure(requests):
+    source = LocalAsyncRateProvider(InMemoryRateProvider("EUR", RATES), delay=DELAY)
+    direct = await _round(source, requests)
+    direct_loads = source.loads
+    source.loads = 0
+    cached = CachedRateProvider(source, ttl=60, refresh_ahead=10)
+    cold = await _round(cached, requests)
+    warm = await _round(cached, requests)
+    for name, seconds, loads in [
+        ("source per request", direct, direct_loads),
+        ("cached, cold", cold, source.loads),
+        ("cached, warm", warm, 0),
+    ]:
+        print(
+            f"{requests:>6} requests  {name:<20} {seconds * 1000:9.2f} ms"
+            f" {requests / seconds:12,.0f} req/s {loads:>6} source loads"
+        )
+    source.loads = 0
+
+
+def main():
+    loop = asyncio.new_event_loop()
+    try:
+        for requests in (100, 1000, 10000):
+            loop.run_until_complete(_measure(requests))
+    finally:
+        loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare validated Currency construction with the internal path used for
+arithmetic results, and currency code checks on interned and on equal but
+separate strings.
+
+The per-operation effect on arithmetic shows in the currency.* scenarios
+of `python -m benchmarks --compare` against a baseline saved before.
+
+Run from the repository root with: python -m benchmarks.bench_construction
+"""
+
+import timeit
+from decimal import Decimal
+
+from tekmoney.currency import Currency, _new_currency
+from tekmoney.currency_tax import CurrencyWithTax
+
+NUMBER = 200000
+
+
+def main():
+    amount = Decimal("19.99")
+    a, b = Currency(amount, "USD"), Currency(Decimal("0.01"), "USD")
+    taxed = CurrencyWithTax(a, a)
+    interned = a.currency
+    separate = "".join(["U", "S", "D"])
+    scenarios = [
+        ("construct, validating", lambda: Currency(amount, "usd")),
+        ("construct, validating, int", lambda: Currency(1999, "USD")),
+        ("construct, internal", lambda: _new_currency(amount, interned)),
+        ("Currency + Currency", lambda: a + b),
+        ("Currency * int", lambda: a * 3),
+        ("CurrencyWithTax + CurrencyWithTax", lambda: taxed + taxed),
+        ("code check, interned", lambda: interned == interned),
+        ("code check, separate strings", lambda: interned == separate),
+    ]
+    for name, func in scenarios:
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:<35} {seconds / NUMBER * 1e9:8.1f} ns/op")
+
+
+if __name__ == "__main__":
+    main()
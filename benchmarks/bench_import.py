@@ -0,0 +1,52 @@
+"""Measure the cold import cost of tekmoney with python -X importtime.
+
+Run from the repository root with: python -m benchmarks.bench_import
+"""
+
+import os
+import subprocess
+import sys
+
+STATEMENTS = [
+    ("interpreter only", "pass"),
+    ("import tekmoney.currency", "import tekmoney.currency"),
+    (
+        "import + default quantize",
+        "import tekmoney.currency as c; c.Currency(1, 'USD').quantize()",
+    ),
+    ("import babel.numbers", "import babel.numbers"),
+]
+
+
+def cumulative_import_time(statement, env):
+    """Return the summed top level cumulative import time in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        fields = line.split("|")
+        # top level modules are the ones without indentation
+        if (
+            len(fields) == 3
+            and not fields[2].startswith("  ")
+            and fields[1].strip().isdigit()
+        ):
+            total += int(fields[1])
+    return total
+
+
+def main():
+    for babel in ("1", "0"):
+        env = dict(os.environ, TEKMONEY_USE_BABEL=babel)
+        for name, statement in STATEMENTS:
+            runs = [cumulative_import_time(statement, env) for _ in range(5)]
+            print(f"{name:<30} TEKMONEY_USE_BABEL={babel} {min(runs) / 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measure how PricingPipeline.run scales with worker processes.
+
+Prices ROWS rows with flat_tax, percentage_discount and quantize, first
+in this process and then with 1, 2, 4, ... workers up to the CPU count.
+The speedup is bounded by the number of CPUs of the machine.
+
+Run from the repository root with: python -m benchmarks.bench_pipeline [rows]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal
+
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.pipeline import PricingPipeline
+
+ROWS = 1000000
+CHUNK_SIZE = 65536
+
+
+def _seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    batch = CurrencyArray(range(rows), "USD")
+    pipeline = PricingPipeline(Decimal("0.23"), 15)
+    single = _seconds(lambda: pipeline.apply(batch))
+    print(f"{'in process':<12} {single:8.3f} s  {rows / single:12,.0f} rows/s")
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        with ProcessPoolExecutor(workers) as executor:
+            # start the workers before timing
+            list(executor.map(abs, range(workers)))
+            seconds = _seconds(
+                lambda: pipeline.run(
+                    batch, chunk_size=CHUNK_SIZE, executor=executor, workers=workers
+                )
+            )
+        print(
+            f"{workers:>2} workers   {seconds:8.3f} s  {rows / seconds:12,.0f} rows/s"
+            f"  speedup {single / seconds:4.2f}x"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare default quantization with cached currency metadata against a
+per-call Babel precision lookup.
+
+Run from the repository root with: python -m benchmarks.bench_quantize
+"""
+
+import timeit
+from decimal import Decimal, ROUND_HALF_UP
+
+from babel.numbers import get_currency_precision
+
+from tekmoney.currency import Currency
+from tekmoney.discount import percentage_discount
+from tekmoney.flat_tax import flat_tax
+
+NUMBER = 20000
+
+
+def babel_quantize(currency):
+    exp = Decimal("0.1") ** get_currency_precision(currency.currency)
+    return Currency(currency.amount.quantize(exp, ROUND_HALF_UP), currency.currency)
+
+
+def main():
+    price = Currency(Decimal("19.999"), "EUR")
+    scenarios = [
+        ("quantize, babel lookup per call", lambda: babel_quantize(price)),
+        ("quantize, cached registry", lambda: price.quantize()),
+        ("flat_tax", lambda: flat_tax(price, Decimal("0.23"))),
+        ("percentage_discount", lambda: percentage_discount(price, 15)),
+    ]
+    for name, func in scenarios:
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        print(f"{name:<35} {seconds / NUMBER * 1e6:8.2f} us/op")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Measure how fast money values travel to another process.
+
+A child process receives every payload over a multiprocessing Pipe,
+unpickles it and replies with the number of rows. Compares pickled lists
+of Currency and CurrencyWithTax, a pickled CurrencyArray, a CurrencyArray
+pickled with protocol 5 and its column sent out-of-band, and a codec
+batch message.
+
+Run from the repository root with: python -m benchmarks.bench_transfer [rows]
+"""
+
+import multiprocessing
+import pickle
+import sys
+import time
+from decimal import Decimal
+
+from tekmoney import codec
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_tax import CurrencyWithTax
+
+ROWS = 100000
+REPEAT = 5
+
+
+def _child(conn):
+    while True:
+        kind = conn.recv_bytes()
+        if kind == b"stop":
+            return
+        if kind == b"pickle":
+            value = pickle.loads(conn.recv_bytes())
+        elif kind == b"pickle5":
+            count = int(conn.recv_bytes())
+            data = conn.recv_bytes()
+            buffers = [conn.recv_bytes() for _ in range(count)]
+            value = pickle.loads(data, buffers=buffers)
+        else:
+            value = codec.decode_batch(conn.recv_bytes())
+        conn.send_bytes(str(len(value)).encode())
+
+
+def _send_pickle(conn, value):
+    data = pickle.dumps(value)
+    conn.send_bytes(b"pickle")
+    conn.send_bytes(data)
+    return len(data)
+
+
+def _send_pickle5(conn, value):
+    buffers = []
+    data = pickle.dumps(value, 5, buffer_callback=buffers.append)
+    conn.send_bytes(b"pickle5")
+    conn.send_bytes(str(len(buffers)).encode())
+    conn.send_bytes(data)
+    for buffer in buffers:
+        conn.send_bytes(buffer.raw())
+    return len(data) + sum(buffer.raw().nbytes for buffer in buffers)
+
+
+def _send_codec(conn, value):
+    data = codec.encode_batch(value)
+    conn.send_bytes(b"codec")
+    conn.send_bytes(data)
+    return len(data)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS
+    prices = [Currency(Decimal(n) / 100, "USD") for n in range(rows)]
+    taxed = [CurrencyWithTax(price, price * Decimal("1.23")) for price in prices]
+    batch = CurrencyArray.from_currencies(prices)
+    payloads = [
+        ("list of Currency, pickle", _send_pickle, prices),
+        ("list of CurrencyWithTax, pickle", _send_pickle, taxed),
+        ("CurrencyArray, pickle", _send_pickle, batch),
+        ("CurrencyArray, pickle 5 out-of-band", _send_pickle5, batch),
+        ("CurrencyArray, codec", _send_codec, batch),
+    ]
+    parent, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=_child, args=(child,))
+    process.start()
+    try:
+        for name, send, value in payloads:
+            best = None
+            for _ in range(REPEAT):
+                start = time.perf_counter()
+                size = send(parent, value)
+                assert int(parent.recv_bytes()) == rows
+                seconds = time.perf_counter() - start
+                best = seconds if best is None else min(best, seconds)
+            print(
+                f"{name:<36} {size / rows:7.1f} B/row"
+                f" {rows / best:14,.0f} rows/s {size / best / 1e6:9.1f} MB/s"
+            )
+    finally:
+        parent.send_bytes(b"stop")
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,836 @@
+"""Benchmark scenarios for every public tekmoney type and operation.
+
+A scenario is a function that builds its inputs and returns a callable
+doing the measured work. `ops` is the number of operations that callable
+performs, so bulk scenarios are reported per element.
+"""
+
+import copy
+import csv
+import fnmatch
+import io
+import json
+import os
+import pickle
+import tempfile
+import timeit
+from decimal import Decimal
+from typing import Callable, Dict, List, NamedTuple
+
+from tekmoney import codec
+from tekmoney.accumulator import CurrencyAccumulator, CurrencyWithTaxAccumulator
+from tekmoney.allocation import allocate, allocate_batch
+from tekmoney.catalog import PriceCatalog, write_catalog
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_range_index import CurrencyRangeIndex
+from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.discount import (
+    DiscountPlan,
+    fixed_discount,
+    fractional_discount,
+    percentage_discount,
+)
+from tekmoney.exchange import ExchangeRates
+from tekmoney.flat_tax import flat_tax, flat_tax_batch
+from tekmoney.minor_unit_currency import MinorUnitCurrency
+from tekmoney.multi_currency_total import MultiCurrencyTotal
+from tekmoney.pipeline import PricingPipeline
+from tekmoney.price_feed import read_price_batches
+from tekmoney.pricing_cache import PricingCache
+from tekmoney.range_aggregator import price_range
+from tekmoney.tax_schedule import TaxSchedule
+from tekmoney.utils import sum_by_currency, tek_sum
+
+BULK = 10000
+
+
+class Scenario(NamedTuple):
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    ops: int
+
+
+SCENARIOS: List[Scenario] = []
+
+
+def scenario(name: str, ops: int = 1):
+    """Register a scenario setup function under name."""
+
+    def register(setup):
+        SCENARIOS.append(Scenario(name, setup, ops))
+        return setup
+
+    return register
+
+
+def select(patterns: List[str]) -> List[Scenario]:
+    """Return the scenarios matching any of the shell-style patterns."""
+    if not patterns:
+        return list(SCENARIOS)
+    return [s for s in SCENARIOS if any(fnmatch.fnmatch(s.name, p) for p in patterns)]
+
+
+def measure(item: Scenario, repeat: int = 5, min_time: float = 0.05) -> float:
+    """Return the best time per operation in seconds."""
+    timer = timeit.Timer(item.setup())
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best / number / item.ops
+
+
+def run(scenarios: List[Scenario], repeat: int = 5) -> Dict[str, float]:
+    return {item.name: measure(item, repeat=repeat) for item in scenarios}
+
+
+def compare(
+    baseline: Dict[str, float], current: Dict[str, float], threshold: float
+) -> List[tuple]:
+    """Return (name, baseline, current, ratio, regressed) per shared scenario.
+
+    A scenario regressed when it got slower than baseline by more than
+    threshold, e.g. 0.1 for 10%.
+    """
+    rows = []
+    for name in sorted(set(baseline) & set(current)):
+        ratio = current[name] / baseline[name]
+        rows.append((name, baseline[name], current[name], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def _usd(amount) -> Currency:
+    return Currency(Decimal(amount), "USD")
+
+
+def _taxed(net, gross) -> CurrencyWithTax:
+    return CurrencyWithTax(_usd(net), _usd(gross))
+
+
+def _prices(count: int = BULK) -> List[Currency]:
+    return [_usd(Decimal(n) / 100) for n in range(count)]
+
+
+# construction
+
+
+@scenario("currency.construct")
+def currency_construct():
+    amount = Decimal("19.99")
+    return lambda: Currency(amount, "USD")
+
+
+@scenario("minor_unit_currency.construct")
+def minor_unit_currency_construct():
+    return lambda: MinorUnitCurrency.from_units(1999, "USD", 2)
+
+
+@scenario("currency_tax.construct")
+def currency_tax_construct():
+    net, gross = _usd("10"), _usd("12.3")
+    return lambda: CurrencyWithTax(net, gross)
+
+
+@scenario("currency_range.construct")
+def currency_range_construct():
+    start, stop = _usd("10"), _usd("20")
+    return lambda: CurrencyRange(start, stop)
+
+
+@scenario("currency_range_tax.construct")
+def currency_range_tax_construct():
+    start, stop = _taxed("10", "12"), _taxed("20", "24")
+    return lambda: CurrencyRangeTax(start, stop)
+
+
+@scenario("currency_array.from_currencies", ops=BULK)
+def currency_array_from_currencies():
+    prices = _prices()
+    return lambda: CurrencyArray.from_currencies(prices)
+
+
+@scenario("currency_array.to_currencies", ops=BULK)
+def currency_array_to_currencies():
+    prices = CurrencyArray.from_currencies(_prices())
+    return prices.to_currencies
+
+
+# arithmetic and comparison
+
+
+@scenario("currency.add")
+def currency_add():
+    a, b = _usd("10.25"), _usd("3.10")
+    return lambda: a + b
+
+
+@scenario("currency.sub")
+def currency_sub():
+    a, b = _usd("10.25"), _usd("3.10")
+    return lambda: a - b
+
+
+@scenario("currency.mul")
+def currency_mul():
+    a, factor = _usd("10.25"), Decimal("1.5")
+    return lambda: a * factor
+
+
+@scenario("currency.div")
+def currency_div():
+    a = _usd("10.25")
+    return lambda: a / 3
+
+
+@scenario("currency.lt")
+def currency_lt():
+    a, b = _usd("10.25"), _usd("3.10")
+    return lambda: a < b
+
+
+@scenario("currency.le")
+def currency_le():
+    a, b = _usd("10.25"), _usd("3.10")
+    return lambda: a <= b
+
+
+@scenario("currency.eq")
+def currency_eq():
+    a, b = _usd("10.25"), _usd("10.25")
+    return lambda: a == b
+
+
+@scenario("currency.hash")
+def currency_hash():
+    values = {_usd("10.25"): 1}
+    key = _usd("10.25")
+    return lambda: values[key]
+
+
+@scenario("minor_unit_currency.add")
+def minor_unit_currency_add():
+    a = MinorUnitCurrency.from_units(1025, "USD", 2)
+    b = MinorUnitCurrency.from_units(310, "USD", 2)
+    return lambda: a + b
+
+
+@scenario("minor_unit_currency.lt")
+def minor_unit_currency_lt():
+    a = MinorUnitCurrency.from_units(1025, "USD", 2)
+    b = MinorUnitCurrency.from_units(310, "USD", 2)
+    return lambda: a < b
+
+
+@scenario("currency_tax.add")
+def currency_tax_add():
+    a, b = _taxed("10", "12"), _taxed("5", "6")
+    return lambda: a + b
+
+
+@scenario("currency_tax.mul")
+def currency_tax_mul():
+    a = _taxed("10", "12")
+    return lambda: a * 3
+
+
+@scenario("currency_tax.lt")
+def currency_tax_lt():
+    a, b = _taxed("10", "12"), _taxed("5", "6")
+    return lambda: a < b
+
+
+@scenario("currency_range.add")
+def currency_range_add():
+    a = CurrencyRange(_usd("10"), _usd("20"))
+    return lambda: a + a
+
+
+@scenario("currency_range.contains")
+def currency_range_contains():
+    a, price = CurrencyRange(_usd("10"), _usd("20")), _usd("15")
+    return lambda: price in a
+
+
+def _bands(count: int = 1000) -> List[CurrencyRange]:
+    return [CurrencyRange(_usd(n), _usd(n + 5)) for n in range(0, count * 3, 3)]
+
+
+@scenario("currency_range.contains.scan")
+def currency_range_contains_scan():
+    bands, price = _bands(), _usd("1500.5")
+    return lambda: [band for band in bands if price in band]
+
+
+@scenario("currency_range_index.find")
+def currency_range_index_find():
+    index, price = CurrencyRangeIndex(_bands()), _usd("1500.5")
+    return lambda: index.find(price)
+
+
+@scenario("currency_range_index.find_many", ops=BULK)
+def currency_range_index_find_many():
+    index = CurrencyRangeIndex(_bands())
+    prices = CurrencyArray(range(0, BULK * 30, 30), "USD")
+    return lambda: index.find_many(prices)
+
+
+@scenario("currency_range_tax.add")
+def currency_range_tax_add():
+    a = CurrencyRangeTax(_taxed("10", "12"), _taxed("20", "24"))
+    return lambda: a + a
+
+
+@scenario("currency_range_tax.contains")
+def currency_range_tax_contains():
+    a = CurrencyRangeTax(_taxed("10", "12"), _taxed("20", "24"))
+    price = _taxed("15", "18")
+    return lambda: price in a
+
+
+@scenario("currency_array.add", ops=BULK)
+def currency_array_add():
+    prices = CurrencyArray.from_currencies(_prices())
+    return lambda: prices + prices
+
+
+@scenario("currency_array.mul_fraction", ops=BULK)
+def currency_array_mul_fraction():
+    prices = CurrencyArray.from_currencies(_prices())
+    factor = Decimal("1.23")
+    return lambda: prices * factor
+
+
+@scenario("currency_array.lt", ops=BULK)
+def currency_array_lt():
+    prices = CurrencyArray.from_currencies(_prices())
+    limit = _usd("50")
+    return lambda: prices < limit
+
+
+# quantize
+
+
+@scenario("currency.quantize")
+def currency_quantize():
+    a = _usd("10.255")
+    return a.quantize
+
+
+@scenario("minor_unit_currency.quantize")
+def minor_unit_currency_quantize():
+    a = MinorUnitCurrency.from_units(10255, "USD", 3)
+    return a.quantize
+
+
+@scenario("currency_tax.quantize")
+def currency_tax_quantize():
+    a = _taxed("10.255", "12.306")
+    return a.quantize
+
+
+@scenario("currency_range.quantize")
+def currency_range_quantize():
+    a = CurrencyRange(_usd("10.255"), _usd("20.255"))
+    return a.quantize
+
+
+@scenario("currency_range_tax.quantize")
+def currency_range_tax_quantize():
+    a = CurrencyRangeTax(_taxed("10.255", "12.306"), _taxed("20.255", "24.306"))
+    return a.quantize
+
+
+@scenario("currency_array.quantize", ops=BULK)
+def currency_array_quantize():
+    prices = CurrencyArray(range(BULK), "USD", precision=3)
+    return prices.quantize
+
+
+# flat_tax
+
+
+@scenario("flat_tax.currency")
+def flat_tax_currency():
+    price, rate = _usd("10"), Decimal("0.23")
+    return lambda: flat_tax(price, rate)
+
+
+@scenario("flat_tax.currency_with_tax.keep_gross")
+def flat_tax_currency_with_tax():
+    price, rate = _taxed("12.3", "12.3"), Decimal("0.23")
+    return lambda: flat_tax(price, rate, keep_gross=True)
+
+
+@scenario("flat_tax.currency_range")
+def flat_tax_currency_range():
+    price, rate = CurrencyRange(_usd("10"), _usd("20")), Decimal("0.23")
+    return lambda: flat_tax(price, rate)
+
+
+@scenario("flat_tax.loop", ops=BULK)
+def flat_tax_loop():
+    prices, rate = _prices(), Decimal("0.23")
+    return lambda: [flat_tax(price, rate) for price in prices]
+
+
+@scenario("flat_tax.batch", ops=BULK)
+def flat_tax_batch_scenario():
+    prices, rate = CurrencyArray.from_currencies(_prices()), Decimal("0.23")
+    return lambda: flat_tax_batch(prices, rate)
+
+
+@scenario("pricing_cache.flat_tax.hit")
+def pricing_cache_flat_tax():
+    cache, price, rate = PricingCache(), _usd("10"), Decimal("0.23")
+    return lambda: cache.flat_tax(price, rate)
+
+
+# discounts
+
+
+@scenario("discount.fixed.currency")
+def discount_fixed_currency():
+    price, discount = _usd("10"), _usd("3")
+    return lambda: fixed_discount(price, discount)
+
+
+@scenario("discount.fixed.currency_range_tax")
+def discount_fixed_currency_range_tax():
+    price = CurrencyRangeTax(_taxed("10", "12"), _taxed("20", "24"))
+    discount = _usd("3")
+    return lambda: fixed_discount(price, discount)
+
+
+@scenario("discount.fractional.currency")
+def discount_fractional_currency():
+    price, fraction = _usd("10"), Decimal("0.15")
+    return lambda: fractional_discount(price, fraction)
+
+
+@scenario("discount.fractional.currency_with_tax")
+def discount_fractional_currency_with_tax():
+    price, fraction = _taxed("10", "12"), Decimal("0.15")
+    return lambda: fractional_discount(price, fraction)
+
+
+@scenario("discount.percentage.currency")
+def discount_percentage_currency():
+    price = _usd("10")
+    return lambda: percentage_discount(price, 15)
+
+
+@scenario("discount.percentage.loop", ops=BULK)
+def discount_percentage_loop():
+    prices = _prices()
+    return lambda: [percentage_discount(price, 15) for price in prices]
+
+
+@scenario("discount.percentage.batch", ops=BULK)
+def discount_percentage_batch():
+    prices = CurrencyArray.from_currencies(_prices())
+    return lambda: percentage_discount(prices, 15)
+
+
+def _promotion(price):
+    return fixed_discount(percentage_discount(price, 10), _usd("5"))
+
+
+@scenario("discount.chain.currency_with_tax", ops=BULK)
+def discount_chain_currency_with_tax():
+    prices = [_taxed(Decimal(n) / 100, Decimal(n) * 123 / 10000) for n in range(BULK)]
+    return lambda: [_promotion(price) for price in prices]
+
+
+@scenario("discount.plan.currency_with_tax", ops=BULK)
+def discount_plan_currency_with_tax():
+    prices = [_taxed(Decimal(n) / 100, Decimal(n) * 123 / 10000) for n in range(BULK)]
+    plan = DiscountPlan().percentage(10).fixed(_usd("5"))
+    return lambda: [plan(price) for price in prices]
+
+
+@scenario("discount.chain.batch", ops=BULK)
+def discount_chain_batch():
+    prices = CurrencyArray.from_currencies(_prices())
+    return lambda: _promotion(prices)
+
+
+@scenario("discount.plan.batch", ops=BULK)
+def discount_plan_batch():
+    prices = CurrencyArray.from_currencies(_prices())
+    plan = DiscountPlan().percentage(10).fixed(_usd("5"))
+    return lambda: plan(prices)
+
+
+# price feeds
+
+
+def _feed() -> str:
+    return "".join(f"{price.amount},USD\n" for price in _prices())
+
+
+@scenario("price_feed.decimal_rows", ops=BULK)
+def price_feed_decimal_rows():
+    feed = _feed()
+
+    def run():
+        return [
+            Currency(Decimal(amount), code)
+            for amount, code in csv.reader(io.StringIO(feed))
+        ]
+
+    return run
+
+
+@scenario("price_feed.read_price_batches", ops=BULK)
+def price_feed_read_price_batches():
+    feed = _feed()
+    return lambda: list(
+        read_price_batches(io.StringIO(feed), amount_column=0, currency_column=1)
+    )
+
+
+# sums
+
+
+@scenario("tek_sum.currency", ops=BULK)
+def tek_sum_currency():
+    prices = _prices()
+    return lambda: tek_sum(prices)
+
+
+@scenario("running_total.currency", ops=BULK)
+def running_total_currency():
+    prices = _prices()
+
+    def run():
+        total = _usd(0)
+        for price in prices:
+            total += price
+        return total
+
+    return run
+
+
+@scenario("running_total.accumulator", ops=BULK)
+def running_total_accumulator():
+    prices = _prices()
+
+    def run():
+        total = CurrencyAccumulator("USD")
+        for price in prices:
+            total += price
+        return total.freeze()
+
+    return run
+
+
+@scenario("running_total.accumulator_with_tax", ops=BULK)
+def running_total_accumulator_with_tax():
+    prices = [_taxed(price.amount, price.amount * 2) for price in _prices()]
+
+    def run():
+        total = CurrencyWithTaxAccumulator("USD")
+        for price in prices:
+            total += price
+        return total.freeze()
+
+    return run
+
+
+@scenario("tek_sum.currency_with_tax", ops=BULK)
+def tek_sum_currency_with_tax():
+    prices = [_taxed(price.amount, price.amount * 2) for price in _prices()]
+    return lambda: tek_sum(prices)
+
+
+@scenario("tek_sum.sum_by_currency", ops=BULK)
+def tek_sum_sum_by_currency():
+    prices = [
+        Currency(Decimal(n) / 100, ("USD", "EUR", "GBP")[n % 3]) for n in range(BULK)
+    ]
+    return lambda: sum_by_currency(prices)
+
+
+@scenario("multi_currency_total.update", ops=BULK)
+def multi_currency_total_update():
+    prices = [
+        Currency(Decimal(n) / 100, ("USD", "EUR", "GBP")[n % 3]) for n in range(BULK)
+    ]
+    return lambda: MultiCurrencyTotal(prices).totals()
+
+
+# price ranges
+
+
+@scenario("price_range.min_max", ops=BULK)
+def price_range_min_max():
+    prices = [_taxed(price.amount, price.amount * 2) for price in _prices()]
+    return lambda: CurrencyRangeTax(min(prices), max(prices))
+
+
+@scenario("price_range.currency_with_tax", ops=BULK)
+def price_range_currency_with_tax():
+    prices = [_taxed(price.amount, price.amount * 2) for price in _prices()]
+    return lambda: price_range(prices)
+
+
+@scenario("price_range.batch", ops=BULK)
+def price_range_batch():
+    prices = CurrencyArray.from_currencies(_prices())
+    return lambda: price_range(prices)
+
+
+# serialization
+
+
+def _from_str(text: str) -> Currency:
+    amount, code = text.split()
+    return Currency(Decimal(amount), code)
+
+
+@scenario("serialize.str.encode")
+def serialize_str_encode():
+    price = _usd("10.00")
+    return lambda: str(price)
+
+
+@scenario("serialize.str.decode")
+def serialize_str_decode():
+    text = str(_usd("10.00"))
+    return lambda: _from_str(text)
+
+
+@scenario("serialize.codec.encode")
+def serialize_codec_encode():
+    price = _usd("10.00")
+    return lambda: codec.encode(price)
+
+
+@scenario("serialize.codec.decode")
+def serialize_codec_decode():
+    data = codec.encode(_usd("10.00"))
+    return lambda: codec.decode(data)
+
+
+@scenario("serialize.str.encode_list", ops=BULK)
+def serialize_str_encode_list():
+    prices = _prices()
+    return lambda: json.dumps([str(price) for price in prices])
+
+
+@scenario("serialize.str.decode_list", ops=BULK)
+def serialize_str_decode_list():
+    text = json.dumps([str(price) for price in _prices()])
+    return lambda: [_from_str(item) for item in json.loads(text)]
+
+
+@scenario("serialize.codec.encode_many", ops=BULK)
+def serialize_codec_encode_many():
+    prices = _prices()
+    return lambda: codec.encode_many(prices)
+
+
+@scenario("serialize.codec.decode_many", ops=BULK)
+def serialize_codec_decode_many():
+    data = codec.encode_many(_prices())
+    return lambda: codec.decode_many(data)
+
+
+@scenario("serialize.codec.encode_batch", ops=BULK)
+def serialize_codec_encode_batch():
+    prices = CurrencyArray.from_currencies(_prices())
+    return lambda: codec.encode_batch(prices)
+
+
+@scenario("serialize.codec.decode_batch", ops=BULK)
+def serialize_codec_decode_batch():
+    data = codec.encode_batch(CurrencyArray.from_currencies(_prices()))
+    return lambda: codec.decode_batch(data)
+
+
+_catalog_directory = tempfile.TemporaryDirectory()
+
+
+def _catalog_path() -> str:
+    """Return the path of a catalog of _prices(), written on first use."""
+    path = os.path.join(_catalog_directory.name, "prices.catalog")
+    if not os.path.exists(path):
+        prices = CurrencyArray.from_currencies(_prices())
+        write_catalog(path, range(0, 7 * BULK, 7), prices)
+    return path
+
+
+@scenario("catalog.open")
+def catalog_open():
+    path = _catalog_path()
+    return lambda: PriceCatalog(path).close()
+
+
+@scenario("catalog.price", ops=BULK)
+def catalog_price():
+    catalog = PriceCatalog(_catalog_path())
+    skus = list(range(0, 7 * BULK, 7))
+    return lambda: [catalog.price(sku) for sku in skus]
+
+
+@scenario("catalog.price.dict", ops=BULK)
+def catalog_price_dict():
+    prices = dict(zip(range(0, 7 * BULK, 7), _prices()))
+    skus = list(prices)
+    return lambda: [prices[sku] for sku in skus]
+
+
+@scenario("catalog.slice", ops=BULK)
+def catalog_slice():
+    catalog = PriceCatalog(_catalog_path())
+    return lambda: flat_tax_batch(catalog[:], Decimal("0.2"))
+
+
+@scenario("pipeline.scalar", ops=BULK)
+def pipeline_scalar():
+    prices = _prices()
+    rate = Decimal("0.23")
+    return lambda: [
+        percentage_discount(flat_tax(price, rate), 15).quantize() for price in prices
+    ]
+
+
+@scenario("pipeline.apply", ops=BULK)
+def pipeline_apply():
+    prices = CurrencyArray.from_currencies(_prices())
+    pipeline = PricingPipeline(Decimal("0.23"), 15)
+    return lambda: pipeline.apply(prices)
+
+
+@scenario("pickle.currency.dumps", ops=BULK)
+def pickle_currency_dumps():
+    prices = _prices()
+    return lambda: pickle.dumps(prices)
+
+
+@scenario("pickle.currency.loads", ops=BULK)
+def pickle_currency_loads():
+    data = pickle.dumps(_prices())
+    return lambda: pickle.loads(data)
+
+
+@scenario("pickle.currency_with_tax.dumps", ops=BULK)
+def pickle_currency_with_tax_dumps():
+    prices = [_taxed(n, n * 2) for n in range(BULK)]
+    return lambda: pickle.dumps(prices)
+
+
+@scenario("pickle.currency_with_tax.loads", ops=BULK)
+def pickle_currency_with_tax_loads():
+    data = pickle.dumps([_taxed(n, n * 2) for n in range(BULK)])
+    return lambda: pickle.loads(data)
+
+
+@scenario("pickle.batch.out_of_band", ops=BULK)
+def pickle_batch_out_of_band():
+    prices = CurrencyArray.from_currencies(_prices())
+
+    def run():
+        buffers: list = []
+        data = pickle.dumps(prices, 5, buffer_callback=buffers.append)
+        return pickle.loads(data, buffers=buffers)
+
+    return run
+
+
+@scenario("copy.deepcopy.currency_with_tax")
+def copy_deepcopy_currency_with_tax():
+    price = _taxed("19.99", "24.59")
+    return lambda: copy.deepcopy(price)
+
+
+_RATES = {"USD": Decimal("1.0812"), "JPY": "161.53", "GBP": Decimal("0.8571")}
+
+
+@scenario("exchange.adhoc", ops=BULK)
+def exchange_adhoc():
+    prices = _prices()
+    rate = Decimal("161.53") / Decimal("1.0812")
+    return lambda: [Currency(price.amount * rate, "JPY").quantize() for price in prices]
+
+
+@scenario("exchange.convert", ops=BULK)
+def exchange_convert():
+    prices = _prices()
+    rates = ExchangeRates("EUR", _RATES)
+    return lambda: [rates.convert(price, "JPY") for price in prices]
+
+
+@scenario("exchange.convert.batch", ops=BULK)
+def exchange_convert_batch():
+    prices = CurrencyArray.from_currencies(_prices())
+    rates = ExchangeRates("EUR", _RATES)
+    return lambda: rates.convert(prices, "JPY")
+
+
+_BRACKETS = [(0, Decimal("0.05")), (25, Decimal("0.0875")), (75, Decimal("0.2"))]
+
+
+def _bracket_tax(price: Currency) -> CurrencyWithTax:
+    """Progressive tax the way it is written without TaxSchedule."""
+    tax = Decimal(0)
+    for i, (threshold, rate) in enumerate(_BRACKETS):
+        if price.amount <= threshold:
+            break
+        top = price.amount
+        if i + 1 < len(_BRACKETS):
+            top = min(top, Decimal(_BRACKETS[i + 1][0]))
+        tax += (top - threshold) * rate
+    return CurrencyWithTax(price, Currency(price.amount + tax, "USD").quantize())
+
+
+@scenario("tax_schedule.loop", ops=BULK)
+def tax_schedule_loop():
+    prices = _prices()
+    return lambda: [_bracket_tax(price) for price in prices]
+
+
+@scenario("tax_schedule.currency", ops=BULK)
+def tax_schedule_currency():
+    prices = _prices()
+    schedule = TaxSchedule("USD", _BRACKETS)
+    return lambda: [schedule(price) for price in prices]
+
+
+@scenario("tax_schedule.batch", ops=BULK)
+def tax_schedule_batch():
+    prices = CurrencyArray.from_currencies(_prices())
+    schedule = TaxSchedule("USD", _BRACKETS)
+    return lambda: schedule.apply_batch(prices)
+
+
+_SHIPMENTS = [Decimal(5), Decimal(3), Decimal(2)]
+
+
+def _split_by_hand(total: Currency) -> List[Currency]:
+    """Pro-rating the way it is written without allocate."""
+    weight = sum(_SHIPMENTS)
+    parts = [(total * share / weight).quantize() for share in _SHIPMENTS]
+    parts[0] += total - sum(parts[1:], parts[0])
+    return parts
+
+
+@scenario("allocate.by_hand", ops=BULK)
+def allocate_by_hand():
+    prices = _prices()
+    return lambda: [_split_by_hand(price) for price in prices]
+
+
+@scenario("allocate.currency", ops=BULK)
+def allocate_currency():
+    prices = _prices()
+    return lambda: [allocate(price, _SHIPMENTS) for price in prices]
+
+
+@scenario("allocate.batch", ops=BULK)
+def allocate_batch_scenario():
+    prices = CurrencyArray.from_currencies(_prices())
+    return lambda: allocate_batch(prices, _SHIPMENTS)
@@ -0,0 +1,156 @@
+from decimal import Decimal
+from typing import Union
+
+from .currency import Currency, _new_currency
+from .currency_info import intern_currency
+from .currency_tax import CurrencyWithTax
+
+Dint = Union[Decimal, int]
+
+
+class CurrencyAccumulator:
+    """Running total of one currency, updated in place with += and -=.
+
+    The total is kept as a raw Decimal, so updates do not create Currency
+    objects. The currency code is normalized once here and each update only
+    compares it. `freeze` returns the total as a Currency.
+    """
+
+    __slots__ = ("amount", "currency")
+
+    def __init__(self, currency: str, amount: Dint = 0) -> None:
+        self.currency = intern_currency(currency)
+        self.amount = Decimal(amount)
+
+    @classmethod
+    def from_currency(cls, value: Currency) -> "CurrencyAccumulator":
+        """Start a total from value."""
+        if not isinstance(value, Currency):
+            raise TypeError(f"CurrencyAccumulator requires Currency, got {value!r}")
+        return cls(value.currency, value.amount)
+
+    def __str__(self) -> str:
+        return f"CurrencyAccumulator({self.amount} {self.currency})"
+
+    def _amount_of(self, other: object, verb: str) -> Decimal:
+        if isinstance(other, (Currency, CurrencyAccumulator)):
+            if other.currency != self.currency:
+                raise ValueError(f"cannot {verb} {self.currency} and {other.currency}")
+            return other.amount
+        raise TypeError(f"cannot {verb} {type(other).__name__!r} to a Currency total")
+
+    def add(self, other: object) -> None:
+        """Add a Currency or another total in place."""
+        self.amount += self._amount_of(other, "add")
+
+    def subtract(self, other: object) -> None:
+        """Subtract a Currency or another total in place."""
+        self.amount -= self._amount_of(other, "subtract")
+
+    def __iadd__(self, other: object) -> "CurrencyAccumulator":
+        self.amount += self._amount_of(other, "add")
+        return self
+
+    def __isub__(self, other: object) -> "CurrencyAccumulator":
+        self.amount -= self._amount_of(other, "subtract")
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CurrencyAccumulator):
+            return self.currency == other.currency and self.amount == other.amount
+        return False
+
+    __hash__ = None  # type: ignore
+
+    def freeze(self) -> Currency:
+        """Return the current total as a Currency."""
+        return _new_currency(self.amount, self.currency)
+
+
+class CurrencyWithTaxAccumulator:
+    """Running net and gross totals of one currency, updated in place.
+
+    Adding a CurrencyWithTax adds its net and gross; adding a Currency adds
+    it to both, like `CurrencyWithTax.__add__`. `freeze` returns the totals
+    as a CurrencyWithTax.
+    """
+
+    __slots__ = ("net", "gross", "currency")
+
+    def __init__(self, currency: str, net: Dint = 0, gross: Dint = 0) -> None:
+        self.currency = intern_currency(currency)
+        self.net = Decimal(net)
+        self.gross = Decimal(gross)
+
+    @classmethod
+    def from_currency(cls, value: CurrencyWithTax) -> "CurrencyWithTaxAccumulator":
+        """Start a total from value."""
+        if not isinstance(value, CurrencyWithTax):
+            raise TypeError(
+                f"CurrencyWithTaxAccumulator requires CurrencyWithTax, got {value!r}"
+            )
+        return cls(value.currency, value.net.amount, value.gross.amount)
+
+    def __str__(self) -> str:
+        return (
+            f"CurrencyWithTaxAccumulator(net={self.net} {self.currency},"
+            f" gross={self.gross} {self.currency})"
+        )
+
+    def _amounts_of(self, other: object, verb: str):
+        if isinstance(other, CurrencyWithTax):
+            net, gross = other.net.amount, other.gross.amount
+        elif isinstance(other, CurrencyWithTaxAccumulator):
+            net, gross = other.net, other.gross
+        elif isinstance(other, (Currency, CurrencyAccumulator)):
+            net = gross = other.amount
+        else:
+            raise TypeError(
+                f"cannot {verb} {type(other).__name__!r} to a CurrencyWithTax total"
+            )
+        if other.currency != self.currency:
+            raise ValueError(f"cannot {verb} {self.currency} and {other.currency}")
+        return net, gross
+
+    def add(self, other: object) -> None:
+        """Add a money value or another total in place."""
+        net, gross = self._amounts_of(other, "add")
+        self.net += net
+        self.gross += gross
+
+    def subtract(self, other: object) -> None:
+        """Subtract a money value or another total in place."""
+        net, gross = self._amounts_of(other, "subtract")
+        self.net -= net
+        self.gross -= gross
+
+    def __iadd__(self, other: object) -> "CurrencyWithTaxAccumulator":
+        self.add(other)
+        return self
+
+    def __isub__(self, other: object) -> "CurrencyWithTaxAccumulator":
+        self.subtract(other)
+        return self
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CurrencyWithTaxAccumulator):
+            return (
+                self.currency == other.currency
+                and self.net == other.net
+                and self.gross == other.gross
+            )
+        return False
+
+    __hash__ = None  # type: ignore
+
+    @property
+    def tax(self) -> Decimal:
+        """Return the current tax amount."""
+        return self.gross - self.net
+
+    def freeze(self) -> CurrencyWithTax:
+        """Return the current totals as a CurrencyWithTax."""
+        return CurrencyWithTax(
+            net=_new_currency(self.net, self.currency),
+            gross=_new_currency(self.gross, self.currency),
+        )
@@ -0,0 +1,155 @@
+from array import array
+from decimal import Decimal
+from functools import lru_cache
+from math import gcd
+from typing import List, Sequence, Tuple, Union
+
+from .currency import Currency, _new_currency
+from .currency_array import CurrencyArray
+from .currency_info import get_currency_precision
+from .instrumentation import timed
+from .minor_units import as_ratio, from_minor_units, required_precision
+
+Dint = Union[Decimal, int]
+Weights = Tuple[Tuple[int, ...], int]
+
+# allocate_batch builds residue tables of up to this many entries, and only
+# for batches with at least as many rows
+_MAX_TABLE = 1 << 16
+
+
+def _weights(ratios: Sequence[Dint]) -> Weights:
+    """Return ratios as ints with the same proportions, and their sum."""
+    ratios = tuple(ratios)
+    # check every call: equal ratios of other types, like 0.5 and
+    # Decimal("0.5") or True and 1, share cache entries
+    for ratio in ratios:
+        if isinstance(ratio, Decimal):
+            if not ratio.is_finite() or ratio < 0:
+                raise ValueError(f"ratios must not be negative, got {ratio}")
+        elif not isinstance(ratio, int) or isinstance(ratio, bool):
+            raise TypeError(f"unsupported ratio {ratio!r}")
+        elif ratio < 0:
+            raise ValueError(f"ratios must not be negative, got {ratio}")
+    if not ratios:
+        raise ValueError("allocating requires at least one ratio")
+    return _cached_weights(ratios)
+
+
+def _ratio_weights(ratios: Tuple[Dint, ...]) -> Weights:
+    fractions = [as_ratio(ratio) for ratio in ratios]
+    common = 1
+    for _, denominator in fractions:
+        common = common * denominator // gcd(common, denominator)
+    weights = [
+        numerator * (common // denominator) for numerator, denominator in fractions
+    ]
+    divisor = 0
+    for weight in weights:
+        divisor = gcd(divisor, weight)
+    if not divisor:
+        raise ValueError(f"ratios must not all be zero, got {list(ratios)}")
+    reduced = tuple(weight // divisor for weight in weights)
+    return reduced, sum(reduced)
+
+
+_cached_weights = lru_cache(maxsize=256)(_ratio_weights)
+
+
+def _split(units: int, weights: Tuple[int, ...], total: int) -> List[int]:
+    """Split units in proportion to weights with the largest remainder method.
+
+    Every part is rounded down, then the units left over go one each to the
+    parts with the largest remainders, earlier parts first on ties. Negative
+    amounts are split like their absolute value.
+    """
+    if units < 0:
+        return [-part for part in _split(-units, weights, total)]
+    parts = []
+    remainders = []
+    for weight in weights:
+        part, remainder = divmod(units * weight, total)
+        parts.append(part)
+        remainders.append(remainder)
+    leftover = units - sum(parts)
+    if leftover:
+        # sorted is stable with reverse=True, so ties keep the earlier part
+        order = sorted(range(len(parts)), key=remainders.__getitem__, reverse=True)
+        for i in order[:leftover]:
+            parts[i] += 1
+    return parts
+
+
+@timed("allocate")
+def allocate(value: Currency, ratios: Sequence[Dint]) -> List[Currency]:
+    """Split value into parts in proportion to ratios, e.g. [1, 1, 1] or [70, 30].
+
+    The parts are whole minor units of the currency, or of the places of
+    value if it has more, and add up exactly to value:
+
+        allocate(Currency(100, "USD"), [1, 1, 1])  # 33.34, 33.33, 33.33 USD
+
+    Every part is within one minor unit of its exact share.
+    """
+    if not isinstance(value, Currency):
+        raise TypeError(f"allocate requires a Currency, got {value!r}")
+    weights, total = _weights(ratios)
+    precision = max(
+        get_currency_precision(value.currency), required_precision(value.amount)
+    )
+    units = int(value.amount.scaleb(precision))
+    return [
+        _new_currency(from_minor_units(part, precision), value.currency)
+        for part in _split(units, weights, total)
+    ]
+
+
+@timed("allocate_batch")
+def allocate_batch(
+    totals: CurrencyArray, ratios: Sequence[Dint]
+) -> List[CurrencyArray]:
+    """Split every row of totals like `allocate` splits one value.
+
+    Returns one array per ratio, in the precision of totals, so row i of
+    the k-th array is part k of totals[i]. Only int arithmetic is used.
+    """
+    if not isinstance(totals, CurrencyArray):
+        raise TypeError(f"allocate_batch requires a CurrencyArray, got {totals!r}")
+    weights, total = _weights(ratios)
+    units = totals.units
+    if total > min(len(units), _MAX_TABLE):
+        parts = [_split(u, weights, total) for u in units]
+        columns = [array("q", column) for column in zip(*parts)] or [
+            array("q") for _ in weights
+        ]
+    else:
+        columns = _split_columns(units, weights, total)
+    return [
+        CurrencyArray(column, totals.currency, totals.precision) for column in columns
+    ]
+
+
+def _split_columns(units, weights: Tuple[int, ...], total: int) -> List[array]:
+    """Split every row of units with tables of the parts of units % total.
+
+    Part k of u >= 0 is (u // total) * weights[k] plus part k of
+    u % total, since only the remainders decide where leftover units go.
+    So the parts of every residue are computed once and each column is one
+    pass of int arithmetic over the rows.
+    """
+    tables = list(zip(*[_split(residue, weights, total) for residue in range(total)]))
+    if all(u >= 0 for u in units):
+        rows = [divmod(u, total) for u in units]
+        return [
+            array("q", [q * weight + table[r] for q, r in rows])
+            for weight, table in zip(weights, tables)
+        ]
+    rows = [divmod(u, total) if u >= 0 else divmod(-u, total) for u in units]
+    signs = [-1 if u < 0 else 1 for u in units]
+    return [
+        array(
+            "q",
+            [sign * (q * weight + table[r]) for sign, (q, r) in zip(signs, rows)],
+        )
+        for weight, table in zip(weights, tables)
+    ]
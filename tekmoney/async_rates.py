@@ -0,0 +1,120 @@
+"""Exchange rates for asyncio applications.
+
+CachedRateProvider sits between request handlers and a slow rate source:
+
+    rates = CachedRateProvider(source, ttl=60, refresh_ahead=10)
+    price = await rates.convert(Currency(10, "USD"), "EUR")
+
+Handlers get cached rates without waiting while they are fresh. Concurrent
+misses share one load of the source, and rates close to expiry are
+reloaded in the background while the cached ones are still served.
+"""
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+from .exchange import ExchangeRates, RateProvider
+
+
+class AsyncRateProvider(ABC):
+    """Source of ExchangeRates for asyncio code."""
+
+    @abstractmethod
+    async def load(self) -> ExchangeRates:
+        """Return the current rates."""
+
+    async def convert(self, value, target: str, rounding=None):
+        """Return value in the target currency, see `ExchangeRates.convert`."""
+        rates = await self.load()
+        return rates.convert(value, target, rounding)
+
+
+class LocalAsyncRateProvider(AsyncRateProvider):
+    """Runs a RateProvider, like FileRateProvider, in the default executor.
+
+    delay adds that many seconds to every load, to stand in for a remote
+    rates service. loads counts the loads of provider.
+    """
+
+    def __init__(self, provider: RateProvider, *, delay: float = 0.0) -> None:
+        self.provider = provider
+        self.delay = delay
+        self.loads = 0
+
+    async def load(self) -> ExchangeRates:
+        self.loads += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.provider.load)
+
+
+class CachedRateProvider(AsyncRateProvider):
+    """Caches the rates of another AsyncRateProvider for ttl seconds.
+
+    Only one load of source runs at a time; every caller that finds no
+    fresh rates waits for that load. Cancelling a caller does not cancel
+    the load. Once rates are older than ttl - refresh_ahead, a load starts
+    in the background and callers keep getting the cached rates until they
+    expire. A failed background load is kept in last_error and retried by
+    the next call; a failed load without usable rates is raised to all
+    of its callers.
+    """
+
+    def __init__(
+        self,
+        source: AsyncRateProvider,
+        ttl: float = 60.0,
+        *,
+        refresh_ahead: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if not 0 <= refresh_ahead < ttl:
+            raise ValueError(f"refresh_ahead must be in [0, ttl), got {refresh_ahead}")
+        self.source = source
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.clock = clock
+        self.last_error: Optional[BaseException] = None
+        self._rates: Optional[ExchangeRates] = None
+        self._loaded_at = 0.0
+        self._pending: Optional[asyncio.Future] = None
+
+    async def load(self) -> ExchangeRates:
+        rates = self._rates
+        if rates is not None:
+            age = self.clock() - self._loaded_at
+            if age < self.ttl:
+                if age >= self.ttl - self.refresh_ahead and self._pending is None:
+                    self._start_load()
+                return rates
+        pending = self._pending or self._start_load()
+        return await asyncio.shield(pending)
+
+    def invalidate(self) -> None:
+        """Drop the cached rates; the next call loads them again."""
+        self._rates = None
+
+    def _start_load(self) -> asyncio.Future:
+        pending = asyncio.ensure_future(self._load())
+        pending.add_done_callback(self._loaded)
+        self._pending = pending
+        return pending
+
+    async def _load(self) -> ExchangeRates:
+        started = self.clock()
+        rates = await self.source.load()
+        self._rates = rates
+        self._loaded_at = started
+        return rates
+
+    def _loaded(self, pending: asyncio.Future) -> None:
+        self._pending = None
+        if not pending.cancelled():
+            # retrieve the error so background failures are not reported
+            # as never retrieved; callers waiting on the load still get it
+            self.last_error = pending.exception()
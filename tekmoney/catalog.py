@@ -0,0 +1,194 @@
+import mmap
+import os
+import struct
+import traceback
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, Optional, Union
+
+from .codec import batch_buffers, decode_batch, little_endian_buffer
+from .currency import Currency
+from .currency_array import CurrencyArray
+from .currency_tax import CurrencyWithTax
+from .currency_tax_array import CurrencyWithTaxArray
+
+Batch = Union[CurrencyArray, CurrencyWithTaxArray]
+Price = Union[Currency, CurrencyWithTax]
+Path = Union[str, "os.PathLike[str]"]
+
+MAGIC = b"TMCATLOG"
+VERSION = 1
+
+# magic, version, row count; followed by the int64 SKU column and the
+# prices as a `tekmoney.codec` batch message
+_HEADER = struct.Struct("<8sB7xQ")
+
+
+def write_catalog(path: Path, skus: Iterable[int], prices: Batch) -> None:
+    """Write a catalog file of int SKUs and their prices.
+
+    prices is a CurrencyArray, or a CurrencyWithTaxArray for net and gross
+    prices, with one row per SKU. Rows are stored sorted by SKU.
+    """
+    skus = array("q", skus)
+    if not isinstance(prices, (CurrencyArray, CurrencyWithTaxArray)):
+        raise TypeError(f"catalog prices must be a batch, got {prices!r}")
+    if len(skus) != len(prices):
+        raise ValueError(f"got {len(skus)} SKUs for {len(prices)} prices")
+    if any(skus[i] >= skus[i + 1] for i in range(len(skus) - 1)):
+        order = sorted(range(len(skus)), key=skus.__getitem__)
+        skus = array("q", [skus[i] for i in order])
+        for i in range(len(skus) - 1):
+            if skus[i] == skus[i + 1]:
+                raise ValueError(f"duplicate SKU {skus[i]}")
+        prices = _reordered(prices, order)
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(skus)))
+        f.write(little_endian_buffer(skus))
+        f.writelines(batch_buffers(prices))
+
+
+def _reordered(prices: Batch, order: List[int]) -> Batch:
+    if isinstance(prices, CurrencyWithTaxArray):
+        return CurrencyWithTaxArray(
+            _reordered_column(prices.net, order), _reordered_column(prices.gross, order)
+        )
+    return _reordered_column(prices, order)
+
+
+def _reordered_column(prices: CurrencyArray, order: List[int]) -> CurrencyArray:
+    units = prices.units
+    return CurrencyArray(
+        array("q", [units[i] for i in order]), prices.currency, prices.precision
+    )
+
+
+class PriceCatalog:
+    """Read-only catalog of prices by SKU, backed by a memory-mapped file.
+
+    Opening a catalog reads only its header. SKU lookups bisect the sorted
+    SKU column in the file, and Currency or CurrencyWithTax objects are
+    created only for the rows asked for. `prices` and slices are batches
+    viewing the file without copying, so processes opening the same file
+    share its pages through the OS page cache.
+
+    Slices must be dropped before the catalog is closed.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self._mmap[: _HEADER.size]
+        if len(header) < _HEADER.size or header[:8] != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a tekmoney catalog")
+        _, version, count = _HEADER.unpack(header)
+        if version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"unsupported catalog version {version}")
+        end = _HEADER.size + 8 * count
+        if len(self._mmap) < end:
+            self._mmap.close()
+            raise ValueError(f"{path} is truncated")
+        try:
+            self._map_columns(end)
+            if len(self.prices) != count:
+                raise ValueError(
+                    f"{path} holds {len(self.prices)} prices for {count} SKUs"
+                )
+        except BaseException as error:
+            # frames of the traceback, like that of decode_batch, hold views
+            # of the file too
+            traceback.clear_frames(error.__traceback__)
+            self._release_views()
+            self._mmap.close()
+            raise
+
+    def _map_columns(self, end: int) -> None:
+        """View the SKU column, which ends at offset end, and the prices."""
+        view = memoryview(self._mmap)
+        self.skus = view[_HEADER.size : end].cast("q")
+        self.prices: Batch = decode_batch(view[end:])
+
+    def __reduce__(self):
+        # other processes map the file again instead of receiving its contents
+        return PriceCatalog, (self.path,)
+
+    def __enter__(self) -> "PriceCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file.
+
+        Raises BufferError while slices are still in use, and the catalog
+        stays open.
+        """
+        if self._mmap.closed:
+            return
+        end = _HEADER.size + 8 * len(self.skus)
+        self._release_views()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # only the views of the catalog were released, view the file again
+            self._map_columns(end)
+            raise
+
+    def _release_views(self) -> None:
+        columns: List[Union[array, memoryview]] = []
+        if hasattr(self, "skus"):
+            columns.append(self.skus)
+        prices = getattr(self, "prices", None)
+        if isinstance(prices, CurrencyWithTaxArray):
+            columns += [prices.net.units, prices.gross.units]
+        elif prices is not None:
+            columns.append(prices.units)
+        for column in columns:
+            if isinstance(column, memoryview):
+                column.release()
+
+    def __len__(self) -> int:
+        return len(self.skus)
+
+    @property
+    def currency(self) -> str:
+        """Return the currency-unit of the prices. Like 'USD'."""
+        return self.prices.currency
+
+    @property
+    def taxed(self) -> bool:
+        """Return whether the catalog holds net and gross prices."""
+        return isinstance(self.prices, CurrencyWithTaxArray)
+
+    def __getitem__(self, index):
+        """Return the price of a row, or the prices of a slice of rows as a batch."""
+        return self.prices[index]
+
+    def index(self, sku: int) -> Optional[int]:
+        """Return the row of sku, or None if the catalog does not have it."""
+        skus = self.skus
+        row = bisect_left(skus, sku)
+        if row < len(skus) and skus[row] == sku:
+            return row
+        return None
+
+    def get(self, sku: int, default: Optional[Price] = None) -> Optional[Price]:
+        """Return the price of sku, or default if the catalog does not have it."""
+        row = self.index(sku)
+        if row is None:
+            return default
+        return self.prices[row]
+
+    def price(self, sku: int) -> Price:
+        """Return the price of sku. Raises KeyError for unknown SKUs."""
+        row = self.index(sku)
+        if row is None:
+            raise KeyError(sku)
+        return self.prices[row]
+
+    def __contains__(self, sku: object) -> bool:
+        return isinstance(sku, int) and self.index(sku) is not None
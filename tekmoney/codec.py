@@ -0,0 +1,301 @@
+"""Compact binary encoding of money values and batches.
+
+Values are encoded as a message of fixed-width records, all of one kind:
+
+    header   "TM", version, kind, record count        <2sBBI
+    codes    count, then per code its length and ASCII bytes
+    records  code index, scale, then one int64 per amount   <Hb + q * n
+
+An amount is stored as the int amount * 10 ** scale. scale is the number
+of decimal places of the currency, or more if an amount of the record has
+more, so 10 USD is (0, 2, 1000) and decodes as 10.00 USD.
+
+Batches store their int64 columns as they are, after a 16 byte header and
+the currency code padded to 8 bytes:
+
+    header   "TM", version, kind, code length, precisions, count   <2sBBBbbxQ
+
+`decode_batch` returns arrays viewing the given buffer without copying.
+All integers are little-endian.
+"""
+
+import struct
+import sys
+from array import array
+from decimal import Decimal
+from operator import attrgetter
+from typing import Dict, Iterable, List, Tuple, Union
+
+from .currency import Currency, _new_currency
+from .currency_array import CurrencyArray
+from .currency_info import get_currency_precision, intern_currency
+from .currency_range import CurrencyRange
+from .currency_range_tax import CurrencyRangeTax
+from .currency_tax import CurrencyWithTax, _new_currency_with_tax
+from .currency_tax_array import CurrencyWithTaxArray
+
+Money = Union[Currency, CurrencyWithTax, CurrencyRange, CurrencyRangeTax]
+Batch = Union[CurrencyArray, CurrencyWithTaxArray]
+Buffer = Union[bytes, bytearray, memoryview]
+
+MAGIC = b"TM"
+VERSION = 1
+
+_KINDS = (Currency, CurrencyWithTax, CurrencyRange, CurrencyRangeTax)
+_KIND_IDS = {kind: number for number, kind in enumerate(_KINDS, 1)}
+_WIDTHS = {Currency: 1, CurrencyWithTax: 2, CurrencyRange: 2, CurrencyRangeTax: 4}
+_BATCH_KINDS = {CurrencyArray: 5, CurrencyWithTaxArray: 6}
+
+_HEADER = struct.Struct("<2sBBI")
+_BATCH_HEADER = struct.Struct("<2sBBBbbxQ")
+_RECORDS = {kind: struct.Struct("<Hb" + "q" * width) for kind, width in _WIDTHS.items()}
+_INT64 = 2**63
+
+
+def _kind_of(value: object) -> type:
+    for kind in _KINDS:
+        if isinstance(value, kind):
+            return kind
+    raise TypeError(f"cannot encode {type(value).__name__!r} values")
+
+
+_AMOUNTS = {
+    CurrencyWithTax: attrgetter("net.amount", "gross.amount"),
+    CurrencyRange: attrgetter("start.amount", "stop.amount"),
+    CurrencyRangeTax: attrgetter(
+        "start.net.amount", "start.gross.amount", "stop.net.amount", "stop.gross.amount"
+    ),
+}
+
+
+def _scaled(amounts: Tuple[Decimal, ...], precision: int) -> Tuple[int, List[int]]:
+    """Return the decimal places of amounts and the amounts as ints.
+
+    Amounts are stored with the places of their currency, or with more
+    when they need them.
+    """
+    units = []
+    try:
+        for amount in amounts:
+            scaled = amount.scaleb(precision)
+            unit = int(scaled)
+            if unit != scaled:
+                break
+            units.append(unit)
+        else:
+            scale = precision
+    except (ValueError, OverflowError):
+        raise ValueError(f"cannot encode {amounts}") from None
+    if len(units) != len(amounts):
+        scale = max(-amount.as_tuple().exponent for amount in amounts)  # type: ignore
+        if scale > 127:
+            raise ValueError(f"cannot encode amounts with {scale} decimal places")
+        units = [int(amount.scaleb(scale)) for amount in amounts]
+    for unit in units:
+        if not -_INT64 <= unit < _INT64:
+            raise ValueError(f"{unit} minor units do not fit in 64 bits")
+    return scale, units
+
+
+def encode_many(values: Iterable[Money]) -> bytes:
+    """Encode money values of one kind, e.g. only CurrencyWithTax."""
+    values = list(values)
+    kind = _kind_of(values[0]) if values else Currency
+    pack = _RECORDS[kind].pack
+    amounts_of = _AMOUNTS.get(kind)
+    # code -> (index in the code table, decimal places of the currency)
+    codes: Dict[str, Tuple[int, int]] = {}
+    records = []
+    for value in values:
+        if type(value) is not kind and _kind_of(value) is not kind:
+            raise TypeError(
+                f"cannot encode {type(value).__name__} with {kind.__name__} values"
+            )
+        code = value.currency
+        entry = codes.get(code)
+        if entry is None:
+            entry = codes[code] = len(codes), get_currency_precision(code)
+        if amounts_of is None:
+            amounts = (value.amount,)  # type: ignore
+        else:
+            amounts = amounts_of(value)
+        scale, units = _scaled(amounts, entry[1])
+        records.append(pack(entry[0], scale, *units))
+    if len(codes) > 255:
+        raise ValueError(f"cannot encode more than 255 currencies, got {len(codes)}")
+    table = [bytes([len(codes)])]
+    for code in codes:
+        raw = code.encode("ascii")
+        table.append(bytes([len(raw)]) + raw)
+    header = _HEADER.pack(MAGIC, VERSION, _KIND_IDS[kind], len(records))
+    return b"".join([header] + table + records)
+
+
+# (kind, code) -> header and code table of a message holding one value
+_prefixes: Dict[Tuple[type, str], bytes] = {}
+
+
+def encode(value: Money) -> bytes:
+    """Encode a Currency, CurrencyWithTax, CurrencyRange or CurrencyRangeTax.
+
+    Gives the same bytes as `encode_many([value])`.
+    """
+    kind = _kind_of(value)
+    code = value.currency
+    prefix = _prefixes.get((kind, code))
+    if prefix is None:
+        raw = code.encode("ascii")
+        prefix = _HEADER.pack(MAGIC, VERSION, _KIND_IDS[kind], 1)
+        prefix += bytes([1, len(raw)]) + raw
+        _prefixes[kind, code] = prefix
+    amounts_of = _AMOUNTS.get(kind)
+    amounts = (value.amount,) if amounts_of is None else amounts_of(value)  # type: ignore
+    scale, units = _scaled(amounts, get_currency_precision(code))
+    return prefix + _RECORDS[kind].pack(0, scale, *units)
+
+
+def _header(data: Buffer, layout: struct.Struct) -> tuple:
+    if len(data) < layout.size:
+        raise ValueError("truncated tekmoney message")
+    fields = layout.unpack_from(data)
+    if fields[0] != MAGIC:
+        raise ValueError("not a tekmoney message")
+    if fields[1] != VERSION:
+        raise ValueError(f"unsupported tekmoney message version {fields[1]}")
+    return fields
+
+
+def decode_many(data: Buffer) -> List[Money]:
+    """Decode the values encoded by `encode_many`."""
+    _, _, kind_id, count = _header(data, _HEADER)
+    if not 1 <= kind_id <= len(_KINDS):
+        raise ValueError(f"message of kind {kind_id} holds no money values")
+    kind = _KINDS[kind_id - 1]
+    data = memoryview(data)
+    offset = _HEADER.size
+    codes = []
+    try:
+        for _ in range(data[offset]):
+            length = data[offset + 1]
+            raw = bytes(data[offset + 2 : offset + 2 + length])
+            codes.append(intern_currency(raw.decode("ascii")))
+            offset += 1 + length
+        offset += 1
+    except IndexError:
+        raise ValueError("truncated tekmoney message") from None
+    record = _RECORDS[kind]
+    if len(data) != offset + count * record.size:
+        raise ValueError("tekmoney message size does not match its record count")
+    records = record.iter_unpack(data[offset:])
+    try:
+        if kind is Currency:
+            # plain prices are the common case, keep their loop minimal
+            return [
+                _new_currency(Decimal(unit).scaleb(-scale), codes[index])
+                for index, scale, unit in records
+            ]
+        return [
+            _build(kind, codes[index], scale, units) for index, scale, *units in records
+        ]
+    except IndexError:
+        raise ValueError("unknown currency index in tekmoney message") from None
+
+
+def _build(kind: type, code: str, scale: int, units: List[int]) -> Money:
+    amounts = [_new_currency(Decimal(unit).scaleb(-scale), code) for unit in units]
+    if kind is CurrencyWithTax:
+        return _new_currency_with_tax(*amounts)
+    if kind is CurrencyRange:
+        return CurrencyRange(*amounts)
+    return CurrencyRangeTax(
+        _new_currency_with_tax(amounts[0], amounts[1]),
+        _new_currency_with_tax(amounts[2], amounts[3]),
+    )
+
+
+def decode(data: Buffer) -> Money:
+    """Decode the value encoded by `encode`."""
+    values = decode_many(data)
+    if len(values) != 1:
+        raise ValueError(f"expected one value, the message holds {len(values)}")
+    return values[0]
+
+
+def little_endian_buffer(units: Union[array, memoryview]) -> memoryview:
+    """Return int64 units as little-endian bytes, without copying if possible."""
+    view = memoryview(units)
+    if sys.byteorder == "little" and view.c_contiguous:
+        return view.cast("B")
+    copy = array("q", units)
+    if sys.byteorder != "little":
+        copy.byteswap()
+    return memoryview(copy).cast("B")
+
+
+def batch_buffers(batch: Batch) -> List[Union[bytes, memoryview]]:
+    """Return the encoded batch as a list of buffers.
+
+    The int64 columns are views of the batch, not copies, so the list can
+    be written out with `b"".join`, `socket.sendmsg` or `file.writelines`.
+    """
+    kind_id = _BATCH_KINDS.get(type(batch))
+    if kind_id is None:
+        raise TypeError(f"cannot encode {type(batch).__name__!r} as a batch")
+    if isinstance(batch, CurrencyWithTaxArray):
+        columns = [batch.net, batch.gross]
+    else:
+        columns = [batch]  # type: ignore
+    code = batch.currency.encode("ascii")
+    header = _BATCH_HEADER.pack(
+        MAGIC,
+        VERSION,
+        kind_id,
+        len(code),
+        columns[0].precision,
+        columns[-1].precision,
+        len(batch),
+    )
+    padding = b"\0" * (-len(code) % 8)
+    buffers: List[Union[bytes, memoryview]] = [header, code + padding]
+    buffers.extend(little_endian_buffer(column.units) for column in columns)
+    return buffers
+
+
+def encode_batch(batch: Batch) -> bytes:
+    """Encode a CurrencyArray or CurrencyWithTaxArray."""
+    return b"".join(batch_buffers(batch))
+
+
+def _column(data: memoryview, offset: int, count: int) -> Union[memoryview, array]:
+    column = data[offset : offset + 8 * count].cast("q")
+    if sys.byteorder == "little":
+        return column
+    units = array("q", column)
+    units.byteswap()
+    return units
+
+
+def decode_batch(data: Buffer) -> Batch:
+    """Decode a batch encoded by `encode_batch`.
+
+    The arrays of the result are views of data, which must not change while
+    they are in use.
+    """
+    _, _, kind_id, length, precision, gross_precision, count = _header(
+        data, _BATCH_HEADER
+    )
+    if kind_id not in (5, 6):
+        raise ValueError(f"message of kind {kind_id} holds no batch")
+    data = memoryview(data).cast("B")
+    offset = _BATCH_HEADER.size
+    code = intern_currency(bytes(data[offset : offset + length]).decode("ascii"))
+    offset += length + (-length % 8)
+    columns = 2 if kind_id == 6 else 1
+    if len(data) != offset + 8 * count * columns:
+        raise ValueError("tekmoney message size does not match its row count")
+    net = CurrencyArray(_column(data, offset, count), code, precision)
+    if kind_id == 5:
+        return net
+    offset += 8 * count
+    gross = CurrencyArray(_column(data, offset, count), code, gross_precision)
+    return CurrencyWithTaxArray(net, gross)
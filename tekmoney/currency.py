@@ -1,26 +1,53 @@
 from typing import Union, overload
 from decimal import Decimal, ROUND_HALF_UP
-from babel.numbers import get_currency_precision
 import warnings
 
+from . import instrumentation
+from .currency_info import get_currency_info, intern_currency
+
 Dint = Union[Decimal, int]
 
 
 class Currency:
     """Handles money per specified currency"""
 
-    __slots__ = ("amount", "currency")
+    __slots__ = ("amount", "currency", "_hash")
+    amount: Decimal
+    currency: str
+    _hash: int
 
     def __init__(self, amount: Dint, currency: str) -> None:
-        if isinstance(amount, float):
-            warnings.warn(
-                SyntaxWarning(  # pragma: no cover
-                    "float value detected. Please use Decimal instead."
-                ),
-                stacklevel=2,
-            )
-        self.amount = Decimal(amount)
-        self.currency = currency.upper() or "USD"
+        if type(amount) is not Decimal:
+            if isinstance(amount, float):
+                warnings.warn(
+                    SyntaxWarning(  # pragma: no cover
+                        "float value detected. Please use Decimal instead."
+                    ),
+                    stacklevel=2,
+                )
+            amount = Decimal(amount)
+        object.__setattr__(self, "amount", amount)
+        object.__setattr__(self, "currency", intern_currency(currency))
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_construction(type(self).__name__)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        if type(self) is not Currency:
+            return type(self), (self.amount, self.currency)
+        return _restore_currency, (str(self.amount), self.currency)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __str__(self) -> str:
         return f"{str(self.amount)} {self.currency}"
@@ -45,13 +72,16 @@ class Currency:
             amount = self.amount / other
         except TypeError:
             return NotImplemented
-        return Currency(amount, self.currency)
+        if type(amount) is not Decimal:
+            # other took over the operation, let the constructor check the result
+            return Currency(amount, self.currency)
+        return _new_currency(amount, self.currency)
 
     def __add__(self, other: "Currency") -> "Currency":
         if isinstance(other, Currency):
             if self.currency != other.currency:
                 raise ValueError(f"cannot add {self.currency} to {other.currency}")
-            return Currency(self.amount + other.amount, self.currency)
+            return _new_currency(self.amount + other.amount, self.currency)
         return NotImplemented
 
     def __sub__(self, other: "Currency") -> "Currency":
@@ -62,7 +92,7 @@ class Currency:
                     f"cannot subtract {self.currency} from {other.currency}"
                 )
             amount = self.amount - other.amount
-            return Currency(amount, self.currency)
+            return _new_currency(amount, self.currency)
         return NotImplemented
 
     def __mul__(self, other: Dint) -> "Currency":
@@ -70,7 +100,10 @@ class Currency:
             amount = self.amount * other
         except TypeError:
             return NotImplemented
-        return Currency(amount, self.currency)
+        if type(amount) is not Decimal:
+            # other took over the operation, let the constructor check the result
+            return Currency(amount, self.currency)
+        return _new_currency(amount, self.currency)
 
     def __rmul__(self, other: Dint) -> "Currency":
         return self * other
@@ -89,6 +122,14 @@ class Currency:
             return self.amount == other.amount and self.currency == other.currency
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.amount, self.currency))
+            object.__setattr__(self, "_hash", value)
+            return value
+
     def __gt__(self, other: "Currency") -> bool:
         if isinstance(other, Currency):
             if self.currency != other.currency:
@@ -120,9 +161,33 @@ class Currency:
         results in (10.00, 'USD')
         """
         if exp is None:
-            exp = Decimal("0.1") ** get_currency_precision(self.currency)
+            exp = get_currency_info(self.currency).exponent
         else:
             exp = Decimal(exp)
         if rounding is None:
             rounding = ROUND_HALF_UP
-        return Currency(self.amount.quantize(exp=exp, rounding=rounding), self.currency)
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_quantize(self.currency, rounding)
+        amount = self.amount.quantize(exp=exp, rounding=rounding)
+        return _new_currency(amount, self.currency)
+
+
+def _restore_currency(amount: str, currency: str) -> Currency:
+    """Unpickle a Currency pickled as its amount string and code."""
+    return _new_currency(Decimal(amount), intern_currency(currency))
+
+
+def _new_currency(amount: Decimal, currency: str) -> Currency:
+    """Create a Currency without validating its arguments.
+
+    For results computed inside tekmoney only: amount must be a Decimal and
+    currency a code returned by intern_currency, e.g. that of an operand.
+    """
+    result = Currency.__new__(Currency)
+    object.__setattr__(result, "amount", amount)
+    object.__setattr__(result, "currency", currency)
+    recorder = instrumentation.active
+    if recorder is not None:
+        recorder.count_construction("Currency")
+    return result
@@ -0,0 +1,310 @@
+import operator
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Union
+
+from . import instrumentation
+from .currency import Currency, _new_currency
+from .currency_info import get_currency_precision, intern_currency
+from .minor_units import (
+    as_ratio,
+    divide_rounded,
+    from_minor_units,
+    required_precision,
+    to_minor_units,
+)
+
+try:
+    from pickle import PickleBuffer
+except ImportError:  # Python < 3.8
+    PickleBuffer = None  # type: ignore
+
+Dint = Union[Decimal, int]
+Units = Union[array, memoryview, Iterable[int]]
+
+
+def _as_units(units: Units) -> Union[array, memoryview]:
+    """Use int64 buffers as they are, copy anything else into one."""
+    if isinstance(units, array) and units.typecode == "q":
+        return units
+    if isinstance(units, memoryview) and units.format == "q":
+        return units
+    return array("q", units)
+
+
+class CurrencyArray:
+    """Handles many amounts of one currency stored as int64 minor units.
+
+    Sums and differences are exact. Products and quotients with fractional
+    factors are rounded to the array precision with ROUND_HALF_UP, which is
+    what `(currency * factor).quantize()` gives for a single `Currency`.
+    """
+
+    __slots__ = ("units", "currency", "precision")
+
+    def __init__(
+        self, units: Units, currency: str, precision: Optional[int] = None
+    ) -> None:
+        self.units = _as_units(units)
+        self.currency = intern_currency(currency)
+        if precision is None:
+            precision = get_currency_precision(self.currency)
+        self.precision = precision
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_construction(type(self).__name__)
+
+    @classmethod
+    def from_currencies(
+        cls,
+        values: Iterable[Currency],
+        currency: Optional[str] = None,
+        precision: Optional[int] = None,
+    ) -> "CurrencyArray":
+        """Build an array from Currency objects of a single currency.
+
+        Raises ValueError if an amount needs more decimal places than precision.
+        """
+        values = list(values)
+        for value in values:
+            if not isinstance(value, Currency):
+                raise TypeError(f"CurrencyArray requires Currency, got {value!r}")
+        if currency is None:
+            if not values:
+                raise ValueError("currency is required to build an empty array")
+            currency = values[0].currency
+        currency = intern_currency(currency)
+        for value in values:
+            if value.currency != currency:
+                raise ValueError(
+                    f"Different currencies not allowed: {currency} and {value.currency}"
+                )
+        if precision is None:
+            precision = get_currency_precision(currency)
+        units = array("q", [to_minor_units(v.amount, precision) for v in values])
+        return cls(units, currency, precision)
+
+    def __reduce_ex__(self, protocol):
+        units = self.units
+        if protocol >= 5 and PickleBuffer is not None and memoryview(units).c_contiguous:
+            # pickle protocol 5 can hand the column to the caller's
+            # buffer_callback instead of copying it into the pickle
+            return _restore_array, (PickleBuffer(units), self.currency, self.precision)
+        if not isinstance(units, array):
+            units = array("q", units)
+        return CurrencyArray, (units, self.currency, self.precision)
+
+    def to_currencies(self) -> List[Currency]:
+        """Return the amounts as a list of Currency objects."""
+        return list(self)
+
+    @property
+    def amounts(self) -> List[Decimal]:
+        """Return the amounts as Decimals."""
+        precision = self.precision
+        return [from_minor_units(u, precision) for u in self.units]
+
+    def __str__(self) -> str:
+        amounts = [str(amount) for amount in self.amounts[:6]]
+        if len(self) > 6:
+            amounts.append("...")
+        return f"CurrencyArray([{', '.join(amounts)}] {self.currency})"
+
+    def __len__(self) -> int:
+        return len(self.units)
+
+    def __iter__(self) -> Iterator[Currency]:
+        currency = self.currency
+        for amount in self.amounts:
+            yield _new_currency(amount, currency)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CurrencyArray(self.units[index], self.currency, self.precision)
+        return _new_currency(
+            from_minor_units(self.units[index], self.precision), self.currency
+        )
+
+    def rescale(self, precision: int) -> "CurrencyArray":
+        """Return the array with more decimal places. Values are unchanged."""
+        if precision < self.precision:
+            raise ValueError(
+                f"cannot rescale from {self.precision} to {precision} decimal places"
+                " without rounding, use quantize"
+            )
+        if precision == self.precision:
+            return self
+        factor = 10 ** (precision - self.precision)
+        units = array("q", [u * factor for u in self.units])
+        return CurrencyArray(units, self.currency, precision)
+
+    def _aligned(self, other, operation: str):
+        """Return self and other as unit sequences sharing one precision."""
+        if isinstance(other, CurrencyArray):
+            if self.currency != other.currency:
+                raise ValueError(
+                    f"cannot {operation} {self.currency} and {other.currency}"
+                )
+            if len(self) != len(other):
+                raise ValueError(
+                    f"cannot {operation} arrays of length {len(self)} and {len(other)}"
+                )
+            precision = max(self.precision, other.precision)
+            return (
+                self.rescale(precision).units,
+                other.rescale(precision).units,
+                precision,
+            )
+        if isinstance(other, Currency):
+            if self.currency != other.currency:
+                raise ValueError(
+                    f"cannot {operation} {self.currency} and {other.currency}"
+                )
+            precision = max(self.precision, required_precision(other.amount))
+            units = to_minor_units(other.amount, precision)
+            return self.rescale(precision).units, [units] * len(self), precision
+        return None
+
+    def __add__(self, other: Union["CurrencyArray", Currency]) -> "CurrencyArray":
+        aligned = self._aligned(other, "add")
+        if aligned is None:
+            return NotImplemented
+        left, right, precision = aligned
+        units = array("q", [a + b for a, b in zip(left, right)])
+        return CurrencyArray(units, self.currency, precision)
+
+    def __radd__(self, other: Currency) -> "CurrencyArray":
+        return self + other
+
+    def __sub__(self, other: Union["CurrencyArray", Currency]) -> "CurrencyArray":
+        """negative currency situation needs to be handled externally"""
+        aligned = self._aligned(other, "subtract")
+        if aligned is None:
+            return NotImplemented
+        left, right, precision = aligned
+        units = array("q", [a - b for a, b in zip(left, right)])
+        return CurrencyArray(units, self.currency, precision)
+
+    def __rsub__(self, other: Currency) -> "CurrencyArray":
+        aligned = self._aligned(other, "subtract")
+        if aligned is None:
+            return NotImplemented
+        left, right, precision = aligned
+        units = array("q", [b - a for a, b in zip(left, right)])
+        return CurrencyArray(units, self.currency, precision)
+
+    def _factors(self, other) -> Optional[Sequence[Dint]]:
+        """Return one factor per row for a scalar or a per-row sequence."""
+        if isinstance(other, (int, Decimal)) and not isinstance(other, bool):
+            return [other] * len(self)
+        if isinstance(other, (str, bytes, float, Currency, CurrencyArray)):
+            return None
+        try:
+            factors = list(other)
+        except TypeError:
+            return None
+        if len(factors) != len(self):
+            raise ValueError(f"expected {len(self)} factors, got {len(factors)}")
+        return factors
+
+    def _scaled(self, factors: Sequence[Dint], divide: bool, rounding) -> array:
+        units = []
+        for unit, factor in zip(self.units, factors):
+            if not isinstance(factor, (int, Decimal)):
+                raise TypeError(f"unsupported factor {factor!r}")
+            numerator, denominator = as_ratio(factor)
+            if divide:
+                numerator, denominator = denominator, numerator
+            units.append(divide_rounded(unit * numerator, denominator, rounding))
+        return array("q", units)
+
+    def __mul__(self, other: Union[Dint, Sequence[Dint]]) -> "CurrencyArray":
+        factors = self._factors(other)
+        if factors is None:
+            return NotImplemented
+        units = self._scaled(factors, False, ROUND_HALF_UP)
+        return CurrencyArray(units, self.currency, self.precision)
+
+    def __rmul__(self, other: Union[Dint, Sequence[Dint]]) -> "CurrencyArray":
+        return self * other
+
+    def __truediv__(self, other):
+        if isinstance(other, (CurrencyArray, Currency)):
+            aligned = self._aligned(other, "divide")
+            left, right, _ = aligned
+            return [Decimal(a) / Decimal(b) for a, b in zip(left, right)]
+        factors = self._factors(other)
+        if factors is None:
+            return NotImplemented
+        units = self._scaled(factors, True, ROUND_HALF_UP)
+        return CurrencyArray(units, self.currency, self.precision)
+
+    def _compare(self, other, operation: Callable[[int, int], bool]):
+        aligned = self._aligned(other, "compare")
+        if aligned is None:
+            return None
+        left, right, _ = aligned
+        return [operation(a, b) for a, b in zip(left, right)]
+
+    def __lt__(self, other: Union["CurrencyArray", Currency]) -> List[bool]:
+        result = self._compare(other, operator.lt)
+        return NotImplemented if result is None else result
+
+    def __le__(self, other: Union["CurrencyArray", Currency]) -> List[bool]:
+        result = self._compare(other, operator.le)
+        return NotImplemented if result is None else result
+
+    def __gt__(self, other: Union["CurrencyArray", Currency]) -> List[bool]:
+        result = self._compare(other, operator.gt)
+        return NotImplemented if result is None else result
+
+    def __ge__(self, other: Union["CurrencyArray", Currency]) -> List[bool]:
+        result = self._compare(other, operator.ge)
+        return NotImplemented if result is None else result
+
+    def __eq__(self, other: object) -> bool:
+        """Arrays are equal when they hold the same amounts in the same currency.
+
+        Ordering operators compare element-wise and return a list of bools.
+        """
+        if isinstance(other, CurrencyArray):
+            if self.currency != other.currency or len(self) != len(other):
+                return False
+            left, right, _ = self._aligned(other, "compare")
+            return all(a == b for a, b in zip(left, right))
+        return False
+
+    __hash__ = None  # type: ignore
+
+    def quantize(self, exp=None, rounding=None) -> "CurrencyArray":
+        """Return the array rounded to a fixed exponent.
+
+        Arguments have the same meaning as in `Currency.quantize`. The result
+        has as many decimal places as exp.
+        """
+        if exp is None:
+            precision = get_currency_precision(self.currency)
+        else:
+            exponent = Decimal(exp).as_tuple().exponent
+            if not isinstance(exponent, int):
+                raise ValueError(f"invalid exponent {exp!r}")
+            precision = -exponent
+        if rounding is None:
+            rounding = ROUND_HALF_UP
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_quantize(self.currency, rounding)
+        if precision >= self.precision:
+            return self.rescale(precision)
+        factor = 10 ** (self.precision - precision)
+        units = array("q", [divide_rounded(u, factor, rounding) for u in self.units])
+        return CurrencyArray(units, self.currency, precision)
+
+
+def _restore_array(buffer, currency: str, precision: int) -> CurrencyArray:
+    """Unpickle a CurrencyArray from the buffer of its int64 column.
+
+    The array views the buffer, which holds the units in the byte order of
+    the pickling machine.
+    """
+    return CurrencyArray(memoryview(buffer).cast("B").cast("q"), currency, precision)
@@ -0,0 +1,116 @@
+import os
+import sys
+from decimal import Decimal
+from typing import Dict
+
+from . import instrumentation
+from .iso4217 import DEFAULT_PRECISION, ISO_4217_PRECISIONS
+
+
+class CurrencyInfo:
+    """Quantization metadata of a currency, computed once per currency code"""
+
+    __slots__ = ("code", "precision", "exponent", "factor")
+
+    def __init__(self, code: str, precision: int) -> None:
+        if not isinstance(precision, int) or precision < 0:
+            raise ValueError(f"precision must be a non-negative int, got {precision!r}")
+        self.code = code.upper()
+        self.precision = precision
+        self.exponent = Decimal(1).scaleb(-precision)
+        self.factor = 10**precision
+
+    def __str__(self) -> str:
+        return f"CurrencyInfo({self.code}, precision={self.precision})"
+
+
+_registered: Dict[str, CurrencyInfo] = {}
+_cache: Dict[str, CurrencyInfo] = {}
+_use_babel = os.environ.get("TEKMONEY_USE_BABEL", "1") != "0"
+_codes: Dict[str, str] = {}
+
+
+def use_babel(enabled: bool) -> None:
+    """Choose where precisions of unregistered currencies come from.
+
+    Babel (the default) follows CLDR and is imported on the first lookup.
+    Without it the built-in ISO 4217 table is used, which can also be chosen
+    by setting the TEKMONEY_USE_BABEL environment variable to 0.
+    """
+    global _use_babel
+    _use_babel = enabled
+    _cache.clear()
+
+
+def _lookup_precision(code: str) -> int:
+    if _use_babel:
+        try:
+            from babel.numbers import get_currency_precision as babel_precision
+        except ImportError:  # pragma: no cover
+            pass
+        else:
+            return babel_precision(code)
+    return ISO_4217_PRECISIONS.get(code, DEFAULT_PRECISION)
+
+
+def register_currency(code: str, precision: int) -> CurrencyInfo:
+    """Register a currency, or override the precision of a known one.
+
+    Use it for codes Babel does not know, like loyalty points or crypto
+    currencies with 8 decimal places.
+    """
+    info = CurrencyInfo(code, precision)
+    _registered[info.code] = info
+    _cache[info.code] = info
+    return info
+
+
+def intern_currency(code: str) -> str:
+    """Return the shared upper-case string for a currency code.
+
+    An empty code means USD, like in Currency. Equal codes give the same
+    object, so money objects built from them compare codes by identity.
+    Only known currencies are interned; other codes are returned upper-cased,
+    so codes from untrusted input do not stay in memory.
+    """
+    try:
+        return _codes[code]
+    except KeyError:
+        pass
+    canonical = code.upper() or "USD"
+    if not is_known_currency(canonical):
+        return canonical
+    canonical = sys.intern(canonical)
+    _codes[code] = _codes[canonical] = canonical
+    return canonical
+
+
+def is_known_currency(code: str) -> bool:
+    """Return whether code is a registered or an active ISO 4217 currency."""
+    code = code.upper()
+    return code in _registered or code in ISO_4217_PRECISIONS
+
+
+def get_currency_info(code: str) -> CurrencyInfo:
+    """Return the metadata of a currency.
+
+    Codes that were not registered are looked up once and cached.
+    """
+    try:
+        return _cache[code]
+    except KeyError:
+        pass
+    code = code.upper()
+    info = _registered.get(code)
+    if info is None:
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_precision_miss(code)
+        info = CurrencyInfo(code, _lookup_precision(code))
+    _cache[code] = info
+    return info
+
+
+def get_currency_precision(code: str) -> int:
+    """Return the number of decimal places of a currency."""
+    return get_currency_info(code).precision
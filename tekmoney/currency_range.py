@@ -1,5 +1,6 @@
 from typing import Union
-from .currency import Currency
+from . import instrumentation
+from .currency import Currency, _restore_currency
 
 Addable = Union["CurrencyRange", Currency]
 
@@ -7,7 +8,10 @@ Addable = Union["CurrencyRange", Currency]
 class CurrencyRange:
     """Taxable currency range"""
 
-    __slots__ = ("start", "stop")
+    __slots__ = ("start", "stop", "_hash")
+    start: Currency
+    stop: Currency
+    _hash: int
 
     def __init__(self, start: Currency, stop: Currency) -> None:
         if not isinstance(start, Currency) and not isinstance(stop, Currency):
@@ -22,8 +26,34 @@ class CurrencyRange:
             raise ValueError(
                 f"Cannot create a range from {start.amount} to {stop.amount}"
             )
-        self.start = start
-        self.stop = stop
+        object.__setattr__(self, "start", start)
+        object.__setattr__(self, "stop", stop)
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_construction(type(self).__name__)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        if (
+            type(self) is not CurrencyRange
+            or type(self.start) is not Currency
+            or type(self.stop) is not Currency
+        ):
+            # subclasses and their parts pickle with their own types
+            return type(self), (self.start, self.stop)
+        amounts = (str(self.start.amount), str(self.stop.amount))
+        return _restore_currency_range, amounts + (self.currency,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __str__(self) -> str:
         return f"CurrencyRange({self.start} {self.stop})"
@@ -76,6 +106,14 @@ class CurrencyRange:
             return self.start == other.start and self.stop == other.stop
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.start, self.stop))
+            object.__setattr__(self, "_hash", value)
+            return value
+
     def __contains__(self, item: Currency) -> bool:
         if not isinstance(item, Currency):
             raise TypeError(
@@ -100,3 +138,10 @@ class CurrencyRange:
         if stop is None:
             stop = self.stop
         return CurrencyRange(start=start, stop=stop)
+
+
+def _restore_currency_range(start: str, stop: str, currency: str) -> CurrencyRange:
+    """Unpickle a CurrencyRange pickled as two amount strings and one code."""
+    return CurrencyRange(
+        _restore_currency(start, currency), _restore_currency(stop, currency)
+    )
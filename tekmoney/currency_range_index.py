@@ -0,0 +1,212 @@
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+from .currency import Currency
+from .currency_array import CurrencyArray
+from .currency_range import CurrencyRange
+from .currency_range_tax import CurrencyRangeTax
+from .currency_tax import CurrencyWithTax
+
+AnyRange = Union[CurrencyRange, CurrencyRangeTax]
+Price = Union[Currency, CurrencyWithTax]
+Bounds = Tuple[Decimal, Decimal, int]
+
+
+class _Node:
+    """Node of a centered interval tree over (start, stop, id) bounds"""
+
+    __slots__ = ("center", "starts", "by_start", "stops", "by_stop", "left", "right")
+
+    def __init__(self, bounds: List[Bounds]) -> None:
+        endpoints = sorted(
+            amount for start, stop, _ in bounds for amount in (start, stop)
+        )
+        center = endpoints[len(endpoints) // 2]
+        here, left, right = [], [], []
+        for item in bounds:
+            if item[1] < center:
+                left.append(item)
+            elif item[0] > center:
+                right.append(item)
+            else:
+                here.append(item)
+        # every range here contains center, so containment of a point below
+        # center only depends on start and above center only on stop
+        self.center = center
+        self.by_start = sorted(here, key=lambda item: item[0])
+        self.starts = [item[0] for item in self.by_start]
+        self.by_stop = sorted(here, key=lambda item: item[1])
+        self.stops = [item[1] for item in self.by_stop]
+        self.left = _Node(left) if left else None
+        self.right = _Node(right) if right else None
+
+
+class CurrencyRangeIndex:
+    """Answers which of many ranges contain, overlap or are nearest to a price.
+
+    Built once from CurrencyRange or CurrencyRangeTax objects of a single
+    currency. Queries take logarithmic time plus the number of results.
+    CurrencyRangeTax bounds are compared by gross amount, like
+    CurrencyWithTax comparisons. Results are in the order ranges were given.
+    """
+
+    __slots__ = ("ranges", "kind", "currency", "_root", "_by_start", "_by_stop")
+
+    def __init__(self, ranges: Iterable[AnyRange]) -> None:
+        self.ranges: List[AnyRange] = list(ranges)
+        self.kind: Optional[type] = None
+        self.currency: Optional[str] = None
+        bounds = []
+        for index, price_range in enumerate(self.ranges):
+            if not isinstance(price_range, (CurrencyRange, CurrencyRangeTax)):
+                raise TypeError(
+                    f"CurrencyRangeIndex requires currency ranges, got {price_range!r}"
+                )
+            if self.kind is None:
+                self.kind = type(price_range)
+                self.currency = price_range.currency
+            elif not isinstance(price_range, self.kind):
+                raise TypeError(
+                    "Cannot index CurrencyRange and CurrencyRangeTax together"
+                )
+            elif price_range.currency != self.currency:
+                raise ValueError(
+                    f"Cannot index ranges in {self.currency} and {price_range.currency}"
+                )
+            bounds.append(self._bounds(price_range) + (index,))
+        self._root = _Node(bounds) if bounds else None
+        self._by_start = sorted((start, index) for start, _, index in bounds)
+        self._by_stop = sorted((stop, index) for _, stop, index in bounds)
+
+    def __len__(self) -> int:
+        return len(self.ranges)
+
+    def __iter__(self) -> Iterator[AnyRange]:
+        return iter(self.ranges)
+
+    @staticmethod
+    def _bounds(price_range: AnyRange) -> Tuple[Decimal, Decimal]:
+        if isinstance(price_range, CurrencyRangeTax):
+            return price_range.start.gross.amount, price_range.stop.gross.amount
+        return price_range.start.amount, price_range.stop.amount
+
+    def _amount(self, price: Price) -> Decimal:
+        """Return the amount of price that is compared with range bounds."""
+        if self.kind is CurrencyRangeTax:
+            if not isinstance(price, CurrencyWithTax):
+                raise TypeError(
+                    f"CurrencyRangeTax index requires CurrencyWithTax, not {type(price)}"
+                )
+            amount = price.gross.amount
+        else:
+            if not isinstance(price, Currency):
+                raise TypeError(
+                    f"CurrencyRange index requires Currency, not {type(price)}"
+                )
+            amount = price.amount
+        if self.currency is not None and price.currency != self.currency:
+            raise ValueError(
+                f"cannot compare {price.currency} with ranges in {self.currency}"
+            )
+        return amount
+
+    def _containing(self, amount: Decimal) -> List[int]:
+        found: List[int] = []
+        node = self._root
+        while node is not None:
+            if amount < node.center:
+                end = bisect_right(node.starts, amount)
+                found.extend(item[2] for item in node.by_start[:end])
+                node = node.left
+            elif amount > node.center:
+                begin = bisect_left(node.stops, amount)
+                found.extend(item[2] for item in node.by_stop[begin:])
+                node = node.right
+            else:
+                found.extend(item[2] for item in node.by_start)
+                break
+        found.sort()
+        return found
+
+    def find(self, price: Price) -> List[AnyRange]:
+        """Return the ranges that contain price."""
+        ranges = self.ranges
+        return [ranges[index] for index in self._containing(self._amount(price))]
+
+    def find_many(
+        self, prices: Union[Iterable[Price], CurrencyArray]
+    ) -> List[List[AnyRange]]:
+        """Return the containing ranges for each price.
+
+        prices may be a CurrencyArray, which is queried without creating a
+        Currency per row.
+        """
+        ranges = self.ranges
+        if isinstance(prices, CurrencyArray):
+            if self.kind is CurrencyRangeTax:
+                raise TypeError("CurrencyRangeTax index requires CurrencyWithTax")
+            if self.currency is not None and prices.currency != self.currency:
+                raise ValueError(
+                    f"cannot compare {prices.currency} with ranges in {self.currency}"
+                )
+            amounts = prices.amounts
+        else:
+            amounts = [self._amount(price) for price in prices]
+        return [
+            [ranges[index] for index in self._containing(amount)] for amount in amounts
+        ]
+
+    def overlapping(self, price_range: AnyRange) -> List[AnyRange]:
+        """Return the ranges that share at least one price with price_range."""
+        if not isinstance(price_range, (CurrencyRange, CurrencyRangeTax)):
+            raise TypeError(f"expected a currency range, got {price_range!r}")
+        if self.currency is not None and price_range.currency != self.currency:
+            raise ValueError(
+                f"cannot compare {price_range.currency} with ranges in {self.currency}"
+            )
+        low, high = self._bounds(price_range)
+        found: List[int] = []
+        pending = [self._root]
+        while pending:
+            node = pending.pop()
+            if node is None:
+                continue
+            if high < node.center:
+                end = bisect_right(node.starts, high)
+                found.extend(item[2] for item in node.by_start[:end])
+                pending.append(node.left)
+            elif low > node.center:
+                begin = bisect_left(node.stops, low)
+                found.extend(item[2] for item in node.by_stop[begin:])
+                pending.append(node.right)
+            else:
+                found.extend(item[2] for item in node.by_start)
+                pending.append(node.left)
+                pending.append(node.right)
+        found.sort()
+        return [self.ranges[index] for index in found]
+
+    def nearest(self, price: Price) -> Optional[AnyRange]:
+        """Return the range closest to price, or None for an empty index.
+
+        A range containing price is at distance zero. Ties go to the range
+        given first.
+        """
+        amount = self._amount(price)
+        containing = self._containing(amount)
+        if containing:
+            return self.ranges[containing[0]]
+        candidates = []
+        below = bisect_left(self._by_stop, (amount,))
+        if below:
+            stop = self._by_stop[below - 1][0]
+            first = bisect_left(self._by_stop, (stop,))
+            candidates.append((amount - stop, self._by_stop[first][1]))
+        above = bisect_right(self._by_start, (amount, len(self.ranges)))
+        if above < len(self._by_start):
+            start, index = self._by_start[above]
+            candidates.append((start - amount, index))
+        if not candidates:
+            return None
+        return self.ranges[min(candidates)[1]]
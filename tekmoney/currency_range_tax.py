@@ -1,7 +1,8 @@
 from typing import Union
+from . import instrumentation
 from .currency import Currency
 from .currency_range import CurrencyRange
-from .currency_tax import CurrencyWithTax
+from .currency_tax import CurrencyWithTax, _restore_currency_with_tax
 
 Addable = Union[Currency, CurrencyRange, CurrencyWithTax, "CurrencyRangeTax"]
 
@@ -9,7 +10,10 @@ Addable = Union[Currency, CurrencyRange, CurrencyWithTax, "CurrencyRangeTax"]
 class CurrencyRangeTax:
     """A taxed money range."""
 
-    __slots__ = ("start", "stop")
+    __slots__ = ("start", "stop", "_hash")
+    start: CurrencyWithTax
+    stop: CurrencyWithTax
+    _hash: int
 
     def __init__(self, start: CurrencyWithTax, stop: CurrencyWithTax) -> None:
         if start.currency != stop.currency:
@@ -18,8 +22,37 @@ class CurrencyRangeTax:
             )
         if start > stop:
             raise ValueError(f"Cannot create a range from {start} to {stop}")
-        self.start = start
-        self.stop = stop
+        object.__setattr__(self, "start", start)
+        object.__setattr__(self, "stop", stop)
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_construction(type(self).__name__)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        start, stop = self.start, self.stop
+        prices = (start.net, start.gross, stop.net, stop.gross)
+        if (
+            type(self) is not CurrencyRangeTax
+            or type(start) is not CurrencyWithTax
+            or type(stop) is not CurrencyWithTax
+            or any(type(price) is not Currency for price in prices)
+        ):
+            # subclasses and their parts pickle with their own types
+            return type(self), (start, stop)
+        amounts = tuple(str(price.amount) for price in prices)
+        return _restore_currency_range_tax, amounts + (self.currency,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __str__(self) -> str:
         return f"CurrencyRangeTax({self.start}, {self.stop})"
@@ -67,6 +100,14 @@ class CurrencyRangeTax:
             return self.start == other.start and self.stop == other.stop
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.start, self.stop))
+            object.__setattr__(self, "_hash", value)
+            return value
+
     def __contains__(self, item: CurrencyWithTax) -> bool:
         if not isinstance(item, CurrencyWithTax):
             raise TypeError(
@@ -99,3 +140,13 @@ class CurrencyRangeTax:
         if stop is None:
             stop = self.stop
         return CurrencyRangeTax(start=start, stop=stop)
+
+
+def _restore_currency_range_tax(
+    start_net: str, start_gross: str, stop_net: str, stop_gross: str, currency: str
+) -> CurrencyRangeTax:
+    """Unpickle a CurrencyRangeTax pickled as four amount strings and one code."""
+    return CurrencyRangeTax(
+        _restore_currency_with_tax(start_net, start_gross, currency),
+        _restore_currency_with_tax(stop_net, stop_gross, currency),
+    )
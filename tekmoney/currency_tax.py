@@ -2,7 +2,9 @@ import warnings
 from decimal import Decimal
 from typing import Union
 
-from .currency import Currency
+from . import instrumentation
+from .currency import Currency, _new_currency
+from .currency_info import intern_currency
 
 Dint = Union[Decimal, int]
 CurrencyAddable = Union[Currency, "CurrencyWithTax"]
@@ -11,7 +13,10 @@ CurrencyAddable = Union[Currency, "CurrencyWithTax"]
 class CurrencyWithTax:
     """Stores Currency with net, gross (incl. tax) and tax."""
 
-    __slots__ = ("net", "gross")
+    __slots__ = ("net", "gross", "_hash")
+    net: Currency
+    gross: Currency
+    _hash: int
 
     def __init__(self, net: Currency, gross: Currency) -> None:
         if not isinstance(net, Currency) or not isinstance(gross, Currency):
@@ -20,8 +25,34 @@ class CurrencyWithTax:
             raise ValueError(
                 f"Different currencies not allowed: {net.currency} and {gross.currency}"
             )
-        self.net = net
-        self.gross = gross
+        object.__setattr__(self, "net", net)
+        object.__setattr__(self, "gross", gross)
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_construction(type(self).__name__)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        if (
+            type(self) is not CurrencyWithTax
+            or type(self.net) is not Currency
+            or type(self.gross) is not Currency
+        ):
+            # subclasses and their parts pickle with their own types
+            return type(self), (self.net, self.gross)
+        amounts = (str(self.net.amount), str(self.gross.amount))
+        return _restore_currency_with_tax, amounts + (self.currency,)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
 
     def __str__(self) -> str:
         return f"CurrencyWithTax(net={self.net}, gross={self.gross})"
@@ -30,22 +61,22 @@ class CurrencyWithTax:
         if isinstance(other, CurrencyWithTax):
             net = self.net + other.net
             gross = self.gross + other.gross
-            return CurrencyWithTax(net=net, gross=gross)
+            return _new_currency_with_tax(net, gross)
         if isinstance(other, Currency):
             net = self.net + other
             gross = self.gross + other
-            return CurrencyWithTax(net=net, gross=gross)
+            return _new_currency_with_tax(net, gross)
         return NotImplemented
 
     def __sub__(self, other: CurrencyAddable) -> "CurrencyWithTax":
         if isinstance(other, CurrencyWithTax):
             net = self.net - other.net
             gross = self.gross - other.gross
-            return CurrencyWithTax(net=net, gross=gross)
+            return _new_currency_with_tax(net, gross)
         if isinstance(other, Currency):
             net = self.net - other
             gross = self.gross - other
-            return CurrencyWithTax(net=net, gross=gross)
+            return _new_currency_with_tax(net, gross)
         return NotImplemented
 
     def __lt__(self, other: "CurrencyWithTax") -> bool:
@@ -63,6 +94,14 @@ class CurrencyWithTax:
             return self.gross == other.gross and self.net == other.net
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            value = hash((self.net, self.gross))
+            object.__setattr__(self, "_hash", value)
+            return value
+
     def __le__(self, other: "CurrencyWithTax") -> bool:
         if self == other:
             return True
@@ -74,7 +113,7 @@ class CurrencyWithTax:
             gross = self.gross * other
         except TypeError:
             return NotImplemented
-        return CurrencyWithTax(net=net, gross=gross)
+        return _new_currency_with_tax(net, gross)
 
     def __rmul__(self, other: Dint) -> "CurrencyWithTax":
         return self * other
@@ -85,6 +124,7 @@ class CurrencyWithTax:
             gross = self.gross / other
         except TypeError:
             return NotImplemented
+        # dividing by a Currency gives ratios, which the constructor rejects
         return CurrencyWithTax(net=net, gross=gross)
 
     def __bool__(self) -> bool:  # pragma: no cover
@@ -113,7 +153,30 @@ class CurrencyWithTax:
 
         All arguments are passed to `Currency.quantize`.
         """
-        return CurrencyWithTax(
-            net=self.net.quantize(exp, rounding=rounding),
-            gross=self.gross.quantize(exp, rounding=rounding),
+        return _new_currency_with_tax(
+            self.net.quantize(exp, rounding=rounding),
+            self.gross.quantize(exp, rounding=rounding),
         )
+
+
+def _restore_currency_with_tax(net: str, gross: str, currency: str) -> CurrencyWithTax:
+    """Unpickle a CurrencyWithTax pickled as two amount strings and one code."""
+    currency = intern_currency(currency)
+    return _new_currency_with_tax(
+        _new_currency(Decimal(net), currency), _new_currency(Decimal(gross), currency)
+    )
+
+
+def _new_currency_with_tax(net: Currency, gross: Currency) -> CurrencyWithTax:
+    """Create a CurrencyWithTax without validating its arguments.
+
+    For results computed inside tekmoney only: net and gross must be Currency
+    objects of the same currency, e.g. results of Currency arithmetic.
+    """
+    result = CurrencyWithTax.__new__(CurrencyWithTax)
+    object.__setattr__(result, "net", net)
+    object.__setattr__(result, "gross", gross)
+    recorder = instrumentation.active
+    if recorder is not None:
+        recorder.count_construction("CurrencyWithTax")
+    return result
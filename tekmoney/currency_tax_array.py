@@ -0,0 +1,103 @@
+from typing import Iterable, Iterator, List, Optional
+
+from . import instrumentation
+from .currency_array import CurrencyArray
+from .currency_tax import CurrencyWithTax
+
+
+class CurrencyWithTaxArray:
+    """Stores many taxed amounts of one currency as net and gross CurrencyArrays."""
+
+    __slots__ = ("net", "gross")
+
+    def __init__(self, net: CurrencyArray, gross: CurrencyArray) -> None:
+        if not isinstance(net, CurrencyArray) or not isinstance(gross, CurrencyArray):
+            raise TypeError(
+                f"CurrencyWithTaxArray requires CurrencyArray, got {net}, {gross}"
+            )
+        if net.currency != gross.currency:
+            raise ValueError(
+                f"Different currencies not allowed: {net.currency} and {gross.currency}"
+            )
+        if len(net) != len(gross):
+            raise ValueError(
+                f"net and gross lengths differ: {len(net)} and {len(gross)}"
+            )
+        self.net = net
+        self.gross = gross
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_construction(type(self).__name__)
+
+    @classmethod
+    def from_currencies(
+        cls,
+        values: Iterable[CurrencyWithTax],
+        currency: Optional[str] = None,
+        precision: Optional[int] = None,
+    ) -> "CurrencyWithTaxArray":
+        """Build an array from CurrencyWithTax objects of a single currency."""
+        values = list(values)
+        for value in values:
+            if not isinstance(value, CurrencyWithTax):
+                raise TypeError(
+                    f"CurrencyWithTaxArray requires CurrencyWithTax, got {value!r}"
+                )
+        if currency is None and values:
+            currency = values[0].currency
+        net = CurrencyArray.from_currencies(
+            [v.net for v in values], currency, precision
+        )
+        gross = CurrencyArray.from_currencies(
+            [v.gross for v in values], currency, precision
+        )
+        return cls(net, gross)
+
+    def __reduce__(self):
+        return CurrencyWithTaxArray, (self.net, self.gross)
+
+    def to_currencies(self) -> List[CurrencyWithTax]:
+        """Return the amounts as a list of CurrencyWithTax objects."""
+        return list(self)
+
+    def __str__(self) -> str:
+        return f"CurrencyWithTaxArray(net={self.net}, gross={self.gross})"
+
+    def __len__(self) -> int:
+        return len(self.net)
+
+    def __iter__(self) -> Iterator[CurrencyWithTax]:
+        for net, gross in zip(self.net, self.gross):
+            yield CurrencyWithTax(net=net, gross=gross)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CurrencyWithTaxArray(self.net[index], self.gross[index])
+        return CurrencyWithTax(net=self.net[index], gross=self.gross[index])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CurrencyWithTaxArray):
+            return self.net == other.net and self.gross == other.gross
+        return False
+
+    __hash__ = None  # type: ignore
+
+    @property
+    def currency(self) -> str:
+        """Return the currency-unit of the amounts. Like 'USD'."""
+        return self.net.currency
+
+    @property
+    def tax(self) -> CurrencyArray:
+        """Return the tax amounts."""
+        return self.gross - self.net
+
+    def quantize(self, exp=None, rounding=None) -> "CurrencyWithTaxArray":
+        """Return a new array with both net and gross quantized.
+
+        All arguments are passed to `CurrencyArray.quantize`.
+        """
+        return CurrencyWithTaxArray(
+            net=self.net.quantize(exp, rounding=rounding),
+            gross=self.gross.quantize(exp, rounding=rounding),
+        )
@@ -1,18 +1,76 @@
+from array import array
 from decimal import Decimal, ROUND_DOWN
-from typing import TypeVar, Union
+from itertools import repeat
+from typing import Iterable, List, Tuple, TypeVar, Union
 
-from tekmoney.currency import Currency
+from tekmoney.currency import Currency, _new_currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_info import get_currency_info, get_currency_precision
 from tekmoney.currency_range import CurrencyRange
-from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.currency_tax import CurrencyWithTax, _new_currency_with_tax
 from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+from tekmoney.instrumentation import timed
+from tekmoney.minor_units import (
+    as_ratio,
+    divide_rounded,
+    required_precision,
+    to_minor_units,
+)
 
 Dint = Union[Decimal, int]
 
-T = TypeVar("T", Currency, CurrencyRange, CurrencyWithTax, CurrencyRangeTax)
+T = TypeVar(
+    "T",
+    Currency,
+    CurrencyRange,
+    CurrencyWithTax,
+    CurrencyRangeTax,
+    CurrencyArray,
+    CurrencyWithTaxArray,
+)
 
 
+def _subtract_floored(
+    values: CurrencyArray, discounts: Iterable[int], precision: int
+) -> CurrencyArray:
+    """Subtract discounts given in minor units of precision from every row.
+
+    Rows that would become negative are zero, like in fixed_discount.
+    """
+    target = max(values.precision, precision)
+    scale = 10 ** (target - values.precision)
+    discount_scale = 10 ** (target - precision)
+    units = []
+    for unit, discount in zip(values.units, discounts):
+        unit = unit * scale - discount * discount_scale
+        units.append(unit if unit > 0 else 0)
+    return CurrencyArray(array("q", units), values.currency, target)
+
+
+def _rounded_down_shares(values: CurrencyArray, fraction: Dint) -> List[int]:
+    """Return fraction of every row in minor units of the currency.
+
+    Rounds toward zero, like `(value * fraction).quantize(rounding=ROUND_DOWN)`.
+    """
+    numerator, denominator = as_ratio(fraction)
+    shift = get_currency_precision(values.currency) - values.precision
+    if shift >= 0:
+        numerator *= 10**shift
+    else:
+        denominator *= 10**-shift
+    return [
+        divide_rounded(unit * numerator, denominator, ROUND_DOWN)
+        for unit in values.units
+    ]
+
+
+@timed("fixed_discount")
 def fixed_discount(base: T, discount: Currency) -> T:
-    """Apply a fixed discount to any currency type."""
+    """Apply a fixed discount to any currency type.
+
+    Batches are discounted row by row on their minor units.
+    """
     if isinstance(base, CurrencyRange):
         return CurrencyRange(
             fixed_discount(base.start, discount), fixed_discount(base.stop, discount)
@@ -28,11 +86,31 @@ def fixed_discount(base: T, discount: Currency) -> T:
         )
     if isinstance(base, Currency):
         return max(base - discount, Currency(0, base.currency))
+    if isinstance(base, CurrencyWithTaxArray):
+        return CurrencyWithTaxArray(
+            net=fixed_discount(base.net, discount),
+            gross=fixed_discount(base.gross, discount),
+        )
+    if isinstance(base, CurrencyArray):
+        if not isinstance(discount, Currency):
+            raise TypeError(f"fixed_discount requires a Currency, got {discount!r}")
+        if discount.currency != base.currency:
+            raise ValueError(
+                f"cannot subtract {base.currency} from {discount.currency}"
+            )
+        precision = max(base.precision, required_precision(discount.amount))
+        units = to_minor_units(discount.amount, precision)
+        return _subtract_floored(base, repeat(units), precision)
     raise TypeError("Unknown base for fixed_discount: %r" % (base,))
 
 
+@timed("fractional_discount")
 def fractional_discount(base: T, fraction: Decimal, *, from_gross=True) -> T:
-    """Apply a fractional discount based on either gross or net amount."""
+    """Apply a fractional discount based on either gross or net amount.
+
+    Batches are discounted row by row on their minor units, with the same
+    rounding as single values.
+    """
     if isinstance(base, CurrencyRange):
         return CurrencyRange(
             fractional_discount(base.start, fraction, from_gross=from_gross),
@@ -52,10 +130,245 @@ def fractional_discount(base: T, fraction: Decimal, *, from_gross=True) -> T:
     if isinstance(base, Currency):
         discount = (base * fraction).quantize(rounding=ROUND_DOWN)
         return fixed_discount(base, discount)
+    if isinstance(base, (CurrencyArray, CurrencyWithTaxArray)):
+        if not isinstance(fraction, (int, Decimal)):
+            raise TypeError(f"unsupported fraction {fraction!r}")
+        precision = get_currency_precision(base.currency)
+    if isinstance(base, CurrencyWithTaxArray):
+        shares = _rounded_down_shares(base.gross if from_gross else base.net, fraction)
+        return CurrencyWithTaxArray(
+            net=_subtract_floored(base.net, shares, precision),
+            gross=_subtract_floored(base.gross, shares, precision),
+        )
+    if isinstance(base, CurrencyArray):
+        shares = _rounded_down_shares(base, fraction)
+        return _subtract_floored(base, shares, precision)
     raise TypeError("Unknown base for fractional_discount: %r" % (base,))
 
 
+@timed("percentage_discount")
 def percentage_discount(base: T, percentage: Dint, *, from_gross=True) -> T:
     """Apply a percentage discount based on either gross or net amount."""
     factor = Decimal(percentage) / 100
     return fractional_discount(base, factor, from_gross=from_gross)
+
+
+_FIXED = "fixed"
+_FRACTION = "fraction"
+_ZERO = Decimal(0)
+# a compiled rule: (_FIXED, discount) or (_FRACTION, fraction, from_gross)
+Rule = Tuple
+
+
+class DiscountPlan:
+    """A chain of discounts compiled once and applied to values in one pass.
+
+    Plans are built by chaining, and every step returns a new plan:
+
+        plan = DiscountPlan().percentage(10).fixed(Currency(5, "USD"))
+        plan(price)
+
+    gives what `fixed_discount(percentage_discount(price, 10), ...)` gives,
+    with the same ROUND_DOWN of fractional discounts and the same floor at
+    zero after every step, for any type the discount functions accept. A
+    batch is discounted row by row on its minor units without building
+    intermediate arrays.
+    """
+
+    __slots__ = ("rules",)
+
+    def __init__(self, rules: Iterable[Rule] = ()) -> None:
+        self.rules = tuple(rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def fixed(self, discount: Currency) -> "DiscountPlan":
+        """Return the plan followed by `fixed_discount(value, discount)`."""
+        if not isinstance(discount, Currency):
+            raise TypeError(f"fixed discount requires a Currency, got {discount!r}")
+        return DiscountPlan(self.rules + ((_FIXED, discount),))
+
+    def fractional(self, fraction: Dint, *, from_gross=True) -> "DiscountPlan":
+        """Return the plan followed by `fractional_discount(value, fraction)`."""
+        if not isinstance(fraction, (int, Decimal)):
+            raise TypeError(f"unsupported fraction {fraction!r}")
+        return DiscountPlan(self.rules + ((_FRACTION, fraction, from_gross),))
+
+    def percentage(self, percentage: Dint, *, from_gross=True) -> "DiscountPlan":
+        """Return the plan followed by `percentage_discount(value, percentage)`."""
+        return self.fractional(Decimal(percentage) / 100, from_gross=from_gross)
+
+    def __call__(self, base: T) -> T:
+        return _apply_plan(base, self)
+
+    def apply(self, base: T) -> T:
+        """Apply every discount of the plan in order."""
+        return _apply_plan(base, self)
+
+    def _apply(self, base: T) -> T:
+        if not self.rules:
+            return base
+        kind = type(base)
+        if kind is Currency:
+            return self._currency(base)  # type: ignore
+        if kind is CurrencyWithTax:
+            return self._currency_with_tax(base)  # type: ignore
+        if kind is CurrencyRange:
+            return CurrencyRange(  # type: ignore
+                self._currency(base.start), self._currency(base.stop)  # type: ignore
+            )
+        if kind is CurrencyRangeTax:
+            return CurrencyRangeTax(  # type: ignore
+                self._currency_with_tax(base.start),  # type: ignore
+                self._currency_with_tax(base.stop),  # type: ignore
+            )
+        if kind is CurrencyArray:
+            return self._batch(base)  # type: ignore
+        if kind is CurrencyWithTaxArray:
+            return self._batch_with_tax(base)  # type: ignore
+        # subclasses may change the arithmetic, use the discount functions
+        for rule in self.rules:
+            if rule[0] is _FIXED:
+                base = fixed_discount(base, rule[1])
+            else:
+                base = fractional_discount(base, rule[1], from_gross=rule[2])
+        return base
+
+    def _fixed_amount(self, rule: Rule, currency: str) -> Decimal:
+        discount = rule[1]
+        if discount.currency != currency:
+            raise ValueError(f"cannot subtract {currency} from {discount.currency}")
+        return discount.amount
+
+    def _currency(self, base: Currency) -> Currency:
+        amount, currency = base.amount, base.currency
+        for rule in self.rules:
+            if rule[0] is _FIXED:
+                amount = amount - self._fixed_amount(rule, currency)
+            else:
+                exponent = get_currency_info(currency).exponent
+                amount -= (amount * rule[1]).quantize(exponent, ROUND_DOWN)
+            if amount < 0:
+                amount = _ZERO
+        return _new_currency(amount, currency)
+
+    def _currency_with_tax(self, base: CurrencyWithTax) -> CurrencyWithTax:
+        net, gross, currency = base.net.amount, base.gross.amount, base.currency
+        for rule in self.rules:
+            if rule[0] is _FIXED:
+                discount = self._fixed_amount(rule, currency)
+            else:
+                exponent = get_currency_info(currency).exponent
+                discount = ((gross if rule[2] else net) * rule[1]).quantize(
+                    exponent, ROUND_DOWN
+                )
+            net = net - discount
+            if net < 0:
+                net = _ZERO
+            gross = gross - discount
+            if gross < 0:
+                gross = _ZERO
+        return _new_currency_with_tax(
+            _new_currency(net, currency), _new_currency(gross, currency)
+        )
+
+    def _precision(self, values: CurrencyArray) -> int:
+        """Return the decimal places the chained functions would end with."""
+        precision = values.precision
+        for rule in self.rules:
+            if rule[0] is _FIXED:
+                amount = self._fixed_amount(rule, values.currency)
+                precision = max(precision, required_precision(amount))
+            else:
+                precision = max(precision, get_currency_precision(values.currency))
+        return precision
+
+    def _steps(self, precision: int, currency: str) -> List[Tuple[bool, int, int]]:
+        """Compile the rules for rows of precision decimal places.
+
+        A fixed step is (True, units to subtract, 0). A fractional step is
+        (False, numerator, denominator) giving the discount in minor units
+        of the currency; minor units are then scaled back to precision.
+        """
+        # plans with fractional steps have at least the currency precision
+        shift = 10 ** max(precision - get_currency_precision(currency), 0)
+        steps = []
+        for rule in self.rules:
+            if rule[0] is _FIXED:
+                amount = self._fixed_amount(rule, currency)
+                steps.append((True, to_minor_units(amount, precision), 0))
+            else:
+                numerator, denominator = as_ratio(rule[1])
+                steps.append((False, numerator, denominator * shift))
+        return steps
+
+    def _batch(self, values: CurrencyArray) -> CurrencyArray:
+        currency = values.currency
+        precision = self._precision(values)
+        scale = 10 ** (precision - values.precision)
+        shift = 10 ** max(precision - get_currency_precision(currency), 0)
+        steps = self._steps(precision, currency)
+        units = []
+        for unit in values.units:
+            unit *= scale
+            for fixed, a, b in steps:
+                if fixed:
+                    unit -= a
+                else:
+                    # the discount in minor units, rounded toward zero
+                    product = unit * a
+                    share = product // b if product >= 0 else -(-product // b)
+                    unit -= share * shift
+                if unit < 0:
+                    unit = 0
+            units.append(unit)
+        return CurrencyArray(array("q", units), currency, precision)
+
+    def _batch_with_tax(self, values: CurrencyWithTaxArray) -> CurrencyWithTaxArray:
+        currency = values.currency
+        precision = get_currency_precision(currency)
+        net_precision = self._precision(values.net)
+        gross_precision = self._precision(values.gross)
+        net_scale = 10 ** (net_precision - values.net.precision)
+        gross_scale = 10 ** (gross_precision - values.gross.precision)
+        net_shift = 10 ** max(net_precision - precision, 0)
+        gross_shift = 10 ** max(gross_precision - precision, 0)
+        net_steps = self._steps(net_precision, currency)
+        gross_steps = self._steps(gross_precision, currency)
+        steps = []
+        for rule, net_step, gross_step in zip(self.rules, net_steps, gross_steps):
+            if rule[0] is _FIXED:
+                steps.append((True, net_step[1], gross_step[1], False))
+            else:
+                source = gross_step if rule[2] else net_step
+                steps.append((False, source[1], source[2], rule[2]))
+        net_units, gross_units = [], []
+        for net, gross in zip(values.net.units, values.gross.units):
+            net *= net_scale
+            gross *= gross_scale
+            for fixed, a, b, from_gross in steps:
+                if fixed:
+                    net -= a
+                    gross -= b
+                else:
+                    product = (gross if from_gross else net) * a
+                    share = product // b if product >= 0 else -(-product // b)
+                    net -= share * net_shift
+                    gross -= share * gross_shift
+                if net < 0:
+                    net = 0
+                if gross < 0:
+                    gross = 0
+            net_units.append(net)
+            gross_units.append(gross)
+        return CurrencyWithTaxArray(
+            CurrencyArray(array("q", net_units), currency, net_precision),
+            CurrencyArray(array("q", gross_units), currency, gross_precision),
+        )
+
+
+@timed("discount_plan")
+def _apply_plan(base: T, plan: DiscountPlan) -> T:
+    """Apply plan to base; timed here so calls are counted by the type of base."""
+    return plan._apply(base)
@@ -0,0 +1,239 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+from math import gcd
+from typing import Dict, List, Mapping, Tuple, TypeVar, Union
+
+from .currency import Currency, _new_currency
+from .currency_array import CurrencyArray
+from .currency_info import get_currency_precision, intern_currency
+from .currency_range import CurrencyRange
+from .currency_range_tax import CurrencyRangeTax
+from .currency_tax import CurrencyWithTax, _new_currency_with_tax
+from .currency_tax_array import CurrencyWithTaxArray
+from .minor_units import as_ratio, divide_rounded, from_minor_units
+
+Rate = Union[Decimal, int, str]
+Path = Union[str, "os.PathLike[str]"]
+
+T = TypeVar(
+    "T",
+    Currency,
+    CurrencyWithTax,
+    CurrencyRange,
+    CurrencyRangeTax,
+    CurrencyArray,
+    CurrencyWithTaxArray,
+)
+
+
+def _rate_ratio(rate: Rate, code: str) -> Tuple[int, int]:
+    if not isinstance(rate, (Decimal, int, str)) or isinstance(rate, bool):
+        raise TypeError(f"rate of {code} must be a Decimal, int or str, got {rate!r}")
+    value = Decimal(rate)
+    if not value.is_finite() or value <= 0:
+        raise ValueError(f"rate of {code} must be positive, got {rate!r}")
+    return as_ratio(value)
+
+
+class ExchangeRates:
+    """Exchange rates between currencies, from rates against a base currency.
+
+    rates gives the amount of every currency worth one unit of base, e.g.
+    ExchangeRates("EUR", {"USD": Decimal("1.0812")}). Every cross rate is
+    computed once, as an exact integer ratio, into a dense matrix indexed
+    by currency, so a conversion is one lookup and one rounding.
+
+    Converted amounts are rounded to the precision of the target currency
+    with ROUND_HALF_UP unless another rounding is given. Values already in
+    the target currency are returned as they are.
+    """
+
+    __slots__ = ("base", "currencies", "_index", "_matrix")
+
+    def __init__(self, base: str, rates: Mapping[str, Rate]) -> None:
+        base = intern_currency(base)
+        ratios: Dict[str, Tuple[int, int]] = {base: (1, 1)}
+        for code, rate in rates.items():
+            code = intern_currency(code)
+            ratio = _rate_ratio(rate, code)
+            if code == base and ratio != (1, 1):
+                raise ValueError(f"rate of the base currency {base} must be 1")
+            ratios[code] = ratio
+        self.base = base
+        self.currencies = tuple(ratios)
+        self._index = {code: i for i, code in enumerate(self.currencies)}
+        # _matrix[i][j] converts currency i to currency j:
+        # amount / rate_i * rate_j
+        self._matrix: List[List[Tuple[int, int]]] = []
+        for source_numerator, source_denominator in ratios.values():
+            row = []
+            for target_numerator, target_denominator in ratios.values():
+                numerator = target_numerator * source_denominator
+                denominator = target_denominator * source_numerator
+                divisor = gcd(numerator, denominator)
+                row.append((numerator // divisor, denominator // divisor))
+            self._matrix.append(row)
+
+    def __len__(self) -> int:
+        return len(self.currencies)
+
+    def __contains__(self, code: object) -> bool:
+        return isinstance(code, str) and intern_currency(code) in self._index
+
+    def _ratio(self, source: str, target: str) -> Tuple[int, int]:
+        try:
+            return self._matrix[self._index[source]][self._index[target]]
+        except KeyError:
+            code = target if source in self._index else source
+            raise ValueError(f"no exchange rate for {code}") from None
+
+    def rate(self, source: str, target: str) -> Decimal:
+        """Return the amount of target worth one unit of source."""
+        numerator, denominator = self._ratio(
+            intern_currency(source), intern_currency(target)
+        )
+        return Decimal(numerator) / denominator
+
+    def to_dict(self) -> Dict[str, str]:
+        """Return the rates against the base currency as strings."""
+        return {code: str(self.rate(self.base, code)) for code in self.currencies}
+
+    def convert(self, value: T, target: str, rounding=None) -> T:
+        """Return value in the target currency.
+
+        value is a Currency, CurrencyWithTax, CurrencyRange,
+        CurrencyRangeTax, CurrencyArray or CurrencyWithTaxArray.
+        """
+        target = intern_currency(target)
+        if rounding is None:
+            rounding = ROUND_HALF_UP
+        if isinstance(value, (CurrencyArray, CurrencyWithTaxArray)):
+            return self._convert_batch(value, target, rounding)  # type: ignore
+        try:
+            source = value.currency
+        except AttributeError:
+            raise TypeError(f"cannot convert {value!r}") from None
+        if source == target:
+            return value
+        numerator, denominator = self._ratio(source, target)
+        precision = get_currency_precision(target)
+        factors = (numerator * 10**precision, denominator, precision, target, rounding)
+        if isinstance(value, Currency):
+            return _converted(value, *factors)  # type: ignore
+        if isinstance(value, CurrencyWithTax):
+            return _converted_with_tax(value, *factors)  # type: ignore
+        if isinstance(value, CurrencyRange):
+            return CurrencyRange(  # type: ignore
+                _converted(value.start, *factors), _converted(value.stop, *factors)
+            )
+        if isinstance(value, CurrencyRangeTax):
+            return CurrencyRangeTax(  # type: ignore
+                _converted_with_tax(value.start, *factors),
+                _converted_with_tax(value.stop, *factors),
+            )
+        raise TypeError(f"cannot convert {value!r}")
+
+    def _convert_batch(
+        self, values: Union[CurrencyArray, CurrencyWithTaxArray], target: str, rounding
+    ) -> Union[CurrencyArray, CurrencyWithTaxArray]:
+        if values.currency == target:
+            return values
+        if isinstance(values, CurrencyWithTaxArray):
+            return CurrencyWithTaxArray(
+                self._convert_column(values.net, target, rounding),
+                self._convert_column(values.gross, target, rounding),
+            )
+        return self._convert_column(values, target, rounding)
+
+    def _convert_column(
+        self, values: CurrencyArray, target: str, rounding
+    ) -> CurrencyArray:
+        numerator, denominator = self._ratio(values.currency, target)
+        precision = get_currency_precision(target)
+        numerator *= 10**precision
+        denominator *= 10**values.precision
+        units = array(
+            "q",
+            [
+                divide_rounded(u * numerator, denominator, rounding)
+                for u in values.units
+            ],
+        )
+        return CurrencyArray(units, target, precision)
+
+
+def _converted(
+    value: Currency,
+    numerator: int,
+    denominator: int,
+    precision: int,
+    target: str,
+    rounding,
+) -> Currency:
+    """Return value * numerator / denominator rounded to precision places.
+
+    numerator includes the factor 10 ** precision.
+    """
+    amount_numerator, amount_denominator = value.amount.as_integer_ratio()
+    units = divide_rounded(
+        amount_numerator * numerator, amount_denominator * denominator, rounding
+    )
+    return _new_currency(from_minor_units(units, precision), target)
+
+
+def _converted_with_tax(value: CurrencyWithTax, *factors) -> CurrencyWithTax:
+    return _new_currency_with_tax(
+        _converted(value.net, *factors), _converted(value.gross, *factors)
+    )
+
+
+class RateProvider(ABC):
+    """Source of ExchangeRates, like a file or a rates service."""
+
+    @abstractmethod
+    def load(self) -> ExchangeRates:
+        """Return the current rates."""
+
+
+class InMemoryRateProvider(RateProvider):
+    """Rates held in memory, for tests and fixed rates."""
+
+    def __init__(self, base: str, rates: Mapping[str, Rate]) -> None:
+        self.base = base
+        self.rates = dict(rates)
+
+    def update(self, rates: Mapping[str, Rate]) -> None:
+        """Change some rates; the next load returns them."""
+        self.rates.update(rates)
+
+    def load(self) -> ExchangeRates:
+        return ExchangeRates(self.base, self.rates)
+
+
+class FileRateProvider(RateProvider):
+    """Rates read from a JSON file on every load.
+
+    The file holds the base currency and the rates against it, with rates
+    as strings to keep them exact:
+
+        {"base": "EUR", "rates": {"USD": "1.0812", "JPY": "161.53"}}
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> ExchangeRates:
+        with open(self.path, encoding="utf-8") as f:
+            data = json.load(f, parse_float=Decimal)
+        if not isinstance(data, dict) or not isinstance(data.get("rates"), dict):
+            raise ValueError(f"{self.path} holds no exchange rates")
+        return ExchangeRates(data.get("base", ""), data["rates"])
+
+    @staticmethod
+    def save(path: Path, rates: ExchangeRates) -> None:
+        """Write rates in the format load reads."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"base": rates.base, "rates": rates.to_dict()}, f, indent=2)
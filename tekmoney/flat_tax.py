@@ -1,10 +1,16 @@
-from decimal import Decimal
-from typing import Optional, Union, overload
+from array import array
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Dict, Optional, Sequence, Tuple, Union, overload
 
 from .currency import Currency
+from .currency_info import get_currency_precision
+from .currency_array import CurrencyArray
 from .currency_range import CurrencyRange
 from .currency_tax import CurrencyWithTax
 from .currency_range_tax import CurrencyRangeTax
+from .currency_tax_array import CurrencyWithTaxArray
+from .instrumentation import timed
+from .minor_units import as_ratio, divide_rounded
 
 Dint = Union[Decimal, int]
 
@@ -23,9 +29,20 @@ def flat_tax(
     ...  # pragma: no cover
 
 
+@overload
+def flat_tax(
+    base: Union[CurrencyArray, CurrencyWithTaxArray], tax_rate: Decimal, *, keep_gross
+) -> CurrencyWithTaxArray:
+    ...  # pragma: no cover
+
+
+@timed("flat_tax")
 def flat_tax(base, tax_rate, *, keep_gross=False):
     """Apply a flat tax by either increasing gross or decreasing net amount.
-    If keep_gross True, gross constant, net amount decreased"""
+    If keep_gross True, gross constant, net amount decreased.
+    Batches are passed on to flat_tax_batch."""
+    if isinstance(base, (CurrencyArray, CurrencyWithTaxArray)):
+        return flat_tax_batch(base, tax_rate, keep_gross=keep_gross)
     fraction = Decimal(1) + tax_rate
     if isinstance(base, (CurrencyRange, CurrencyRangeTax)):
         return CurrencyRangeTax(
@@ -47,3 +64,64 @@ def flat_tax(base, tax_rate, *, keep_gross=False):
             gross = (base * fraction).quantize()
             return CurrencyWithTax(net=base, gross=gross)
     raise TypeError("Unknown base for flat_tax: %r" % (base,))
+
+
+@timed("flat_tax_batch")
+def flat_tax_batch(
+    values: Union[CurrencyArray, CurrencyWithTaxArray],
+    rates: Union[Dint, Sequence[Dint]],
+    *,
+    keep_gross=False,
+) -> CurrencyWithTaxArray:
+    """Apply a flat tax to every row of a columnar batch.
+
+    rates is either one tax rate or one rate per row. Each row is rounded
+    exactly like `flat_tax` rounds a single value.
+    If keep_gross True, gross constant, net amount decreased"""
+    if isinstance(values, CurrencyWithTaxArray):
+        net, gross = values.net, values.gross
+    elif isinstance(values, CurrencyArray):
+        net = gross = values
+    else:
+        raise TypeError("Unknown values for flat_tax_batch: %r" % (values,))
+    if keep_gross:
+        return CurrencyWithTaxArray(
+            net=_apply_tax_rates(net, rates, divide=True), gross=gross
+        )
+    return CurrencyWithTaxArray(
+        net=net, gross=_apply_tax_rates(gross, rates, divide=False)
+    )
+
+
+def _apply_tax_rates(
+    values: CurrencyArray, rates: Union[Dint, Sequence[Dint]], divide: bool
+) -> CurrencyArray:
+    """Multiply or divide values by (1 + rate), quantized to the currency precision."""
+    precision = get_currency_precision(values.currency)
+    shift = precision - values.precision
+    if isinstance(rates, (int, Decimal)):
+        rates = [rates] * len(values)
+    else:
+        rates = list(rates)
+        if len(rates) != len(values):
+            raise ValueError(f"expected {len(values)} tax rates, got {len(rates)}")
+    # rows share a handful of rates, so each rate is turned into an exact
+    # integer ratio including the precision shift only once
+    ratios: Dict[Dint, Tuple[int, int]] = {}
+    units = []
+    for unit, rate in zip(values.units, rates):
+        ratio = ratios.get(rate)
+        if ratio is None:
+            if not isinstance(rate, (int, Decimal)):
+                raise TypeError("Unknown tax rate for flat_tax_batch: %r" % (rate,))
+            numerator, denominator = as_ratio(rate)
+            numerator += denominator
+            if divide:
+                numerator, denominator = denominator, numerator
+            if shift >= 0:
+                numerator *= 10 ** shift
+            else:
+                denominator *= 10 ** -shift
+            ratio = ratios[rate] = (numerator, denominator)
+        units.append(divide_rounded(unit * ratio[0], ratio[1], ROUND_HALF_UP))
+    return CurrencyArray(array("q", units), values.currency, precision)
@@ -0,0 +1,146 @@
+"""Opt-in counters and timings for tekmoney hot paths.
+
+Nothing is recorded unless a Recorder is active. Hot paths only check
+`instrumentation.active is not None`, so the cost when disabled is one
+module attribute lookup. The active recorder is process wide:
+
+    with instrument() as recorder:
+        run_pricing()
+    print(recorder.snapshot())
+"""
+
+import functools
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class Recorder:
+    """Collects counters and timings while it is the active recorder"""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.constructions: Counter = Counter()
+        self.quantize_calls: Counter = Counter()
+        self.precision_misses: Counter = Counter()
+        self.branches: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.seconds: Dict[str, float] = {}
+
+    def count_construction(self, type_name: str) -> None:
+        with self._lock:
+            self.constructions[type_name] += 1
+
+    def count_quantize(self, currency: str, rounding: str) -> None:
+        with self._lock:
+            self.quantize_calls[currency, rounding] += 1
+
+    def count_precision_miss(self, currency: str) -> None:
+        with self._lock:
+            self.precision_misses[currency] += 1
+
+    def add_timing(self, name: str, branch: str, seconds: float) -> None:
+        with self._lock:
+            self.branches[name, branch] += 1
+            self.calls[name] += 1
+            self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    def snapshot(self) -> dict:
+        """Return everything recorded so far as plain dicts."""
+        with self._lock:
+            quantize: Dict[str, Dict[str, int]] = {}
+            for (currency, rounding), count in self.quantize_calls.items():
+                quantize.setdefault(currency, {})[rounding] = count
+            branches: Dict[str, Dict[str, int]] = {}
+            for (name, branch), count in self.branches.items():
+                branches.setdefault(name, {})[branch] = count
+            timings = {
+                name: {
+                    "calls": calls,
+                    "total_seconds": self.seconds[name],
+                    "mean_seconds": self.seconds[name] / calls,
+                }
+                for name, calls in self.calls.items()
+            }
+            return {
+                "constructions": dict(self.constructions),
+                "quantize": quantize,
+                "precision_misses": dict(self.precision_misses),
+                "branches": branches,
+                "timings": timings,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            for counter in (
+                self.constructions,
+                self.quantize_calls,
+                self.precision_misses,
+                self.branches,
+                self.calls,
+            ):
+                counter.clear()
+            self.seconds.clear()
+
+
+active: Optional[Recorder] = None
+
+
+def enable(recorder: Optional[Recorder] = None) -> Recorder:
+    """Start recording into recorder, or into a new one, and return it."""
+    global active
+    if recorder is None:
+        recorder = Recorder()
+    active = recorder
+    return recorder
+
+
+def disable() -> None:
+    """Stop recording."""
+    global active
+    active = None
+
+
+@contextmanager
+def instrument(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """Record while the block runs, then restore the previous recorder."""
+    global active
+    previous = active
+    recorder = enable(recorder)
+    try:
+        yield recorder
+    finally:
+        active = previous
+
+
+_depth = threading.local()
+
+
+def timed(name: str):
+    """Time calls of the decorated function and count the type of its first argument.
+
+    Recursive calls, like flat_tax on the ends of a range, are part of the
+    outermost call and are not recorded separately.
+    """
+
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            recorder = active
+            if recorder is None or getattr(_depth, name, 0):
+                return func(*args, **kwargs)
+            setattr(_depth, name, 1)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                setattr(_depth, name, 0)
+                branch = type(args[0]).__name__ if args else "-"
+                recorder.add_timing(name, branch, elapsed)
+
+        return wrapper
+
+    return decorate
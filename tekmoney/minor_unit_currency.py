@@ -0,0 +1,159 @@
+import warnings
+from decimal import Decimal, ROUND_HALF_UP
+from typing import Optional, Union
+
+from . import instrumentation
+from .currency import Currency
+from .currency_info import get_currency_precision, intern_currency
+from .minor_units import divide_rounded, from_minor_units, to_minor_units
+
+Dint = Union[Decimal, int]
+
+
+class MinorUnitCurrency(Currency):
+    """Currency stored as an int count of minor units, like cents in dollar.
+
+    Addition, subtraction, comparison and integer multiplication with other
+    MinorUnitCurrency of the same precision use int arithmetic only. Other
+    operations fall back to Decimal and return a plain Currency.
+    """
+
+    __slots__ = ("units", "precision")
+    units: int
+    precision: int
+
+    def __init__(
+        self, amount: Dint, currency: str, precision: Optional[int] = None
+    ) -> None:
+        if isinstance(amount, float):
+            warnings.warn(
+                SyntaxWarning(  # pragma: no cover
+                    "float value detected. Please use Decimal instead."
+                ),
+                stacklevel=2,
+            )
+        currency = intern_currency(currency)
+        if precision is None:
+            precision = get_currency_precision(currency)
+        object.__setattr__(self, "currency", currency)
+        object.__setattr__(self, "units", to_minor_units(amount, precision))
+        object.__setattr__(self, "precision", precision)
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_construction(type(self).__name__)
+
+    @classmethod
+    def from_units(
+        cls, units: int, currency: str, precision: Optional[int] = None
+    ) -> "MinorUnitCurrency":
+        """Create an instance from a count of minor units."""
+        currency = intern_currency(currency)
+        if precision is None:
+            precision = get_currency_precision(currency)
+        result = cls.__new__(cls)
+        object.__setattr__(result, "currency", currency)
+        object.__setattr__(result, "units", units)
+        object.__setattr__(result, "precision", precision)
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_construction(cls.__name__)
+        return result
+
+    def __reduce__(self):
+        return MinorUnitCurrency.from_units, (self.units, self.currency, self.precision)
+
+    @property
+    def amount(self) -> Decimal:  # type: ignore
+        return from_minor_units(self.units, self.precision)
+
+    def _units_of(self, other: object) -> Optional[int]:
+        """Return the units of other if it has the same currency and precision."""
+        if (
+            isinstance(other, MinorUnitCurrency)
+            and self.precision == other.precision
+            and self.currency == other.currency
+        ):
+            return other.units
+        return None
+
+    def _with_units(self, units: int) -> "MinorUnitCurrency":
+        return MinorUnitCurrency.from_units(units, self.currency, self.precision)
+
+    def __bool__(self) -> bool:
+        return bool(self.units)
+
+    def __add__(self, other: Currency) -> Currency:
+        units = self._units_of(other)
+        if units is not None:
+            return self._with_units(self.units + units)
+        return super().__add__(other)
+
+    def __sub__(self, other: Currency) -> Currency:
+        """negative currency situation needs to be handled externally"""
+        units = self._units_of(other)
+        if units is not None:
+            return self._with_units(self.units - units)
+        return super().__sub__(other)
+
+    def __mul__(self, other: Dint) -> Currency:
+        if isinstance(other, int) and not isinstance(other, bool):
+            return self._with_units(self.units * other)
+        return super().__mul__(other)
+
+    def __lt__(self, other: Currency) -> bool:
+        units = self._units_of(other)
+        if units is not None:
+            return self.units < units
+        return super().__lt__(other)
+
+    def __gt__(self, other: Currency) -> bool:
+        units = self._units_of(other)
+        if units is not None:
+            return self.units > units
+        return super().__gt__(other)
+
+    def __le__(self, other: Currency) -> bool:
+        units = self._units_of(other)
+        if units is not None:
+            return self.units <= units
+        return super().__le__(other)
+
+    def __ge__(self, other: Currency) -> bool:
+        units = self._units_of(other)
+        if units is not None:
+            return self.units >= units
+        return super().__ge__(other)
+
+    def __eq__(self, other: object) -> bool:
+        units = self._units_of(other)
+        if units is not None:
+            return self.units == units
+        return super().__eq__(other)
+
+    __hash__ = Currency.__hash__
+
+    def quantize(self, exp=None, rounding=None) -> "MinorUnitCurrency":
+        """Same as `Currency.quantize`, but rounds the int count of minor units.
+
+        The result has as many decimal places as exp.
+        """
+        if exp is None:
+            precision = get_currency_precision(self.currency)
+        else:
+            exponent = Decimal(exp).as_tuple().exponent
+            if not isinstance(exponent, int):
+                raise ValueError(f"invalid exponent {exp!r}")
+            precision = -exponent
+        if rounding is None:
+            rounding = ROUND_HALF_UP
+        recorder = instrumentation.active
+        if recorder is not None:
+            recorder.count_quantize(self.currency, rounding)
+        if precision == self.precision:
+            return self
+        if precision > self.precision:
+            units = self.units * 10 ** (precision - self.precision)
+        else:
+            factor = 10 ** (self.precision - precision)
+            units = divide_rounded(self.units, factor, rounding)
+        return MinorUnitCurrency.from_units(units, self.currency, precision)
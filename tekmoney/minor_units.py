@@ -0,0 +1,117 @@
+from decimal import (
+    Decimal,
+    ROUND_05UP,
+    ROUND_CEILING,
+    ROUND_DOWN,
+    ROUND_FLOOR,
+    ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN,
+    ROUND_HALF_UP,
+    ROUND_UP,
+)
+import re
+from typing import Tuple, Union
+
+Dint = Union[Decimal, int]
+
+
+def to_minor_units(amount: Dint, precision: int) -> int:
+    """Return amount as an integer count of minor units.
+
+    Raises ValueError if the amount has more fractional digits than precision.
+    """
+    scaled = Decimal(amount).scaleb(precision)
+    integral = scaled.to_integral_value()
+    if scaled != integral:
+        raise ValueError(
+            f"{amount} cannot be represented with {precision} decimal places"
+        )
+    return int(integral)
+
+
+_AMOUNT = re.compile(r"([+-]?)([0-9]*)(?:\.([0-9]*))?")
+
+
+def parse_minor_units(text: str, precision: int) -> int:
+    """Parse a plain decimal string like "-12.50" into an int of minor units.
+
+    Only an optional sign, ASCII digits and an optional decimal point are
+    accepted, surrounded by optional whitespace. Raises ValueError for any
+    other text and for non-zero digits beyond precision decimal places.
+    """
+    match = _AMOUNT.fullmatch(text.strip())
+    if match is None:
+        raise ValueError(f"malformed amount {text!r}")
+    sign, whole, fraction = match.groups()
+    fraction = fraction or ""
+    if not whole and not fraction:
+        raise ValueError(f"malformed amount {text!r}")
+    if len(fraction) > precision:
+        if fraction[precision:].strip("0"):
+            raise ValueError(
+                f"{text.strip()} cannot be represented with {precision} decimal places"
+            )
+        fraction = fraction[:precision]
+    units = int((whole or "0") + fraction.ljust(precision, "0"))
+    return -units if sign == "-" else units
+
+
+def from_minor_units(units: int, precision: int) -> Decimal:
+    """Return the Decimal amount for an integer count of minor units."""
+    return Decimal(units).scaleb(-precision)
+
+
+def required_precision(amount: Dint) -> int:
+    """Return the smallest number of decimal places that holds amount exactly."""
+    exponent = Decimal(amount).normalize().as_tuple().exponent
+    if not isinstance(exponent, int):
+        raise ValueError(f"{amount} is not a finite amount")
+    return max(0, -exponent)
+
+
+def as_ratio(value: Dint) -> Tuple[int, int]:
+    """Return value as an exact (numerator, denominator) pair of ints."""
+    if isinstance(value, int):
+        return value, 1
+    return Decimal(value).as_integer_ratio()
+
+
+def divide_rounded(numerator: int, denominator: int, rounding=ROUND_HALF_UP) -> int:
+    """Divide two ints, rounding the exact quotient like Decimal.quantize does.
+
+    :param rounding: any of the decimal module rounding modes
+    """
+    if not denominator:
+        raise ZeroDivisionError("division by zero")
+    if denominator < 0:
+        numerator, denominator = -numerator, -denominator
+    quotient, remainder = divmod(numerator, denominator)
+    if not remainder:
+        return quotient
+    # quotient is the floor of the exact result, quotient + 1 its ceiling
+    negative = numerator < 0
+    if rounding == ROUND_FLOOR:
+        return quotient
+    if rounding == ROUND_CEILING:
+        return quotient + 1
+    if rounding == ROUND_DOWN:
+        return quotient + 1 if negative else quotient
+    if rounding == ROUND_UP:
+        return quotient if negative else quotient + 1
+    if rounding == ROUND_05UP:
+        toward_zero = quotient + 1 if negative else quotient
+        if abs(toward_zero) % 5:
+            return toward_zero
+        return quotient if negative else quotient + 1
+    doubled = 2 * remainder
+    if doubled < denominator:
+        return quotient
+    if doubled > denominator:
+        return quotient + 1
+    if rounding == ROUND_HALF_UP:
+        return quotient if negative else quotient + 1
+    if rounding == ROUND_HALF_DOWN:
+        return quotient + 1 if negative else quotient
+    if rounding == ROUND_HALF_EVEN:
+        return quotient if quotient % 2 == 0 else quotient + 1
+    raise ValueError(f"Unknown rounding mode: {rounding!r}")
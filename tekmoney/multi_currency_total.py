@@ -0,0 +1,171 @@
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Union
+
+from .accumulator import CurrencyAccumulator, CurrencyWithTaxAccumulator
+from .currency import Currency
+from .currency_info import intern_currency
+from .currency_tax import CurrencyWithTax
+
+Money = Union[Currency, CurrencyWithTax]
+Bucket = Union[CurrencyAccumulator, CurrencyWithTaxAccumulator]
+Serialized = Dict[str, Union[str, List[str]]]
+
+
+class MultiCurrencyTotal:
+    """Running totals of Currency and CurrencyWithTax values in many currencies.
+
+    Every currency has its own bucket keyed by the interned currency code,
+    so adding a value is one dict lookup and an in-place update. A bucket
+    holds a Currency total until the first CurrencyWithTax of its currency
+    arrives; from then on it holds net and gross, and Currency values are
+    added to both, like `CurrencyWithTax.__add__`.
+    """
+
+    __slots__ = ("_buckets",)
+
+    def __init__(self, values: Iterable[Money] = ()) -> None:
+        self._buckets: Dict[str, Bucket] = {}
+        self.update(values)
+
+    def _bucket(self, value: Money) -> Bucket:
+        try:
+            bucket = self._buckets[value.currency]
+        except KeyError:
+            return self._new_bucket(value)
+        except AttributeError:
+            raise TypeError(
+                f"MultiCurrencyTotal requires Currency or CurrencyWithTax, got {value!r}"
+            ) from None
+        if isinstance(value, CurrencyWithTax) and isinstance(
+            bucket, CurrencyAccumulator
+        ):
+            bucket = CurrencyWithTaxAccumulator(
+                bucket.currency, bucket.amount, bucket.amount
+            )
+            self._buckets[bucket.currency] = bucket
+        return bucket
+
+    def _new_bucket(self, value: Money) -> Bucket:
+        code = intern_currency(value.currency)
+        bucket: Bucket
+        if isinstance(value, CurrencyWithTax):
+            bucket = CurrencyWithTaxAccumulator(code)
+        elif isinstance(value, Currency):
+            bucket = CurrencyAccumulator(code)
+        else:
+            raise TypeError(
+                f"MultiCurrencyTotal requires Currency or CurrencyWithTax, got {value!r}"
+            )
+        self._buckets[code] = bucket
+        return bucket
+
+    def add(self, value: Money) -> None:
+        """Add value to the total of its currency."""
+        self._bucket(value).add(value)
+
+    def subtract(self, value: Money) -> None:
+        """Subtract value from the total of its currency."""
+        self._bucket(value).subtract(value)
+
+    def update(self, values: Iterable[Money]) -> None:
+        """Add all values."""
+        for value in values:
+            self._bucket(value).add(value)
+
+    def merge(self, other: "MultiCurrencyTotal") -> None:
+        """Add every total of other to this one."""
+        if not isinstance(other, MultiCurrencyTotal):
+            raise TypeError(f"cannot merge {type(other).__name__!r} into totals")
+        for code, theirs in other._buckets.items():
+            ours = self._buckets.get(code)
+            if ours is None:
+                if isinstance(theirs, CurrencyWithTaxAccumulator):
+                    ours = CurrencyWithTaxAccumulator(code, theirs.net, theirs.gross)
+                else:
+                    ours = CurrencyAccumulator(code, theirs.amount)
+                self._buckets[code] = ours
+                continue
+            if isinstance(theirs, CurrencyWithTaxAccumulator) and isinstance(
+                ours, CurrencyAccumulator
+            ):
+                ours = CurrencyWithTaxAccumulator(code, ours.amount, ours.amount)
+                self._buckets[code] = ours
+            ours.add(theirs)
+
+    @classmethod
+    def merge_all(cls, totals: Iterable["MultiCurrencyTotal"]) -> "MultiCurrencyTotal":
+        """Return a new total combining many totals, e.g. one per worker."""
+        result = cls()
+        for total in totals:
+            result.merge(total)
+        return result
+
+    def __iadd__(self, other: Union[Money, "MultiCurrencyTotal"]):
+        if isinstance(other, MultiCurrencyTotal):
+            self.merge(other)
+        else:
+            self.add(other)
+        return self
+
+    def __isub__(self, other: Money):
+        self.subtract(other)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buckets)
+
+    def __contains__(self, code: object) -> bool:
+        return code in self._buckets
+
+    def __getitem__(self, code: str) -> Money:
+        return self._buckets[code].freeze()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MultiCurrencyTotal):
+            return self._buckets == other._buckets
+        return False
+
+    __hash__ = None  # type: ignore
+
+    def __str__(self) -> str:
+        totals = ", ".join(str(total) for total in self.totals().values())
+        return f"MultiCurrencyTotal({totals})"
+
+    def totals(self) -> Dict[str, Money]:
+        """Return the total of every currency as a Currency or CurrencyWithTax."""
+        return {code: bucket.freeze() for code, bucket in self._buckets.items()}
+
+    def to_dict(self) -> Serialized:
+        """Return the totals as JSON-friendly strings.
+
+        A Currency total is stored as its amount, a CurrencyWithTax total as
+        [net, gross].
+        """
+        result: Serialized = {}
+        for code, bucket in self._buckets.items():
+            if isinstance(bucket, CurrencyWithTaxAccumulator):
+                result[code] = [str(bucket.net), str(bucket.gross)]
+            else:
+                result[code] = str(bucket.amount)
+        return result
+
+    @classmethod
+    def from_dict(cls, data: Serialized) -> "MultiCurrencyTotal":
+        """Rebuild totals from `to_dict` output."""
+        total = cls()
+        for code, amounts in data.items():
+            code = intern_currency(code)
+            if isinstance(amounts, str):
+                total._buckets[code] = CurrencyAccumulator(code, Decimal(amounts))
+            else:
+                net, gross = amounts
+                total._buckets[code] = CurrencyWithTaxAccumulator(
+                    code, Decimal(net), Decimal(gross)
+                )
+        return total
+
+    def __reduce__(self):
+        return type(self).from_dict, (self.to_dict(),)
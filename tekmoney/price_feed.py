@@ -0,0 +1,128 @@
+import csv
+import os
+from array import array
+from typing import Dict, Iterable, Iterator, Optional, Set, TextIO, Tuple, Union
+
+from .currency_array import CurrencyArray
+from .currency_info import get_currency_precision, intern_currency, is_known_currency
+from .minor_units import parse_minor_units
+
+Column = Union[str, int]
+Source = Union[str, "os.PathLike[str]", TextIO]
+
+
+def _column_index(column: Column, header: Optional[list]) -> int:
+    if isinstance(column, int):
+        return column
+    if header is None or column not in header:
+        raise ValueError(f"price feed has no {column!r} column")
+    return header.index(column)
+
+
+def read_price_batches(
+    source: Source,
+    *,
+    amount_column: Column = "amount",
+    currency_column: Optional[Column] = "currency",
+    currency: Optional[str] = None,
+    currencies: Optional[Iterable[str]] = None,
+    delimiter: str = ",",
+    batch_size: int = 65536,
+    encoding: str = "utf-8",
+) -> Iterator[CurrencyArray]:
+    """Read a CSV or delimited text price feed as CurrencyArray batches.
+
+    source is a path or an open text file. Columns are given by header name,
+    which makes the first row a header, or by index. Feeds without a currency
+    column set currency_column to None and pass the code as currency.
+
+    Amounts are parsed straight into minor units of their currency. Raises
+    ValueError naming the line for malformed amounts, amounts with more
+    decimal places than the currency has, and codes that are neither in
+    currencies nor registered or ISO 4217 codes.
+
+    The feed is read line by line. Every batch holds up to batch_size rows
+    of one currency, so memory is bounded by batch_size rows per currency.
+    Batches of a currency keep the feed order; the last partial batch of
+    each currency is yielded at the end, in order of first appearance.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    if currency_column is None and currency is None:
+        raise ValueError("either currency_column or currency is required")
+    allowed: Optional[Set[str]] = None
+    if currencies is not None:
+        allowed = {intern_currency(code) for code in currencies}
+    options = (amount_column, currency_column, currency, allowed, delimiter, batch_size)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, newline="", encoding=encoding) as f:
+            yield from _read(f, *options)
+    else:
+        yield from _read(source, *options)
+
+
+def _read(
+    f: TextIO,
+    amount_column: Column,
+    currency_column: Optional[Column],
+    currency: Optional[str],
+    allowed: Optional[Set[str]],
+    delimiter: str,
+    batch_size: int,
+) -> Iterator[CurrencyArray]:
+    reader = csv.reader(f, delimiter=delimiter)
+    header = None
+    if isinstance(amount_column, str) or isinstance(currency_column, str):
+        header = [name.strip() for name in next(reader, [])]
+    amount_index = _column_index(amount_column, header)
+    currency_index = None
+    if currency_column is not None:
+        currency_index = _column_index(currency_column, header)
+
+    # raw code text -> (interned code, precision), validated once per code
+    codes: Dict[str, Tuple[str, int]] = {}
+    pending: Dict[str, array] = {}
+
+    def code_of(text: str) -> Tuple[str, int]:
+        code = text.strip().upper()
+        known = code in allowed if allowed is not None else is_known_currency(code)
+        if not code or not known:
+            raise ValueError(f"line {reader.line_num}: unknown currency {text!r}")
+        code = intern_currency(code)
+        codes[text] = code, get_currency_precision(code)
+        return codes[text]
+
+    fixed: Optional[Tuple[str, int]] = None
+    if currency_index is None:
+        fixed = code_of(currency or "")
+    for row in reader:
+        if not row:
+            continue
+        try:
+            amount = row[amount_index]
+            text = row[currency_index] if currency_index is not None else ""
+        except IndexError:
+            raise ValueError(
+                f"line {reader.line_num}: expected more than {len(row)} columns"
+            ) from None
+        code, precision = fixed or codes.get(text) or code_of(text)
+        try:
+            units = parse_minor_units(amount, precision)
+        except ValueError as e:
+            raise ValueError(f"line {reader.line_num}: {e}") from None
+        buffer = pending.get(code)
+        if buffer is None:
+            buffer = pending[code] = array("q")
+        try:
+            buffer.append(units)
+        except OverflowError:
+            raise ValueError(
+                f"line {reader.line_num}: {amount.strip()} does not fit in 64 bits"
+                f" of minor units"
+            ) from None
+        if len(buffer) >= batch_size:
+            yield CurrencyArray(buffer, code, precision)
+            pending[code] = array("q")
+    for code, buffer in pending.items():
+        if buffer:
+            yield CurrencyArray(buffer, code, get_currency_precision(code))
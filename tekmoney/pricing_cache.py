@@ -0,0 +1,177 @@
+import threading
+import weakref
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Any, Callable, Hashable, NamedTuple, Union
+
+from .currency import Currency
+from .currency_range import CurrencyRange
+from .currency_range_tax import CurrencyRangeTax
+from .currency_tax import CurrencyWithTax
+from .discount import fixed_discount, fractional_discount, percentage_discount
+from .flat_tax import flat_tax
+
+Dint = Union[Decimal, int]
+
+
+def _exact(value) -> Hashable:
+    """Return a key for value that also holds its types and exponents.
+
+    Equal values like Decimal("10") and Decimal("10.00"), or a Currency and
+    a MinorUnitCurrency, give results of other exponents or types.
+    """
+    if isinstance(value, Currency):
+        return type(value), str(value.amount), value.currency
+    if isinstance(value, CurrencyWithTax):
+        return type(value), _exact(value.net), _exact(value.gross)
+    if isinstance(value, (CurrencyRange, CurrencyRangeTax)):
+        return type(value), _exact(value.start), _exact(value.stop)
+    if isinstance(value, Decimal):
+        return Decimal, str(value)
+    return type(value), value
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a PricingCache"""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """Bounded mapping that evicts the least recently used entry"""
+
+    __slots__ = (
+        "maxsize",
+        "hits",
+        "misses",
+        "evictions",
+        "_data",
+        "_lock",
+        "__weakref__",
+    )
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the value stored for key, calling compute on a miss."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+        # compute outside of the lock, other threads may look up other keys
+        value = compute()
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+class PricingCache:
+    """Memoizes flat_tax and the discount functions.
+
+    Results are keyed on the value, the rate or discount and the flags,
+    down to their types and exponents, so a cached result is what an
+    uncached call gives. A shared cache (the default) is
+    used by all threads; with per_thread=True every thread gets its own
+    cache of maxsize entries, which is dropped when the thread exits, and
+    cache_info adds up the statistics of the live ones.
+    """
+
+    def __init__(self, maxsize: int = 4096, *, per_thread: bool = False) -> None:
+        LRUCache(maxsize)  # validate maxsize early
+        self.maxsize = maxsize
+        self.per_thread = per_thread
+        # only the thread-local storage holds per-thread caches, so they go
+        # away with their threads
+        self._caches: "weakref.WeakSet[LRUCache]" = weakref.WeakSet()
+        self._caches_lock = threading.Lock()
+        self._local = threading.local()
+        self._shared = None if per_thread else self._new_cache()
+
+    def _new_cache(self) -> LRUCache:
+        cache = LRUCache(self.maxsize)
+        with self._caches_lock:
+            self._caches.add(cache)
+        return cache
+
+    def _cache(self) -> LRUCache:
+        if self._shared is not None:
+            return self._shared
+        try:
+            return self._local.cache
+        except AttributeError:
+            cache = self._local.cache = self._new_cache()
+            return cache
+
+    def flat_tax(self, base, tax_rate: Decimal, *, keep_gross=False):
+        """Cached `tekmoney.flat_tax.flat_tax`."""
+        key = ("flat_tax", _exact(base), _exact(tax_rate), keep_gross)
+        return self._cache().get(
+            key, lambda: flat_tax(base, tax_rate, keep_gross=keep_gross)
+        )
+
+    def fixed_discount(self, base, discount: Currency):
+        """Cached `tekmoney.discount.fixed_discount`."""
+        key = ("fixed_discount", _exact(base), _exact(discount))
+        return self._cache().get(key, lambda: fixed_discount(base, discount))
+
+    def fractional_discount(self, base, fraction: Decimal, *, from_gross=True):
+        """Cached `tekmoney.discount.fractional_discount`."""
+        key = ("fractional_discount", _exact(base), _exact(fraction), from_gross)
+        return self._cache().get(
+            key, lambda: fractional_discount(base, fraction, from_gross=from_gross)
+        )
+
+    def percentage_discount(self, base, percentage: Dint, *, from_gross=True):
+        """Cached `tekmoney.discount.percentage_discount`."""
+        key = ("percentage_discount", _exact(base), _exact(percentage), from_gross)
+        return self._cache().get(
+            key, lambda: percentage_discount(base, percentage, from_gross=from_gross)
+        )
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit, miss and eviction counts summed over all caches."""
+        with self._caches_lock:
+            caches = list(self._caches)
+        return CacheInfo(
+            hits=sum(cache.hits for cache in caches),
+            misses=sum(cache.misses for cache in caches),
+            evictions=sum(cache.evictions for cache in caches),
+            maxsize=self.maxsize,
+            currsize=sum(len(cache) for cache in caches),
+        )
+
+    def clear(self) -> None:
+        """Drop all cached results and reset the statistics."""
+        with self._caches_lock:
+            caches = list(self._caches)
+        for cache in caches:
+            cache.clear()
@@ -0,0 +1,152 @@
+import operator
+from decimal import Decimal
+from typing import Iterable, Optional, Union
+
+from .currency import Currency, _new_currency
+from .currency_array import CurrencyArray
+from .currency_range import CurrencyRange
+from .currency_range_tax import CurrencyRangeTax
+from .currency_tax import CurrencyWithTax
+from .currency_tax_array import CurrencyWithTaxArray
+from .minor_units import from_minor_units
+
+Price = Union[Currency, CurrencyWithTax]
+Batch = Union[CurrencyArray, CurrencyWithTaxArray]
+
+
+class RangeAggregator:
+    """Tracks the cheapest and the most expensive of many prices.
+
+    Values are Currency or CurrencyWithTax objects of one currency, or
+    CurrencyArray and CurrencyWithTaxArray batches of them. Every value is
+    compared once by its raw amount (gross for CurrencyWithTax, like their
+    comparisons), and only references to the current extremes are kept, so
+    prices can be added in any number of steps. Ties keep the value seen
+    first, like `min` and `max`.
+    """
+
+    __slots__ = ("kind", "currency", "low", "high", "count")
+
+    def __init__(self, values: Union[Iterable[Price], Batch, None] = None) -> None:
+        self.kind: Optional[type] = None
+        self.currency: Optional[str] = None
+        self.low: Optional[Price] = None
+        self.high: Optional[Price] = None
+        self.count = 0
+        if values is not None:
+            self.update(values)
+
+    def _start(self, value: Price) -> None:
+        if isinstance(value, CurrencyWithTax):
+            self.kind = CurrencyWithTax
+        elif isinstance(value, Currency):
+            self.kind = Currency
+        else:
+            raise TypeError(
+                f"RangeAggregator requires Currency or CurrencyWithTax, got {value!r}"
+            )
+        self.currency = value.currency
+        self.low = self.high = value
+        self.count = 1
+
+    def add(self, value: Price) -> None:
+        """Take value into account."""
+        self.update((value,))
+
+    def update(self, values: Union[Iterable[Price], Batch]) -> None:
+        """Take all values, or all rows of a batch, into account."""
+        if isinstance(values, (CurrencyArray, CurrencyWithTaxArray)):
+            self._update_batch(values)
+            return
+        iterator = iter(values)
+        if self.kind is None:
+            for value in iterator:
+                self._start(value)
+                break
+            else:
+                return
+        kind, code = self.kind, self.currency
+        low, high = self.low, self.high
+        count = self.count
+        if kind is Currency:
+            low_amount, high_amount = low.amount, high.amount  # type: ignore
+            for value in iterator:
+                if not isinstance(value, Currency):
+                    raise TypeError(f"cannot compare Currency with {value!r}")
+                if value.currency != code:
+                    raise ValueError(f"cannot compare {code} with {value.currency}")
+                amount = value.amount
+                if amount < low_amount:
+                    low, low_amount = value, amount
+                elif amount > high_amount:
+                    high, high_amount = value, amount
+                count += 1
+        else:
+            low_amount, high_amount = low.gross.amount, high.gross.amount  # type: ignore
+            for value in iterator:
+                if not isinstance(value, CurrencyWithTax):
+                    raise TypeError(f"cannot compare CurrencyWithTax with {value!r}")
+                if value.currency != code:
+                    raise ValueError(f"cannot compare {code} with {value.currency}")
+                amount = value.gross.amount
+                if amount < low_amount:
+                    low, low_amount = value, amount
+                elif amount > high_amount:
+                    high, high_amount = value, amount
+                count += 1
+        self.low, self.high, self.count = low, high, count
+
+    def _update_batch(self, batch: Batch) -> None:
+        """Find the extremes of a batch on its int64 columns."""
+        if not len(batch):
+            return
+        kind: type = Currency
+        if isinstance(batch, CurrencyWithTaxArray):
+            kind, units = CurrencyWithTax, batch.gross.units
+        else:
+            units = batch.units
+        if self.kind is not None and self.kind is not kind:
+            raise TypeError(
+                f"cannot compare {self.kind.__name__} with {type(batch).__name__}"
+            )
+        if self.currency is not None and batch.currency != self.currency:
+            raise ValueError(f"cannot compare {self.currency} with {batch.currency}")
+        count = self.count
+        low = self._row(batch, operator.indexOf(units, min(units)))
+        high = self._row(batch, operator.indexOf(units, max(units)))
+        self.update((low, high))
+        self.count = count + len(batch)
+
+    @staticmethod
+    def _row(batch: Batch, index: int) -> Price:
+        if isinstance(batch, CurrencyWithTaxArray):
+            net, gross = batch.net, batch.gross
+            return CurrencyWithTax(
+                net=_new_currency(
+                    from_minor_units(net.units[index], net.precision), net.currency
+                ),
+                gross=_new_currency(
+                    from_minor_units(gross.units[index], gross.precision),
+                    gross.currency,
+                ),
+            )
+        amount: Decimal = from_minor_units(batch.units[index], batch.precision)
+        return _new_currency(amount, batch.currency)
+
+    def result(self) -> Union[CurrencyRange, CurrencyRangeTax]:
+        """Return the range from the lowest to the highest price.
+
+        Raises ValueError if no price was added.
+        """
+        if self.kind is None:
+            raise ValueError("cannot build a range without prices")
+        if self.kind is CurrencyWithTax:
+            return CurrencyRangeTax(self.low, self.high)  # type: ignore
+        return CurrencyRange(self.low, self.high)  # type: ignore
+
+
+def price_range(
+    values: Union[Iterable[Price], Batch],
+) -> Union[CurrencyRange, CurrencyRangeTax]:
+    """Return the range spanning values in a single pass."""
+    return RangeAggregator(values).result()
@@ -0,0 +1,238 @@
+from array import array
+from bisect import bisect_right
+from decimal import Decimal
+from math import gcd
+from typing import Dict, Iterable, List, Tuple, TypeVar, Union
+
+from .currency import Currency, _new_currency
+from .currency_array import CurrencyArray
+from .currency_info import get_currency_precision, intern_currency
+from .currency_range import CurrencyRange
+from .currency_range_tax import CurrencyRangeTax
+from .currency_tax import CurrencyWithTax, _new_currency_with_tax
+from .currency_tax_array import CurrencyWithTaxArray
+from .minor_units import as_ratio, from_minor_units, required_precision, to_minor_units
+
+Dint = Union[Decimal, int]
+Bracket = Tuple[Union[Currency, Dint], Dint]
+
+T = TypeVar("T", Currency, CurrencyWithTax, CurrencyRange, CurrencyRangeTax)
+
+# thresholds, then per bracket the slope and offset of the gross, then twice
+# the denominator that turns gross numerators into minor units of the currency
+Compiled = Tuple[List[int], List[int], List[int], int]
+
+
+def _rounded(numerator: int, twice_denominator: int) -> int:
+    """Divide by half of twice_denominator with ROUND_HALF_UP."""
+    if numerator >= 0:
+        return (2 * numerator + twice_denominator // 2) // twice_denominator
+    return -((twice_denominator // 2 - 2 * numerator) // twice_denominator)
+
+
+class TaxSchedule:
+    """Tax rates by price bracket, compiled once for bisect lookups.
+
+    brackets are (threshold, rate) pairs, and a rate applies from its
+    threshold up to the next one. Amounts below the first threshold are
+    not taxed:
+
+        schedule = TaxSchedule("USD", [(0, Decimal("0.05")), (110, Decimal("0.0875"))])
+
+    When progressive, every rate applies only to the part of an amount in
+    its bracket. Otherwise the rate of the bracket an amount falls in
+    applies to the whole amount, which then gives what `flat_tax` gives
+    with that rate.
+
+    Like `flat_tax`, the net is kept and the gross is the net plus the tax,
+    rounded once to the currency precision with ROUND_HALF_UP. Values that
+    already have a tax are taxed again on their gross.
+    """
+
+    __slots__ = (
+        "currency",
+        "thresholds",
+        "rates",
+        "progressive",
+        "_bounds",
+        "_scale",
+        "_compiled",
+    )
+
+    def __init__(
+        self, currency: str, brackets: Iterable[Bracket], *, progressive: bool = True
+    ) -> None:
+        self.currency = intern_currency(currency)
+        thresholds: List[Currency] = []
+        rates: List[Decimal] = []
+        for threshold, rate in brackets:
+            if isinstance(threshold, Currency):
+                if threshold.currency != self.currency:
+                    raise ValueError(
+                        f"Different currencies not allowed: {self.currency}"
+                        f" and {threshold.currency}"
+                    )
+                threshold = threshold.amount
+            if not isinstance(threshold, (int, Decimal)) or isinstance(threshold, bool):
+                raise TypeError(f"unsupported threshold {threshold!r}")
+            if not isinstance(rate, (int, Decimal)) or isinstance(rate, bool):
+                raise TypeError(f"unsupported tax rate {rate!r}")
+            if not Decimal(threshold).is_finite() or not Decimal(rate).is_finite():
+                raise ValueError(f"bracket ({threshold}, {rate}) is not finite")
+            if rate < 0:
+                raise ValueError(f"tax rate must not be negative, got {rate}")
+            if thresholds and threshold <= thresholds[-1].amount:
+                raise ValueError(
+                    f"thresholds must increase, got {threshold}"
+                    f" after {thresholds[-1].amount}"
+                )
+            thresholds.append(_new_currency(Decimal(threshold), self.currency))
+            rates.append(Decimal(rate))
+        if not thresholds:
+            raise ValueError("a tax schedule requires at least one bracket")
+        self.thresholds: Tuple[Currency, ...] = tuple(thresholds)
+        self.rates: Tuple[Decimal, ...] = tuple(rates)
+        self.progressive = progressive
+        # threshold amounts for rate lookups
+        self._bounds: List[Decimal] = [t.amount for t in self.thresholds]
+        # decimal places that hold the currency precision and every threshold
+        self._scale = max(
+            [get_currency_precision(self.currency)]
+            + [required_precision(t.amount) for t in self.thresholds]
+        )
+        self._compiled: Dict[int, Compiled] = {}
+
+    def __repr__(self) -> str:
+        brackets = [
+            (str(t.amount), str(r)) for t, r in zip(self.thresholds, self.rates)
+        ]
+        return (
+            f"TaxSchedule({self.currency!r}, {brackets!r},"
+            f" progressive={self.progressive!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self.rates)
+
+    def rate(self, amount: Union[Currency, Dint]) -> Decimal:
+        """Return the rate of the bracket amount falls in, 0 below the first."""
+        if isinstance(amount, Currency):
+            self._check_currency(amount.currency)
+            amount = amount.amount
+        index = bisect_right(self._bounds, amount)
+        return self.rates[index - 1] if index else Decimal(0)
+
+    def _check_currency(self, currency: str) -> None:
+        if currency != self.currency:
+            raise ValueError(
+                f"tax schedule for {self.currency} cannot tax {currency} values"
+            )
+
+    def _compile(self, scale: int) -> Compiled:
+        """Compile the brackets for amounts in units of 10 ** -scale.
+
+        With every rate written as r / D for a common D, the gross of an
+        amount u in bracket i is (u * (D + r_i) + offset_i) / D, where the
+        offset adds the tax of the brackets below in progressive schedules.
+        Index 0 stands for amounts below the first threshold.
+        """
+        compiled = self._compiled.get(scale)
+        if compiled is not None:
+            return compiled
+        ratios = [as_ratio(rate) for rate in self.rates]
+        common = 1
+        for _, denominator in ratios:
+            common = common * denominator // gcd(common, denominator)
+        thresholds = [to_minor_units(t.amount, scale) for t in self.thresholds]
+        slopes = [common]
+        offsets = [0]
+        tax_below = 0
+        for i, (numerator, denominator) in enumerate(ratios):
+            rate = numerator * (common // denominator)
+            slopes.append(common + rate)
+            if self.progressive:
+                offsets.append(tax_below - thresholds[i] * rate)
+                if i + 1 < len(thresholds):
+                    tax_below += (thresholds[i + 1] - thresholds[i]) * rate
+            else:
+                offsets.append(0)
+        shift = scale - get_currency_precision(self.currency)
+        compiled = (thresholds, slopes, offsets, 2 * common * 10**shift)
+        self._compiled[scale] = compiled
+        return compiled
+
+    def _gross(self, value: Currency) -> Currency:
+        self._check_currency(value.currency)
+        amount = value.amount
+        exponent = amount.as_tuple().exponent
+        if not isinstance(exponent, int):
+            raise ValueError(f"cannot tax {value}")
+        scale = max(self._scale, -exponent)
+        thresholds, slopes, offsets, twice_denominator = self._compile(scale)
+        units = int(amount.scaleb(scale))
+        i = bisect_right(thresholds, units)
+        gross = _rounded(units * slopes[i] + offsets[i], twice_denominator)
+        precision = get_currency_precision(self.currency)
+        return _new_currency(from_minor_units(gross, precision), self.currency)
+
+    def _taxed(self, value: Currency) -> CurrencyWithTax:
+        return _new_currency_with_tax(value, self._gross(value))
+
+    def _taxed_again(self, value: CurrencyWithTax) -> CurrencyWithTax:
+        return _new_currency_with_tax(value.net, self._gross(value.gross))
+
+    def __call__(self, base: T) -> Union[CurrencyWithTax, CurrencyRangeTax]:
+        return self.apply(base)
+
+    def apply(self, base: T) -> Union[CurrencyWithTax, CurrencyRangeTax]:
+        """Tax a Currency, CurrencyWithTax, CurrencyRange or CurrencyRangeTax.
+
+        Batches are passed on to `apply_batch`.
+        """
+        if isinstance(base, (CurrencyArray, CurrencyWithTaxArray)):
+            return self.apply_batch(base)  # type: ignore
+        if isinstance(base, CurrencyWithTax):
+            return self._taxed_again(base)
+        if isinstance(base, Currency):
+            return self._taxed(base)
+        if isinstance(base, CurrencyRange):
+            return CurrencyRangeTax(self._taxed(base.start), self._taxed(base.stop))
+        if isinstance(base, CurrencyRangeTax):
+            return CurrencyRangeTax(
+                self._taxed_again(base.start), self._taxed_again(base.stop)
+            )
+        raise TypeError(f"Unknown base for TaxSchedule: {base!r}")
+
+    def apply_batch(
+        self, values: Union[CurrencyArray, CurrencyWithTaxArray]
+    ) -> CurrencyWithTaxArray:
+        """Tax every row of a columnar batch, like `apply` taxes one value.
+
+        Every row is one bisect of the compiled thresholds and one integer
+        division; no Decimal or Currency objects are created.
+        """
+        if isinstance(values, CurrencyWithTaxArray):
+            net, base = values.net, values.gross
+        elif isinstance(values, CurrencyArray):
+            net = base = values
+        else:
+            raise TypeError(f"Unknown values for TaxSchedule: {values!r}")
+        self._check_currency(base.currency)
+        scale = max(self._scale, base.precision)
+        thresholds, slopes, offsets, twice_denominator = self._compile(scale)
+        units: Iterable[int] = base.units
+        if scale != base.precision:
+            factor = 10 ** (scale - base.precision)
+            units = [u * factor for u in base.units]
+        gross = array("q")
+        append = gross.append
+        half = twice_denominator // 2
+        for u in units:
+            i = bisect_right(thresholds, u)
+            numerator = u * slopes[i] + offsets[i]
+            if numerator >= 0:
+                append((2 * numerator + half) // twice_denominator)
+            else:
+                append(_rounded(numerator, twice_denominator))
+        precision = get_currency_precision(self.currency)
+        return CurrencyWithTaxArray(net, CurrencyArray(gross, self.currency, precision))
@@ -1,10 +1,135 @@
 import functools
 import operator
-from typing import Iterable, TypeVar
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from .currency import Currency, _new_currency
+from .currency_range import CurrencyRange
+from .currency_range_tax import CurrencyRangeTax
+from .currency_tax import CurrencyWithTax
 
 T = TypeVar("T")
 
+_WIDTH = {Currency: 1, CurrencyWithTax: 2, CurrencyRange: 2, CurrencyRangeTax: 4}
+
+
+def _kind_of(value: object) -> type:
+    """Return which of the four money types value is."""
+    for kind in (Currency, CurrencyWithTax, CurrencyRange, CurrencyRangeTax):
+        if isinstance(value, kind):
+            return kind
+    raise TypeError(f"tek_sum() can't sum {type(value).__name__!r} values")
+
+
+def _parts(kind: type, value) -> Tuple[Decimal, ...]:
+    """Return the raw amounts adding value to a sum of kind adds.
+
+    Follows the rules of the __add__ methods, e.g. a Currency added to a
+    CurrencyWithTax is added to both net and gross.
+    """
+    if isinstance(value, Currency):
+        return (value.amount,) * _WIDTH[kind]
+    if kind is CurrencyWithTax and isinstance(value, CurrencyWithTax):
+        return value.net.amount, value.gross.amount
+    if kind is CurrencyRange and isinstance(value, CurrencyRange):
+        return value.start.amount, value.stop.amount
+    if kind is CurrencyRangeTax:
+        if isinstance(value, CurrencyWithTax):
+            return (value.net.amount, value.gross.amount) * 2
+        if isinstance(value, CurrencyRange):
+            start, stop = value.start.amount, value.stop.amount
+            return start, start, stop, stop
+        if isinstance(value, CurrencyRangeTax):
+            return (
+                value.start.net.amount,
+                value.start.gross.amount,
+                value.stop.net.amount,
+                value.stop.gross.amount,
+            )
+    raise TypeError(
+        f"unsupported operand type(s) for +: {kind.__name__!r}"
+        f" and {type(value).__name__!r}"
+    )
+
+
+class _Sum:
+    """Running sum of raw amounts, turned into a money object once at the end"""
+
+    __slots__ = ("kind", "currency", "totals")
+
+    def __init__(self, first) -> None:
+        self.kind = _kind_of(first)
+        self.currency = first.currency
+        self.totals: List[Decimal] = list(_parts(self.kind, first))
+
+    def add(self, value) -> None:
+        parts = _parts(self.kind, value)
+        if value.currency != self.currency:
+            raise ValueError(f"cannot add {self.currency} to {value.currency}")
+        totals = self.totals
+        for index, amount in enumerate(parts):
+            totals[index] += amount
+
+    def result(self):
+        code = self.currency
+        totals = [_new_currency(amount, code) for amount in self.totals]
+        if self.kind is Currency:
+            return totals[0]
+        if self.kind is CurrencyWithTax:
+            return CurrencyWithTax(net=totals[0], gross=totals[1])
+        if self.kind is CurrencyRange:
+            return CurrencyRange(totals[0], totals[1])
+        return CurrencyRangeTax(
+            CurrencyWithTax(net=totals[0], gross=totals[1]),
+            CurrencyWithTax(net=totals[2], gross=totals[3]),
+        )
+
+
+def tek_sum(values: Iterable[T], start: Optional[T] = None) -> T:
+    """Return the sum of values in iterable
+
+    Amounts of money types are accumulated as Decimals and a single result is
+    created at the end, so the result is a plain Currency even for Currency
+    subclasses. Other values, like batches, are added with +. start is added
+    first and returned for an empty iterable.
+    """
+    iterator = iter(values)
+    if start is None:
+        try:
+            start = next(iterator)
+        except StopIteration:
+            raise TypeError("tek_sum() of empty iterable with no start value")
+    if not isinstance(start, tuple(_WIDTH)):
+        return functools.reduce(operator.add, iterator, start)
+    total = _Sum(start)
+    if total.kind is Currency:
+        # plain prices are the common case, keep the loop free of indirection
+        code = total.currency
+        amount = total.totals[0]
+        for value in iterator:
+            if not isinstance(value, Currency):
+                raise TypeError(
+                    f"unsupported operand type(s) for +: 'Currency'"
+                    f" and {type(value).__name__!r}"
+                )
+            if value.currency != code:
+                raise ValueError(f"cannot add {code} to {value.currency}")
+            amount += value.amount
+        total.totals[0] = amount
+    else:
+        for value in iterator:
+            total.add(value)
+    return total.result()
+
 
-def tek_sum(values: Iterable[T]) -> T:
-    """ Return the sum of values in iterable"""
-    return functools.reduce(operator.add, values)
+def sum_by_currency(values: Iterable[T]) -> Dict[str, T]:
+    """Return the sum of values per currency code, in a single pass."""
+    totals: Dict[str, _Sum] = {}
+    for value in values:
+        total = totals.get(getattr(value, "currency", ""))
+        if total is None:
+            total = _Sum(value)
+            totals[total.currency] = total
+        else:
+            total.add(value)
+    return {code: total.result() for code, total in totals.items()}
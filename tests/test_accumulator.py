@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.accumulator import CurrencyAccumulator, CurrencyWithTaxAccumulator
+from tekmoney.currency import Currency
+from tekmoney.currency_tax import CurrencyWithTax
+
+
+def taxed(net, gross, code="EUR"):
+    return CurrencyWithTax(Currency(net, code), Currency(gross, code))
+
+
+def test_currency_accumulator():
+    total = CurrencyAccumulator("usd")
+    same = total
+    total += Currency(Decimal("10.25"), "USD")
+    total += Currency(5, "USD")
+    total -= Currency(Decimal("0.25"), "USD")
+    assert total is same
+    assert total.currency == "USD"
+    assert total.freeze() == Currency(15, "USD")
+    total.add(CurrencyAccumulator.from_currency(Currency(1, "USD")))
+    total.subtract(Currency(0, "USD"))
+    assert total == CurrencyAccumulator("USD", 16)
+
+
+def test_freeze_is_a_snapshot():
+    total = CurrencyAccumulator("EUR", 1)
+    frozen = total.freeze()
+    total += Currency(1, "EUR")
+    assert frozen == Currency(1, "EUR")
+    assert total.freeze() == Currency(2, "EUR")
+
+
+def test_currency_accumulator_errors():
+    total = CurrencyAccumulator("USD")
+    with pytest.raises(ValueError):
+        total += Currency(1, "EUR")
+    with pytest.raises(TypeError):
+        total += 1
+    with pytest.raises(TypeError):
+        total -= taxed(1, 2, "USD")
+    with pytest.raises(TypeError):
+        CurrencyAccumulator.from_currency(1)
+    with pytest.raises(TypeError):
+        hash(total)
+
+
+def test_currency_with_tax_accumulator():
+    total = CurrencyWithTaxAccumulator.from_currency(taxed(10, 12))
+    total += taxed(5, 6)
+    total += Currency(1, "EUR")
+    total -= taxed(1, 2)
+    assert total.freeze() == taxed(15, 17)
+    assert total.tax == Decimal(2)
+    total += CurrencyAccumulator("EUR", 1)
+    total -= CurrencyWithTaxAccumulator("EUR", 1, 1)
+    assert total == CurrencyWithTaxAccumulator("EUR", 15, 17)
+
+
+def test_currency_with_tax_accumulator_errors():
+    total = CurrencyWithTaxAccumulator("EUR")
+    with pytest.raises(ValueError):
+        total += taxed(1, 2, "USD")
+    with pytest.raises(TypeError):
+        total += Decimal(1)
+    with pytest.raises(TypeError):
+        CurrencyWithTaxAccumulator.from_currency(Currency(1, "EUR"))
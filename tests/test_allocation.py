@@ -0,0 +1,112 @@
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.allocation import allocate, allocate_batch
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.minor_unit_currency import MinorUnitCurrency
+
+RATIOS = [
+    [1, 1, 1],
+    [70, 30],
+    [Decimal("0.5"), Decimal("0.25"), Decimal("0.125"), 0],
+    [3, 1, 4, 1, 5, 9, 2, 6],
+    [1],
+    [Decimal("0.123457"), Decimal("0.876543")],
+]
+
+
+def _amounts(places):
+    return [Currency(amount, "USD") for amount in places]
+
+
+def test_parts_add_up_to_the_value():
+    values = _amounts(Decimal(n) / 100 for n in range(-1000, 10000, 37))
+    for ratios in RATIOS:
+        for value in values:
+            parts = allocate(value, ratios)
+            assert len(parts) == len(ratios)
+            assert sum(part.amount for part in parts) == value.amount
+            exact_total = sum(ratios)
+            for part, ratio in zip(parts, ratios):
+                share = value.amount * ratio / exact_total
+                assert abs(part.amount - share) < Decimal("0.01")
+                assert part.amount.as_tuple().exponent == -2
+
+
+def test_remainders_go_to_the_largest_shares_first():
+    assert allocate(Currency(100, "USD"), [1, 1, 1]) == _amounts(
+        [Decimal("33.34"), Decimal("33.33"), Decimal("33.33")]
+    )
+    assert allocate(Currency(Decimal("0.05"), "USD"), [1, 3]) == _amounts(
+        [Decimal("0.01"), Decimal("0.04")]
+    )
+    assert allocate(Currency(Decimal("0.02"), "USD"), [1, 0, 1, 1]) == _amounts(
+        [Decimal("0.01"), 0, Decimal("0.01"), 0]
+    )
+    assert allocate(Currency(-100, "USD"), [1, 1, 1]) == _amounts(
+        [Decimal("-33.34"), Decimal("-33.33"), Decimal("-33.33")]
+    )
+    assert allocate(Currency(100, "JPY"), [1, 1, 1]) == [
+        Currency(34, "JPY"),
+        Currency(33, "JPY"),
+        Currency(33, "JPY"),
+    ]
+
+
+def test_values_with_more_places_than_the_currency():
+    parts = allocate(Currency(Decimal("0.005"), "USD"), [1, 1])
+    assert parts == _amounts([Decimal("0.003"), Decimal("0.002")])
+    assert allocate(MinorUnitCurrency(1000, "USD"), [1, 1]) == _amounts([500, 500])
+
+
+def test_batches_match_single_values():
+    values = _amounts(Decimal(n) / 100 for n in range(-10000, 100000, 317))
+    totals = CurrencyArray.from_currencies(values)
+    for ratios in RATIOS:
+        columns = allocate_batch(totals, ratios)
+        assert len(columns) == len(ratios)
+        for column in columns:
+            assert column.currency == "USD" and column.precision == 2
+        rows = zip(*(column.to_currencies() for column in columns))
+        for value, parts in zip(values, rows):
+            assert list(parts) == allocate(value, ratios)
+
+
+def test_batches_keep_their_precision():
+    totals = CurrencyArray([10000, 5], "USD", precision=3)
+    columns = allocate_batch(totals, [1, 1, 1])
+    assert [list(column.units) for column in columns] == [
+        [3334, 2],
+        [3333, 2],
+        [3333, 1],
+    ]
+    assert columns[0][0] == Currency(Decimal("3.334"), "USD")
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        allocate(Currency(1, "USD"), [])
+    with pytest.raises(ValueError):
+        allocate(Currency(1, "USD"), [0, 0])
+    with pytest.raises(ValueError):
+        allocate(Currency(1, "USD"), [1, -1])
+    with pytest.raises(TypeError):
+        allocate(Currency(1, "USD"), [0.5, 0.5])
+    with pytest.raises(TypeError):
+        allocate(Decimal(1), [1, 1])
+    with pytest.raises(TypeError):
+        allocate_batch([Currency(1, "USD")], [1, 1])
+
+
+def test_invalid_ratios_are_rejected_after_equal_valid_ones():
+    value = Currency(1, "USD")
+    allocate(value, [Decimal("0.5"), Decimal("0.5")])
+    with pytest.raises(TypeError):
+        allocate(value, [0.5, 0.5])
+    allocate(value, [1, 1])
+    with pytest.raises(TypeError):
+        allocate(value, [True, True])
+    with pytest.raises(TypeError):
+        allocate_batch(CurrencyArray([100], "USD"), [True, True])
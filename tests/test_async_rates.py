@@ -0,0 +1,164 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.async_rates import (
+    AsyncRateProvider,
+    CachedRateProvider,
+    LocalAsyncRateProvider,
+)
+from tekmoney.currency import Currency
+from tekmoney.exchange import ExchangeRates, InMemoryRateProvider
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FailingProvider(AsyncRateProvider):
+    def __init__(self):
+        self.loads = 0
+
+    async def load(self):
+        self.loads += 1
+        await asyncio.sleep(0)
+        raise ConnectionError("rates service down")
+
+
+def _source(delay=0.0):
+    return LocalAsyncRateProvider(
+        InMemoryRateProvider("EUR", {"USD": "1.08"}), delay=delay
+    )
+
+
+def test_local_provider_converts():
+    source = _source()
+    price = run(source.convert(Currency(100, "EUR"), "USD"))
+    assert price == Currency(108, "USD")
+    assert isinstance(run(source.load()), ExchangeRates)
+    assert source.loads == 2
+
+
+def test_concurrent_misses_share_one_load():
+    source = _source(delay=0.01)
+    cached = CachedRateProvider(source, ttl=60)
+
+    async def requests():
+        return await asyncio.gather(*(cached.load() for _ in range(100)))
+
+    results = run(requests())
+    assert source.loads == 1
+    assert all(rates is results[0] for rates in results)
+
+
+def test_ttl_and_background_refresh():
+    clock = Clock()
+    provider = InMemoryRateProvider("EUR", {"USD": "1.08"})
+    source = LocalAsyncRateProvider(provider)
+    cached = CachedRateProvider(source, ttl=10, refresh_ahead=2, clock=clock)
+
+    async def scenario():
+        first = await cached.load()
+        clock.now = 7
+        assert await cached.load() is first
+        assert source.loads == 1
+        provider.update({"USD": "1.10"})
+        clock.now = 8.5
+        # in the refresh window the cached rates are returned at once
+        assert await cached.load() is first
+        await asyncio.sleep(0.05)
+        assert source.loads == 2
+        refreshed = await cached.load()
+        assert refreshed.rate("EUR", "USD") == Decimal("1.10")
+        clock.now = 30
+        await cached.load()
+        assert source.loads == 3
+        cached.invalidate()
+        await cached.load()
+        assert source.loads == 4
+
+    run(scenario())
+
+
+def test_cancelled_caller_does_not_cancel_load():
+    source = _source(delay=0.02)
+    cached = CachedRateProvider(source)
+
+    async def scenario():
+        first = asyncio.ensure_future(cached.load())
+        second = asyncio.ensure_future(cached.load())
+        await asyncio.sleep(0.005)
+        first.cancel()
+        rates = await second
+        assert rates.rate("EUR", "USD") == Decimal("1.08")
+        assert source.loads == 1
+
+    run(scenario())
+
+
+def test_failures():
+    source = FailingProvider()
+    cached = CachedRateProvider(source, ttl=10)
+
+    async def scenario():
+        results = await asyncio.gather(
+            *(cached.load() for _ in range(5)), return_exceptions=True
+        )
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert source.loads == 1
+        with pytest.raises(ConnectionError):
+            await cached.load()
+        assert source.loads == 2
+        assert isinstance(cached.last_error, ConnectionError)
+
+    run(scenario())
+
+
+def test_background_failure_keeps_cached_rates():
+    clock = Clock()
+    provider = InMemoryRateProvider("EUR", {"USD": "1.08"})
+    cached = CachedRateProvider(
+        LocalAsyncRateProvider(provider), ttl=10, refresh_ahead=5, clock=clock
+    )
+
+    async def scenario():
+        rates = await cached.load()
+        cached.source = FailingProvider()
+        clock.now = 6
+        assert await cached.load() is rates
+        await asyncio.sleep(0.01)
+        assert isinstance(cached.last_error, ConnectionError)
+        # the next call retries in the background
+        assert await cached.load() is rates
+        await asyncio.sleep(0.01)
+        assert cached.source.loads == 2
+
+    run(scenario())
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        CachedRateProvider(_source(), ttl=0)
+    with pytest.raises(ValueError):
+        CachedRateProvider(_source(), ttl=5, refresh_ahead=5)
+
+
+def test_providers_must_implement_load():
+    class Incomplete(AsyncRateProvider):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,27 @@
+from benchmarks.suite import SCENARIOS, compare, select
+
+
+def test_scenarios_run():
+    names = [item.name for item in SCENARIOS]
+    assert len(names) == len(set(names))
+    for item in SCENARIOS:
+        item.setup()()
+
+
+def test_select():
+    assert select([]) == SCENARIOS
+    assert {item.name for item in select(["currency.add", "tek_sum.*"])} == {
+        "currency.add",
+        "tek_sum.currency",
+        "tek_sum.currency_with_tax",
+        "tek_sum.sum_by_currency",
+    }
+
+
+def test_compare():
+    baseline = {"a": 1.0, "b": 1.0, "old": 1.0}
+    current = {"a": 1.05, "b": 1.5, "new": 1.0}
+    assert compare(baseline, current, threshold=0.1) == [
+        ("a", 1.0, 1.05, 1.05, False),
+        ("b", 1.0, 1.5, 1.5, True),
+    ]
@@ -0,0 +1,106 @@
+import mmap
+import pickle
+
+import pytest
+
+from tekmoney.catalog import PriceCatalog, write_catalog
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+from decimal import Decimal
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "prices.catalog"
+    prices = CurrencyArray([1999, 500, 12000, 1], "USD")
+    write_catalog(path, [30, 10, 20, 40], prices)
+    return path
+
+
+def test_lookups(catalog_path):
+    with PriceCatalog(catalog_path) as catalog:
+        assert len(catalog) == 4
+        assert catalog.currency == "USD"
+        assert not catalog.taxed
+        assert list(catalog.skus) == [10, 20, 30, 40]
+        assert catalog.price(30) == Currency(Decimal("19.99"), "USD")
+        assert catalog.get(20) == Currency(120, "USD")
+        assert catalog.get(25) is None
+        assert catalog.index(40) == 3
+        assert catalog.index(5) is None
+        assert 10 in catalog and 11 not in catalog
+        assert catalog[0] == Currency(5, "USD")
+        with pytest.raises(KeyError):
+            catalog.price(99)
+
+
+def test_slices_view_the_file(catalog_path):
+    catalog = PriceCatalog(catalog_path)
+    batch = catalog[1:3]
+    assert batch == CurrencyArray([12000, 1999], "USD")
+    assert isinstance(catalog.prices.units, memoryview)
+    with pytest.raises(TypeError):
+        catalog.prices.units[0] = 1
+    with pytest.raises(BufferError):
+        catalog.close()
+    assert not catalog._mmap.closed
+    assert catalog.price(10) == Currency(5, "USD")
+    assert catalog.get(40) == Currency(Decimal("0.01"), "USD")
+    assert catalog[1:3] == batch
+    del batch
+    catalog.close()
+    catalog.close()
+
+
+def test_taxed_catalog(tmp_path):
+    path = tmp_path / "taxed.catalog"
+    prices = CurrencyWithTaxArray(
+        CurrencyArray([1000, 2000], "EUR"), CurrencyArray([1230, 2460], "EUR")
+    )
+    write_catalog(path, [2, 1], prices)
+    with PriceCatalog(path) as catalog:
+        assert catalog.taxed
+        assert catalog.price(1) == CurrencyWithTax(
+            Currency(20, "EUR"), Currency(Decimal("24.60"), "EUR")
+        )
+        assert list(catalog.prices.gross.units) == [2460, 1230]
+
+
+def test_pickle_reopens_file(catalog_path):
+    with PriceCatalog(catalog_path) as catalog:
+        data = pickle.dumps(catalog)
+        assert len(data) < 200
+    with pickle.loads(data) as copy:
+        assert copy.price(10) == Currency(5, "USD")
+
+
+def test_errors(tmp_path):
+    with pytest.raises(ValueError):
+        write_catalog(tmp_path / "dup", [1, 1], CurrencyArray([1, 2], "USD"))
+    with pytest.raises(ValueError):
+        write_catalog(tmp_path / "short", [1], CurrencyArray([1, 2], "USD"))
+    with pytest.raises(TypeError):
+        write_catalog(tmp_path / "list", [1], [Currency(1, "USD")])
+    path = tmp_path / "bad"
+    path.write_bytes(b"not a catalog at all, just some bytes")
+    with pytest.raises(ValueError):
+        PriceCatalog(path)
+
+
+def test_truncated_catalog_is_unmapped(catalog_path, monkeypatch):
+    maps = []
+
+    class RecordingMap(mmap.mmap):
+        def __new__(cls, *args, **kwargs):
+            maps.append(super().__new__(cls, *args, **kwargs))
+            return maps[-1]
+
+    monkeypatch.setattr(mmap, "mmap", RecordingMap)
+    data = catalog_path.read_bytes()
+    for size in range(len(data)):
+        catalog_path.write_bytes(data[:size])
+        with pytest.raises(ValueError):
+            PriceCatalog(catalog_path)
+    assert maps and all(m.closed for m in maps)
@@ -0,0 +1,131 @@
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.codec import (
+    batch_buffers,
+    decode,
+    decode_batch,
+    decode_many,
+    encode,
+    encode_batch,
+    encode_many,
+)
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+
+
+def taxed(net, gross, code="EUR"):
+    return CurrencyWithTax(Currency(Decimal(net), code), Currency(Decimal(gross), code))
+
+
+VALUES = [
+    Currency(Decimal("10.00"), "USD"),
+    Currency(Decimal("-0.001"), "BHD"),
+    Currency(1000, "JPY"),
+    taxed("10.00", "12.30"),
+    CurrencyRange(Currency(Decimal("1.5"), "GBP"), Currency(Decimal("2.25"), "GBP")),
+    CurrencyRangeTax(taxed("1", "1.23"), taxed("2", "2.46")),
+]
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_round_trip(value):
+    data = encode(value)
+    result = decode(data)
+    assert type(result) is type(value)
+    assert result == value
+    assert decode(memoryview(data)) == value
+
+
+def test_places_are_kept():
+    assert str(decode(encode(Currency(Decimal("10.00"), "USD")))) == "10.00 USD"
+    result = decode(encode(taxed("10", "12.30")))
+    assert str(result.net.amount) == "10.00"
+
+
+def test_encode_many_shares_code_table():
+    prices = [Currency(n, ("USD", "EUR")[n % 2]) for n in range(100)]
+    data = encode_many(prices)
+    assert decode_many(data) == prices
+    assert data.count(b"USD") == 1
+    assert len(data) == 8 + 1 + 2 * 4 + 100 * 11
+    assert decode_many(encode_many([])) == []
+    assert decode(encode(Currency(1, "usd"))).currency is prices[0].currency
+
+
+def test_encode_errors():
+    with pytest.raises(TypeError):
+        encode_many([Currency(1, "USD"), taxed(1, 2)])
+    with pytest.raises(TypeError):
+        encode(Decimal(1))
+    with pytest.raises(ValueError):
+        encode(Currency(Decimal(2) ** 70, "USD"))
+    with pytest.raises(ValueError):
+        encode(Currency(Decimal("NaN"), "USD"))
+
+
+def test_decode_errors():
+    data = encode(Currency(1, "USD"))
+    with pytest.raises(ValueError, match="not a tekmoney"):
+        decode(b"XX" + data[2:])
+    with pytest.raises(ValueError, match="version"):
+        decode(data[:2] + b"\x09" + data[3:])
+    with pytest.raises(ValueError):
+        decode(data[:-1])
+    with pytest.raises(ValueError):
+        decode(data[:4])
+    with pytest.raises(ValueError):
+        decode(encode_many([Currency(1, "USD"), Currency(2, "USD")]))
+    with pytest.raises(ValueError):
+        decode_many(encode_batch(CurrencyArray([1], "USD")))
+
+
+def test_batch_round_trip_is_zero_copy():
+    batch = CurrencyArray([1999, -50, 0, 2**62], "USD")
+    data = bytearray(encode_batch(batch))
+    result = decode_batch(data)
+    assert result == batch
+    assert isinstance(result.units, memoryview)
+    data[-8:] = (7).to_bytes(8, "little")
+    assert result.units[3] == 7
+
+
+def test_taxed_batch_round_trip():
+    batch = CurrencyWithTaxArray(
+        CurrencyArray([1000, 2000], "BHD", 2), CurrencyArray([1230, 2460], "BHD", 3)
+    )
+    result = decode_batch(memoryview(encode_batch(batch)))
+    assert result == batch
+    assert result.gross.precision == 3
+    assert decode_batch(encode_batch(CurrencyArray([], "EUR"))) == CurrencyArray(
+        [], "EUR"
+    )
+
+
+def test_batch_buffers_view_columns():
+    batch = CurrencyArray([1, 2, 3], "USD")
+    buffers = batch_buffers(batch)
+    assert b"".join(buffers) == encode_batch(batch)
+    assert buffers[-1].obj is batch.units
+    sliced = batch[::2]
+    assert decode_batch(encode_batch(sliced)) == sliced
+
+
+def test_batch_errors():
+    with pytest.raises(TypeError):
+        encode_batch([Currency(1, "USD")])
+    data = encode_batch(CurrencyArray([1, 2], "USD"))
+    with pytest.raises(ValueError):
+        decode_batch(data[:-8])
+    with pytest.raises(ValueError):
+        decode_batch(encode(Currency(1, "USD")))
+
+
+@pytest.mark.parametrize("value", VALUES)
+def test_encode_matches_encode_many(value):
+    assert encode(value) == encode_many([value])
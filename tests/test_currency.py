@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 from decimal import Decimal
 from tekmoney.currency import Currency
@@ -74,3 +77,60 @@ def test_quantize():
     assert str(Currency(1, "USD").quantize(".001").amount) == "1.000"
     assert str(Currency(Decimal(1.001), "USD").quantize(".001").amount) == "1.001"
     assert str(Currency(Decimal(1.001), "USD").quantize(".01").amount) == "1.00"
+
+
+def test_hash():
+    assert hash(Currency(5, "USD")) == hash(Currency(Decimal("5.00"), "usd"))
+    assert len({Currency(5, "USD"), Currency(Decimal("5.0"), "USD")}) == 1
+    assert {Currency(5, "USD"): 1}[Currency(5, "USD")] == 1
+    assert Currency(5, "USD") not in {Currency(5, "EUR")}
+
+
+def test_immutable():
+    currency = Currency(5, "USD")
+    with pytest.raises(AttributeError):
+        currency.amount = Decimal(6)
+    with pytest.raises(AttributeError):
+        del currency.currency
+    with pytest.raises(AttributeError):
+        currency.other = 1
+    assert currency == Currency(5, "USD")
+
+
+def test_pickle():
+    currency = Currency(Decimal("5.10"), "USD")
+    assert pickle.loads(pickle.dumps(currency)) == currency
+    assert copy.deepcopy(currency) == currency
+    restored = pickle.loads(pickle.dumps(currency))
+    assert str(restored.amount) == "5.10"
+    assert restored.currency is currency.currency
+    assert b"decimal" not in pickle.dumps(currency)
+
+
+def test_copy_returns_same_object():
+    currency = Currency(5, "USD")
+    assert copy.copy(currency) is currency
+    assert copy.deepcopy(currency) is currency
+
+
+def test_codes_are_shared():
+    a = Currency(1, "usd")
+    b = Currency(2, "".join(["U", "S", "D"]))
+    assert a.currency is b.currency
+    assert (a + b).currency is a.currency
+    assert (a * 3).currency is a.currency
+    assert a.quantize().currency is a.currency
+
+
+def test_decimal_amount_is_kept():
+    amount = Decimal("1.25")
+    assert Currency(amount, "USD").amount is amount
+
+
+def test_arithmetic_result_types():
+    a = Currency(Decimal("1.5"), "USD")
+    assert type(a + a) is Currency
+    assert type((a * 2).amount) is Decimal
+    assert type((a / 2).amount) is Decimal
+    with pytest.raises(TypeError):
+        a * a
@@ -0,0 +1,136 @@
+import pickle
+from array import array
+from decimal import Decimal, ROUND_DOWN
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+
+
+def test_construction():
+    prices = CurrencyArray([1000, 1250], "usd")
+    assert prices.currency == "USD"
+    assert prices.precision == 2
+    assert prices.units.typecode == "q"
+    assert len(prices) == 2
+    assert prices[1] == Currency(Decimal("12.50"), "USD")
+    assert str(prices) == "CurrencyArray([10.00, 12.50] USD)"
+
+
+def test_buffer_not_copied():
+    units = array("q", [1, 2, 3])
+    assert CurrencyArray(units, "USD").units is units
+    view = memoryview(units)
+    assert CurrencyArray(view, "USD").units is view
+
+
+def test_round_trip():
+    values = [
+        Currency(10, "USD"),
+        Currency(Decimal("0.99"), "USD"),
+        Currency(-3, "USD"),
+    ]
+    prices = CurrencyArray.from_currencies(values)
+    assert list(prices.units) == [1000, 99, -300]
+    assert prices.to_currencies() == values
+    assert CurrencyArray.from_currencies([], "JPY").to_currencies() == []
+    with pytest.raises(ValueError):
+        CurrencyArray.from_currencies([Currency(Decimal("0.001"), "USD")])
+    with pytest.raises(ValueError):
+        CurrencyArray.from_currencies([Currency(1, "USD"), Currency(1, "EUR")])
+    with pytest.raises(ValueError):
+        CurrencyArray.from_currencies([])
+    with pytest.raises(TypeError):
+        CurrencyArray.from_currencies([1])
+
+
+def test_add_sub():
+    prices = CurrencyArray([100, 200], "USD")
+    assert prices + CurrencyArray([1, 2], "USD") == CurrencyArray([101, 202], "USD")
+    assert prices - Currency(1, "USD") == CurrencyArray([0, 100], "USD")
+    assert Currency(3, "USD") - prices == CurrencyArray([200, 100], "USD")
+    assert Currency(1, "USD") + prices == CurrencyArray([200, 300], "USD")
+    result = prices + Currency(Decimal("0.001"), "USD")
+    assert result.precision == 3
+    assert result.to_currencies() == [
+        Currency(Decimal("1.001"), "USD"),
+        Currency(Decimal("2.001"), "USD"),
+    ]
+    with pytest.raises(ValueError):
+        prices + Currency(1, "EUR")
+    with pytest.raises(ValueError):
+        prices + CurrencyArray([1], "USD")
+    with pytest.raises(TypeError):
+        prices + 1
+
+
+def test_mul_div():
+    prices = CurrencyArray([100, 333], "USD")
+    assert prices * 3 == CurrencyArray([300, 999], "USD")
+    assert 2 * prices == CurrencyArray([200, 666], "USD")
+    assert prices * [1, Decimal("0.5")] == CurrencyArray([100, 167], "USD")
+    assert prices / 3 == CurrencyArray([33, 111], "USD")
+    assert prices / CurrencyArray([50, 333], "USD") == [Decimal(2), Decimal(1)]
+    assert prices / Currency(1, "USD") == [Decimal(1), Decimal("3.33")]
+    with pytest.raises(ValueError):
+        prices * [1]
+    with pytest.raises(TypeError):
+        prices * "2"
+
+
+def test_fractional_results_match_currency():
+    values = [Currency(Decimal(n) / 100, "USD") for n in range(-150, 150, 7)]
+    prices = CurrencyArray.from_currencies(values)
+    for factor in (Decimal("1.23"), Decimal("0.005"), Decimal("-2.5")):
+        expected = [(value * factor).quantize() for value in values]
+        assert (prices * factor).to_currencies() == expected
+        expected = [(value / factor).quantize() for value in values]
+        assert (prices / factor).to_currencies() == expected
+
+
+def test_comparison():
+    prices = CurrencyArray([100, 200, 300], "USD")
+    assert (prices < Currency(2, "USD")) == [True, False, False]
+    assert (prices <= Currency(2, "USD")) == [True, True, False]
+    assert (prices > CurrencyArray([300, 100, 300], "USD")) == [False, True, False]
+    assert (prices >= CurrencyArray([300, 100, 300], "USD")) == [False, True, True]
+    assert prices == CurrencyArray([1000, 2000, 3000], "USD", precision=3)
+    assert prices != CurrencyArray([100, 200, 300], "EUR")
+    assert prices != [100, 200, 300]
+    with pytest.raises(ValueError):
+        prices < Currency(1, "EUR")
+
+
+def test_quantize():
+    prices = CurrencyArray([1005, -1005, 1004], "USD", precision=3)
+    assert prices.quantize() == CurrencyArray([101, -101, 100], "USD")
+    assert prices.quantize(".01", rounding=ROUND_DOWN) == CurrencyArray(
+        [100, -100, 100], "USD"
+    )
+    assert prices.quantize(".0001").units == array("q", [10050, -10050, 10040])
+    assert prices.quantize("1").to_currencies() == [
+        value.quantize("1") for value in prices
+    ]
+
+
+@pytest.mark.parametrize("protocol", range(2, pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle(protocol):
+    prices = CurrencyArray([1000, -1250, 3], "EUR", precision=3)
+    restored = pickle.loads(pickle.dumps(prices, protocol))
+    assert restored == prices
+    assert restored.precision == 3
+    assert pickle.loads(pickle.dumps(prices[::2], protocol)) == prices[::2]
+    view = CurrencyArray(memoryview(prices.units), "EUR", precision=3)
+    assert pickle.loads(pickle.dumps(view, protocol)) == prices
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="needs pickle protocol 5")
+def test_pickle_out_of_band():
+    prices = CurrencyArray(range(1000), "USD")
+    buffers = []
+    data = pickle.dumps(prices, 5, buffer_callback=buffers.append)
+    assert len(buffers) == 1 and len(data) < 200
+    restored = pickle.loads(data, buffers=[bytes(b.raw()) for b in buffers])
+    assert restored == prices
+    assert isinstance(restored.units, memoryview)
@@ -0,0 +1,80 @@
+from decimal import Decimal
+
+import pytest
+
+from tekmoney import currency_info
+from tekmoney.currency import Currency
+from tekmoney.currency_info import (
+    get_currency_info,
+    get_currency_precision,
+    intern_currency,
+    is_known_currency,
+    register_currency,
+    use_babel,
+)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """Restore the registered currencies and caches after a test."""
+    for name in ("_registered", "_cache", "_codes"):
+        monkeypatch.setattr(currency_info, name, dict(getattr(currency_info, name)))
+    monkeypatch.setattr(currency_info, "_use_babel", currency_info._use_babel)
+
+
+def test_iso_currency():
+    info = get_currency_info("usd")
+    assert info.code == "USD"
+    assert info.precision == 2
+    assert info.exponent == Decimal("0.01")
+    assert info.factor == 100
+    assert get_currency_info("USD") is info
+    assert get_currency_precision("JPY") == 0
+    assert str(get_currency_info("JPY").exponent) == "1"
+
+
+def test_register_currency(registry):
+    register_currency("sat8", 8)
+    assert get_currency_precision("SAT8") == 8
+    assert str(Currency(1, "SAT8").quantize().amount) == "1.00000000"
+    register_currency("PTS", 0)
+    assert str(Currency(Decimal("10.5"), "PTS").quantize().amount) == "11"
+    with pytest.raises(ValueError):
+        register_currency("BAD", -1)
+
+
+def test_babel_free_mode(registry):
+    register_currency("PTS", 0)
+    use_babel(False)
+    try:
+        assert get_currency_precision("IRR") == 2
+        assert get_currency_precision("BHD") == 3
+        assert get_currency_precision("BTC") == 2
+        assert get_currency_precision("PTS") == 0
+    finally:
+        use_babel(True)
+    assert get_currency_precision("IRR") == 0
+
+
+def test_intern_currency():
+    code = intern_currency("usd")
+    assert code == "USD"
+    assert intern_currency("USD") is code
+    assert intern_currency("".join(["U", "S", "D"])) is code
+    assert intern_currency("") is code
+
+
+def test_intern_currency_skips_unknown_codes(registry):
+    code = "".join(["x", "y", "z", "1"])
+    assert intern_currency(code) == "XYZ1"
+    assert code not in currency_info._codes
+    assert "XYZ1" not in currency_info._codes
+    register_currency("".join(["X", "Y", "Z", "2"]), 2)
+    assert intern_currency("xyz2") is intern_currency("XYZ2")
+
+
+def test_is_known_currency(registry):
+    assert is_known_currency("usd")
+    assert not is_known_currency("XYZ1")
+    register_currency("XYZ1", 4)
+    assert is_known_currency("XYZ1")
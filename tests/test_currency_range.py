@@ -1,7 +1,11 @@
+import copy
+import pickle
+
 import pytest
 
 from tekmoney.currency import Currency
 from tekmoney.currency_range import CurrencyRange
+from tekmoney.minor_unit_currency import MinorUnitCurrency
 
 
 def test_construction():
@@ -144,3 +148,29 @@ def test_str():
     price2 = Currency(30, "EUR")
     price_range = CurrencyRange(price1, price2)
     assert str(price_range) == ("CurrencyRange(10 EUR 30 EUR)")
+
+
+def test_hash_and_immutability():
+    price_range = CurrencyRange(Currency(10, "USD"), Currency(12, "USD"))
+    same = CurrencyRange(Currency(10, "USD"), Currency(12, "USD"))
+    assert hash(price_range) == hash(same)
+    assert len({price_range, same}) == 1
+    with pytest.raises(AttributeError):
+        price_range.start = Currency(1, "USD")
+
+
+def test_pickle():
+    price_range = CurrencyRange(Currency(10, "EUR"), Currency(30, "EUR"))
+    data = pickle.dumps(price_range)
+    assert pickle.loads(data) == price_range
+    assert data.count(b"EUR") == 1
+    assert copy.copy(price_range) is price_range
+    assert copy.deepcopy(price_range) is price_range
+
+
+def test_pickle_keeps_part_types():
+    price_range = CurrencyRange(Currency(10, "USD"), MinorUnitCurrency(3000, "USD"))
+    restored = pickle.loads(pickle.dumps(price_range))
+    assert restored == price_range
+    assert type(restored.start) is Currency
+    assert type(restored.stop) is MinorUnitCurrency
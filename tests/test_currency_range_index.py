@@ -0,0 +1,97 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_range_index import CurrencyRangeIndex
+from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.currency_tax import CurrencyWithTax
+
+
+def usd_range(start, stop):
+    return CurrencyRange(Currency(start, "USD"), Currency(stop, "USD"))
+
+
+def test_find_matches_contains():
+    rng = random.Random(42)
+    ranges = []
+    for _ in range(300):
+        start = rng.randint(0, 1000)
+        ranges.append(usd_range(start, start + rng.randint(0, 100)))
+    index = CurrencyRangeIndex(ranges)
+    assert len(index) == 300
+    for amount in range(-5, 1110, 7):
+        price = Currency(amount, "USD")
+        assert index.find(price) == [r for r in ranges if price in r]
+
+
+def test_overlapping():
+    rng = random.Random(7)
+    ranges = []
+    for _ in range(200):
+        start = rng.randint(0, 500)
+        ranges.append(usd_range(start, start + rng.randint(0, 60)))
+    index = CurrencyRangeIndex(ranges)
+    for low in range(0, 560, 13):
+        query = usd_range(low, low + 5)
+        expected = [
+            r for r in ranges if r.start <= query.stop and query.start <= r.stop
+        ]
+        assert index.overlapping(query) == expected
+
+
+def test_nearest():
+    bands = [usd_range(0, 10), usd_range(20, 30), usd_range(20, 25), usd_range(50, 60)]
+    index = CurrencyRangeIndex(bands)
+    assert index.nearest(Currency(5, "USD")) is bands[0]
+    assert index.nearest(Currency(22, "USD")) is bands[1]
+    assert index.nearest(Currency(14, "USD")) is bands[0]
+    assert index.nearest(Currency(15, "USD")) is bands[0]
+    assert index.nearest(Currency(16, "USD")) is bands[1]
+    assert index.nearest(Currency(41, "USD")) is bands[3]
+    assert index.nearest(Currency(-100, "USD")) is bands[0]
+    assert index.nearest(Currency(100, "USD")) is bands[3]
+    assert CurrencyRangeIndex([]).nearest(Currency(1, "USD")) is None
+
+
+def test_find_many():
+    bands = [usd_range(0, 10), usd_range(5, 20)]
+    index = CurrencyRangeIndex(bands)
+    prices = [Currency(n, "USD") for n in (1, 7, 15, 30)]
+    expected = [[bands[0]], bands, [bands[1]], []]
+    assert index.find_many(prices) == expected
+    assert index.find_many(CurrencyArray.from_currencies(prices)) == expected
+    with pytest.raises(ValueError):
+        index.find_many(CurrencyArray([1], "EUR"))
+
+
+def test_taxed_ranges():
+    def taxed(net, gross):
+        return CurrencyWithTax(Currency(net, "EUR"), Currency(gross, "EUR"))
+
+    band = CurrencyRangeTax(taxed(10, 12), taxed(20, 24))
+    index = CurrencyRangeIndex([band])
+    assert index.find(taxed(15, 18)) == [band]
+    assert index.find(taxed(25, 30)) == []
+    with pytest.raises(TypeError):
+        index.find(Currency(15, "EUR"))
+    with pytest.raises(TypeError):
+        index.find_many(CurrencyArray([1], "EUR"))
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        CurrencyRangeIndex(
+            [usd_range(0, 1), CurrencyRange(Currency(0, "EUR"), Currency(1, "EUR"))]
+        )
+    with pytest.raises(TypeError):
+        CurrencyRangeIndex([Currency(1, "USD")])
+    index = CurrencyRangeIndex([usd_range(0, 1)])
+    with pytest.raises(TypeError):
+        index.find(1)
+    with pytest.raises(ValueError):
+        index.find(Currency(Decimal("0.5"), "EUR"))
+    assert CurrencyRangeIndex([]).find(Currency(1, "USD")) == []
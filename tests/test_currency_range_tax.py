@@ -1,9 +1,13 @@
+import copy
+import pickle
+
 import pytest
 
 from tekmoney.currency import Currency
 from tekmoney.currency_range import CurrencyRange
 from tekmoney.currency_tax import CurrencyWithTax
 from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.minor_unit_currency import MinorUnitCurrency
 
 
 def test_construction():
@@ -211,3 +215,35 @@ def test_repr():
     assert str(price_range) == (
         "CurrencyRangeTax(CurrencyWithTax(net=10 EUR, gross=15 EUR), CurrencyWithTax(net=30 EUR, gross=45 EUR))"
     )
+
+
+def test_hash_and_immutability():
+    price = CurrencyWithTax(Currency(10, "EUR"), Currency(15, "EUR"))
+    price_range = CurrencyRangeTax(price, price)
+    same = CurrencyRangeTax(price, price)
+    assert hash(price_range) == hash(same)
+    assert len({price_range, same}) == 1
+    with pytest.raises(AttributeError):
+        price_range.stop = price
+
+
+def test_pickle():
+    price1 = CurrencyWithTax(Currency(10, "EUR"), Currency(15, "EUR"))
+    price2 = CurrencyWithTax(Currency(30, "EUR"), Currency(45, "EUR"))
+    price_range = CurrencyRangeTax(price1, price2)
+    data = pickle.dumps(price_range)
+    assert pickle.loads(data) == price_range
+    assert data.count(b"EUR") == 1
+    assert copy.copy(price_range) is price_range
+    assert copy.deepcopy(price_range) is price_range
+
+
+def test_pickle_keeps_part_types():
+    start = CurrencyWithTax(MinorUnitCurrency(10, "USD"), MinorUnitCurrency(12, "USD"))
+    stop = CurrencyWithTax(Currency(30, "USD"), MinorUnitCurrency(3600, "USD"))
+    restored = pickle.loads(pickle.dumps(CurrencyRangeTax(start, stop)))
+    assert restored == CurrencyRangeTax(start, stop)
+    assert type(restored.start.net) is MinorUnitCurrency
+    assert type(restored.start.gross) is MinorUnitCurrency
+    assert type(restored.stop.net) is Currency
+    assert type(restored.stop.gross) is MinorUnitCurrency
@@ -1,7 +1,12 @@
+import copy
+import pickle
+from decimal import Decimal
+
 import pytest
 
 from tekmoney.currency import Currency
 from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.minor_unit_currency import MinorUnitCurrency
 from tekmoney.utils import tek_sum
 
 
@@ -109,3 +114,36 @@ def test_tek_sum():
     assert tek_sum([Currency(5, "USD"), Currency(10, "USD")]) == Currency(15, "USD")
     with pytest.raises(TypeError):
         tek_sum([])
+
+
+def test_hash_and_immutability():
+    currency = CurrencyWithTax(Currency(10, "USD"), Currency(12, "USD"))
+    same = CurrencyWithTax(Currency(10, "USD"), Currency(12, "USD"))
+    assert hash(currency) == hash(same)
+    assert len({currency, same}) == 1
+    with pytest.raises(AttributeError):
+        currency.net = Currency(1, "USD")
+
+
+def test_div_by_currency_raises():
+    currency1 = CurrencyWithTax(Currency(10, "EUR"), Currency(20, "EUR"))
+    with pytest.raises(TypeError):
+        currency1 / Currency(2, "EUR")
+
+
+def test_pickle():
+    price = CurrencyWithTax(Currency(Decimal("10.00"), "EUR"), Currency(12, "EUR"))
+    data = pickle.dumps(price)
+    assert pickle.loads(data) == price
+    assert pickle.loads(data).gross.currency is price.currency
+    assert data.count(b"EUR") == 1
+    assert copy.copy(price) is price
+    assert copy.deepcopy(price) is price
+
+
+def test_pickle_keeps_part_types():
+    price = CurrencyWithTax(MinorUnitCurrency(10, "USD"), Currency(12, "USD"))
+    restored = pickle.loads(pickle.dumps(price))
+    assert restored == price
+    assert type(restored.net) is MinorUnitCurrency
+    assert type(restored.gross) is Currency
@@ -0,0 +1,65 @@
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+
+
+def test_init():
+    prices = CurrencyWithTaxArray(
+        CurrencyArray([100, 200], "USD"), CurrencyArray([120, 240], "USD")
+    )
+    assert prices.currency == "USD"
+    assert len(prices) == 2
+    assert prices[1] == CurrencyWithTax(Currency(2, "USD"), Currency("2.4", "USD"))
+    assert prices.tax == CurrencyArray([20, 40], "USD")
+    with pytest.raises(ValueError):
+        CurrencyWithTaxArray(CurrencyArray([1], "USD"), CurrencyArray([1], "EUR"))
+    with pytest.raises(ValueError):
+        CurrencyWithTaxArray(CurrencyArray([1], "USD"), CurrencyArray([], "USD"))
+    with pytest.raises(TypeError):
+        CurrencyWithTaxArray([1], [1])
+
+
+def test_round_trip():
+    values = [
+        CurrencyWithTax(Currency(10, "EUR"), Currency(12, "EUR")),
+        CurrencyWithTax(Currency(Decimal("0.5"), "EUR"), Currency(1, "EUR")),
+    ]
+    prices = CurrencyWithTaxArray.from_currencies(values)
+    assert prices.to_currencies() == values
+    assert prices[:1].to_currencies() == values[:1]
+    with pytest.raises(TypeError):
+        CurrencyWithTaxArray.from_currencies([Currency(1, "EUR")])
+
+
+def test_quantize():
+    prices = CurrencyWithTaxArray(
+        CurrencyArray([1005], "USD", precision=3),
+        CurrencyArray([1206], "USD", precision=3),
+    )
+    assert prices.quantize() == CurrencyWithTaxArray(
+        CurrencyArray([101], "USD"), CurrencyArray([121], "USD")
+    )
+
+
+def test_pickle():
+    prices = CurrencyWithTaxArray(
+        CurrencyArray([1000, 2000], "EUR"), CurrencyArray([1230, 2460], "EUR")
+    )
+    assert pickle.loads(pickle.dumps(prices)) == prices
+
+
+@pytest.mark.skipif(pickle.HIGHEST_PROTOCOL < 5, reason="needs pickle protocol 5")
+def test_pickle_out_of_band():
+    prices = CurrencyWithTaxArray(
+        CurrencyArray([1000, 2000], "EUR"), CurrencyArray([1230, 2460], "EUR")
+    )
+    buffers = []
+    data = pickle.dumps(prices, 5, buffer_callback=buffers.append)
+    assert len(buffers) == 2
+    assert pickle.loads(data, buffers=buffers) == prices
@@ -3,10 +3,18 @@ from decimal import Decimal
 import pytest
 
 from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
 from tekmoney.currency_range import CurrencyRange
 from tekmoney.currency_tax import CurrencyWithTax
 from tekmoney.currency_range_tax import CurrencyRangeTax
-from tekmoney.discount import fixed_discount, fractional_discount, percentage_discount
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+from tekmoney.minor_unit_currency import MinorUnitCurrency
+from tekmoney.discount import (
+    DiscountPlan,
+    fixed_discount,
+    fractional_discount,
+    percentage_discount,
+)
 
 
 def test_application():
@@ -82,3 +90,143 @@ def test_precision():
     result = percentage_discount(price, percentage=50)
     assert result.net == Currency("0.51", "BTC")
     assert result.net == Currency("0.51", "BTC")
+
+
+BATCH_AMOUNTS = ["0", "0.01", "0.05", "1.99", "10", "19.99", "-3.50", "1234.57"]
+
+
+@pytest.mark.parametrize("currency", ["USD", "JPY", "BHD"])
+def test_batch_matches_single_values(currency):
+    prices = [Currency(Decimal(a), currency).quantize() for a in BATCH_AMOUNTS]
+    batch = CurrencyArray.from_currencies(prices, precision=3)
+    for fraction in (Decimal("0.15"), Decimal("0.333"), Decimal("1.5"), 0, 1):
+        expected = [fractional_discount(p, fraction) for p in prices]
+        assert fractional_discount(batch, fraction).to_currencies() == expected
+    expected = [percentage_discount(p, 7) for p in prices]
+    assert percentage_discount(batch, 7).to_currencies() == expected
+    discount = Currency(Decimal("2.125"), currency)
+    expected = [fixed_discount(p, discount) for p in prices]
+    assert fixed_discount(batch, discount).to_currencies() == expected
+
+
+def test_taxed_batch_matches_single_values():
+    prices = [
+        CurrencyWithTax(Currency(Decimal(a), "EUR"), Currency(Decimal(a) * 2, "EUR"))
+        for a in BATCH_AMOUNTS
+    ]
+    batch = CurrencyWithTaxArray.from_currencies(prices)
+    for from_gross in (True, False):
+        expected = [
+            fractional_discount(p, Decimal("0.15"), from_gross=from_gross)
+            for p in prices
+        ]
+        result = fractional_discount(batch, Decimal("0.15"), from_gross=from_gross)
+        assert result.to_currencies() == expected
+    discount = Currency(3, "EUR")
+    expected = [fixed_discount(p, discount) for p in prices]
+    assert fixed_discount(batch, discount).to_currencies() == expected
+
+
+def test_batch_errors():
+    batch = CurrencyArray([100, 200], "USD")
+    with pytest.raises(ValueError):
+        fixed_discount(batch, Currency(1, "EUR"))
+    with pytest.raises(TypeError):
+        fixed_discount(batch, 1)
+    with pytest.raises(TypeError):
+        fractional_discount(batch, 0.5)
+
+
+def _chained(value, rules):
+    for rule in rules:
+        value = rule(value)
+    return value
+
+
+RULES = [
+    [
+        partial(percentage_discount, percentage=10),
+        partial(fixed_discount, discount=Currency(5, "USD")),
+    ],
+    [
+        partial(fixed_discount, discount=Currency(Decimal("0.125"), "USD")),
+        partial(percentage_discount, percentage=Decimal("33.3")),
+    ],
+    [
+        partial(fractional_discount, fraction=Decimal("0.15"), from_gross=False),
+        partial(percentage_discount, percentage=50),
+    ],
+    [
+        partial(percentage_discount, percentage=-20),
+        partial(fixed_discount, discount=Currency(30, "USD")),
+    ],
+]
+PLANS = [
+    DiscountPlan().percentage(10).fixed(Currency(5, "USD")),
+    DiscountPlan().fixed(Currency(Decimal("0.125"), "USD")).percentage(Decimal("33.3")),
+    DiscountPlan().fractional(Decimal("0.15"), from_gross=False).percentage(50),
+    DiscountPlan().percentage(-20).fixed(Currency(30, "USD")),
+]
+AMOUNTS = [Decimal(n) / 100 for n in range(-700, 5000, 37)] + [Decimal("19.999")]
+
+
+@pytest.mark.parametrize("plan, rules", list(zip(PLANS, RULES)))
+def test_plan_matches_chained_functions(plan, rules):
+    for amount in AMOUNTS:
+        price = Currency(amount, "USD")
+        result = plan(price)
+        expected = _chained(price, rules)
+        assert result == expected
+        assert str(result) == str(expected)
+        taxed = CurrencyWithTax(price, price * Decimal("1.23"))
+        assert plan(taxed) == _chained(taxed, rules)
+    price_range = CurrencyRange(Currency(10, "USD"), Currency(Decimal("99.99"), "USD"))
+    assert plan(price_range) == _chained(price_range, rules)
+    taxed = CurrencyWithTax(Currency(10, "USD"), Currency(12, "USD"))
+    taxed_range = CurrencyRangeTax(taxed, taxed * 3)
+    assert plan(taxed_range) == _chained(taxed_range, rules)
+
+
+@pytest.mark.parametrize("plan, rules", list(zip(PLANS, RULES)))
+def test_plan_matches_chained_functions_on_batches(plan, rules):
+    prices = [Currency(amount, "USD") for amount in AMOUNTS]
+    batch = CurrencyArray.from_currencies(prices, precision=3)
+    result = plan(batch)
+    expected = _chained(batch, rules)
+    assert result == expected
+    assert result.precision == expected.precision
+    assert list(result) == [_chained(price, rules) for price in prices]
+    taxed = CurrencyWithTaxArray(
+        batch, CurrencyArray.from_currencies([p * 2 for p in prices], precision=4)
+    )
+    result = plan(taxed)
+    expected = _chained(taxed, rules)
+    assert result == expected
+    assert (result.net.precision, result.gross.precision) == (
+        expected.net.precision,
+        expected.gross.precision,
+    )
+
+
+def test_plan_building():
+    plan = DiscountPlan()
+    price = Currency(10, "USD")
+    assert plan(price) is price
+    longer = plan.percentage(10)
+    assert len(plan) == 0 and len(longer) == 1
+    with pytest.raises(TypeError):
+        plan.fixed(5)
+    with pytest.raises(TypeError):
+        plan.fractional(0.5)
+    with pytest.raises(ValueError):
+        plan.fixed(Currency(1, "EUR"))(price)
+    with pytest.raises(ValueError):
+        plan.fixed(Currency(1, "EUR"))(CurrencyArray([100], "USD"))
+
+
+def test_plan_on_subclasses_uses_discount_functions():
+    price = MinorUnitCurrency(1999, "USD")
+    plan = DiscountPlan().percentage(10).fixed(Currency(5, "USD"))
+    expected = fixed_discount(percentage_discount(price, 10), Currency(5, "USD"))
+    assert plan(price) == expected
+    assert type(plan(price)) is type(expected)
@@ -0,0 +1,121 @@
+import json
+from decimal import ROUND_DOWN, Decimal
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+from tekmoney.exchange import (
+    ExchangeRates,
+    FileRateProvider,
+    InMemoryRateProvider,
+    RateProvider,
+)
+
+RATES = {"USD": Decimal("1.0812"), "JPY": "161.53", "GBP": Decimal("0.8571")}
+
+
+@pytest.fixture
+def rates():
+    return ExchangeRates("EUR", RATES)
+
+
+def test_rates(rates):
+    assert rates.currencies == ("EUR", "USD", "JPY", "GBP")
+    assert len(rates) == 4
+    assert "usd" in rates and "CHF" not in rates
+    assert rates.rate("EUR", "USD") == Decimal("1.0812")
+    assert rates.rate("USD", "EUR") == Decimal(1) / Decimal("1.0812")
+    assert rates.rate("usd", "jpy") == Decimal("161.53") / Decimal("1.0812")
+    assert rates.rate("GBP", "GBP") == 1
+    assert rates.to_dict() == {
+        "EUR": "1",
+        "USD": "1.0812",
+        "JPY": "161.53",
+        "GBP": "0.8571",
+    }
+
+
+def test_convert_currency(rates):
+    assert rates.convert(Currency(100, "EUR"), "USD") == Currency(
+        Decimal("108.12"), "USD"
+    )
+    assert str(rates.convert(Currency(10, "USD"), "EUR").amount) == "9.25"
+    # cross rates are exact, rounding happens once
+    assert rates.convert(Currency(10, "USD"), "JPY") == Currency(1494, "JPY")
+    assert rates.convert(Currency(10, "USD"), "JPY", ROUND_DOWN) == Currency(
+        1493, "JPY"
+    )
+    price = Currency(Decimal("19.999"), "USD")
+    assert rates.convert(price, "usd") is price
+
+
+def test_convert_composite_values(rates):
+    net, gross = Currency(10, "EUR"), Currency(12, "EUR")
+    usd = rates.convert(net, "USD"), rates.convert(gross, "USD")
+    assert rates.convert(CurrencyWithTax(net, gross), "USD") == CurrencyWithTax(*usd)
+    assert rates.convert(CurrencyRange(net, gross), "USD") == CurrencyRange(*usd)
+    taxed = CurrencyWithTax(net, gross)
+    converted = rates.convert(CurrencyRangeTax(taxed, taxed), "USD")
+    assert converted == CurrencyRangeTax(CurrencyWithTax(*usd), CurrencyWithTax(*usd))
+
+
+def test_convert_batches_like_single_values(rates):
+    prices = [Currency(Decimal(n) / 100, "USD") for n in range(-500, 5000, 13)]
+    batch = CurrencyArray.from_currencies(prices)
+    for target in ("EUR", "JPY", "GBP"):
+        converted = rates.convert(batch, target)
+        assert converted.currency == target
+        assert list(converted) == [rates.convert(p, target) for p in prices]
+    taxed = CurrencyWithTaxArray(batch, batch * 2)
+    converted = rates.convert(taxed, "JPY")
+    assert converted.net == rates.convert(batch, "JPY")
+    assert converted.gross == rates.convert(batch * 2, "JPY")
+    assert rates.convert(batch, "USD") is batch
+
+
+def test_errors(rates):
+    with pytest.raises(ValueError):
+        rates.convert(Currency(1, "CHF"), "EUR")
+    with pytest.raises(ValueError):
+        rates.convert(Currency(1, "EUR"), "CHF")
+    with pytest.raises(TypeError):
+        rates.convert(Decimal(1), "EUR")
+    with pytest.raises(TypeError):
+        ExchangeRates("EUR", {"USD": 1.08})
+    with pytest.raises(ValueError):
+        ExchangeRates("EUR", {"USD": 0})
+    with pytest.raises(ValueError):
+        ExchangeRates("EUR", {"EUR": 2})
+
+
+def test_in_memory_provider():
+    provider = InMemoryRateProvider("EUR", RATES)
+    assert isinstance(provider, RateProvider)
+    assert provider.load().rate("EUR", "USD") == Decimal("1.0812")
+    provider.update({"USD": "1.1"})
+    assert provider.load().rate("EUR", "USD") == Decimal("1.1")
+
+
+def test_providers_must_implement_load():
+    class Incomplete(RateProvider):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_file_provider(tmp_path, rates):
+    path = tmp_path / "rates.json"
+    FileRateProvider.save(path, rates)
+    loaded = FileRateProvider(path).load()
+    assert loaded.to_dict() == rates.to_dict()
+    path.write_text(json.dumps({"base": "EUR", "rates": {"USD": 1.0812}}))
+    assert FileRateProvider(path).load().rate("EUR", "USD") == Decimal("1.0812")
+    path.write_text("[]")
+    with pytest.raises(ValueError):
+        FileRateProvider(path).load()
@@ -6,7 +6,9 @@ from tekmoney.currency import Currency
 from tekmoney.currency_tax import CurrencyWithTax
 from tekmoney.currency_range import CurrencyRange
 from tekmoney.currency_range_tax import CurrencyRangeTax
-from tekmoney.flat_tax import flat_tax
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+from tekmoney.flat_tax import flat_tax, flat_tax_batch
 
 
 def test_application():
@@ -45,3 +47,64 @@ def test_range():
     result = flat_tax(price_range, 1)
     assert result.start == CurrencyWithTax(Currency(10, "BTC"), Currency(20, "BTC"))
     assert result.stop == CurrencyWithTax(Currency(20, "BTC"), Currency(40, "BTC"))
+
+
+def test_batch_matches_scalar():
+    values = [Currency(Decimal(n) / 100, "USD") for n in range(0, 100000, 997)]
+    rates = [Decimal("0.23"), Decimal("0.075"), Decimal("0.19"), 0]
+    rates = [rates[i % len(rates)] for i in range(len(values))]
+    batch = CurrencyArray.from_currencies(values)
+    for keep_gross in (False, True):
+        expected = [
+            flat_tax(value, rate, keep_gross=keep_gross)
+            for value, rate in zip(values, rates)
+        ]
+        result = flat_tax_batch(batch, rates, keep_gross=keep_gross)
+        assert result.to_currencies() == expected
+        assert result.tax.to_currencies() == [price.tax for price in expected]
+        expected = [
+            flat_tax(value, Decimal("0.2"), keep_gross=keep_gross) for value in values
+        ]
+        result = flat_tax_batch(batch, Decimal("0.2"), keep_gross=keep_gross)
+        assert result.to_currencies() == expected
+
+
+def test_batch_taxed_values():
+    prices = CurrencyWithTaxArray(
+        CurrencyArray([10000], "USD"), CurrencyArray([12000], "USD")
+    )
+    result = flat_tax_batch(prices, Decimal("0.5"))
+    assert result[0] == CurrencyWithTax(Currency(100, "USD"), Currency(180, "USD"))
+    assert result[0] == flat_tax(prices[0], Decimal("0.5"))
+    result = flat_tax_batch(prices, Decimal("0.5"), keep_gross=True)
+    assert result[0] == CurrencyWithTax(
+        Currency(Decimal("66.67"), "USD"), Currency(120, "USD")
+    )
+    assert result[0] == flat_tax(prices[0], Decimal("0.5"), keep_gross=True)
+
+
+def test_batch_quantizes_to_currency_precision():
+    prices = CurrencyArray([1001], "USD", precision=3)
+    result = flat_tax_batch(prices, Decimal("0.1"))
+    assert result.gross.precision == 2
+    assert result[0] == flat_tax(Currency(Decimal("1.001"), "USD"), Decimal("0.1"))
+
+
+def test_batch_errors():
+    prices = CurrencyArray([100, 200], "USD")
+    with pytest.raises(ValueError):
+        flat_tax_batch(prices, [1])
+    with pytest.raises(TypeError):
+        flat_tax_batch(prices, 0.5)
+    with pytest.raises(TypeError):
+        flat_tax_batch([Currency(1, "USD")], 1)
+
+
+def test_flat_tax_accepts_batches():
+    prices = CurrencyArray([1000, 1999], "USD")
+    rate = Decimal("0.23")
+    assert flat_tax(prices, rate) == flat_tax_batch(prices, rate)
+    taxed = flat_tax(prices, rate)
+    assert flat_tax(taxed, rate, keep_gross=True) == flat_tax_batch(
+        taxed, rate, keep_gross=True
+    )
@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+
+import tekmoney
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(tekmoney.__file__)))
+
+
+def import_times(statement, **env):
+    """Return {module: cumulative microseconds} reported by python -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PACKAGE_ROOT,
+        env=dict(os.environ, **env),
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+def test_import_does_not_load_babel():
+    times = import_times(
+        "import tekmoney.currency, tekmoney.flat_tax, tekmoney.discount"
+    )
+    assert "tekmoney.currency" in times
+    assert not [module for module in times if module.startswith("babel")]
+
+
+def test_babel_free_quantize_does_not_load_babel():
+    times = import_times(
+        "import sys; from tekmoney.currency import Currency;"
+        "Currency(1, 'USD').quantize();"
+        "assert 'babel' not in sys.modules",
+        TEKMONEY_USE_BABEL="0",
+    )
+    assert "tekmoney.currency" in times
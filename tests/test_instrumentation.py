@@ -0,0 +1,84 @@
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+
+from tekmoney import instrumentation
+from tekmoney.currency import Currency
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.discount import DiscountPlan, fixed_discount, percentage_discount
+from tekmoney.flat_tax import flat_tax
+from tekmoney.instrumentation import Recorder, instrument
+
+
+def test_disabled_by_default():
+    assert instrumentation.active is None
+    Currency(1, "USD")
+
+
+def test_constructions_and_quantize():
+    price = Currency(Decimal("1.005"), "USD")
+    with instrument() as recorder:
+        price.quantize()
+        price.quantize(".1", rounding=ROUND_DOWN)
+        CurrencyWithTax(price, price)
+    assert instrumentation.active is None
+    snapshot = recorder.snapshot()
+    assert snapshot["constructions"] == {"Currency": 2, "CurrencyWithTax": 1}
+    assert snapshot["quantize"] == {"USD": {ROUND_HALF_UP: 1, ROUND_DOWN: 1}}
+    Currency(1, "USD")
+    assert recorder.snapshot()["constructions"]["Currency"] == 2
+
+
+def test_precision_misses():
+    with instrument() as recorder:
+        Currency(1, "XTS").quantize()
+        Currency(1, "XTS").quantize()
+    assert recorder.snapshot()["precision_misses"] == {"XTS": 1}
+
+
+def test_timings_and_branches():
+    price_range = CurrencyRange(Currency(10, "USD"), Currency(20, "USD"))
+    with instrument() as recorder:
+        flat_tax(price_range, Decimal("0.1"))
+        flat_tax(Currency(10, "USD"), Decimal("0.1"))
+        fixed_discount(Currency(10, "USD"), Currency(1, "USD"))
+        percentage_discount(Currency(10, "USD"), 10)
+    snapshot = recorder.snapshot()
+    assert snapshot["branches"]["flat_tax"] == {"CurrencyRange": 1, "Currency": 1}
+    assert snapshot["timings"]["flat_tax"]["calls"] == 2
+    assert snapshot["timings"]["flat_tax"]["total_seconds"] > 0
+    assert snapshot["timings"]["percentage_discount"]["calls"] == 1
+    assert snapshot["timings"]["fixed_discount"]["calls"] == 2
+
+
+def test_discount_plan_branches():
+    plan = DiscountPlan().percentage(10)
+    price = Currency(10, "USD")
+    with instrument() as recorder:
+        plan(price)
+        plan.apply(price)
+        plan(CurrencyRange(price, price))
+    snapshot = recorder.snapshot()
+    assert snapshot["branches"]["discount_plan"] == {"Currency": 2, "CurrencyRange": 1}
+
+
+def test_nesting_and_reset():
+    outer = Recorder()
+    with instrument(outer):
+        with instrument() as inner:
+            Currency(1, "USD")
+        assert instrumentation.active is outer
+        Currency(1, "USD")
+    assert inner.snapshot()["constructions"] == {"Currency": 1}
+    assert outer.snapshot()["constructions"] == {"Currency": 1}
+    outer.reset()
+    assert outer.snapshot()["constructions"] == {}
+
+
+def test_enable_disable():
+    recorder = instrumentation.enable()
+    try:
+        Currency(1, "USD")
+    finally:
+        instrumentation.disable()
+    Currency(1, "USD")
+    assert recorder.snapshot()["constructions"] == {"Currency": 1}
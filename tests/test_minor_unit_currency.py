@@ -0,0 +1,98 @@
+import pickle
+from decimal import Decimal, ROUND_DOWN
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.discount import fixed_discount, percentage_discount
+from tekmoney.flat_tax import flat_tax
+from tekmoney.minor_unit_currency import MinorUnitCurrency
+
+
+def test_init():
+    currency = MinorUnitCurrency(Decimal("10.5"), "usd")
+    assert currency.units == 1050
+    assert currency.precision == 2
+    assert currency.currency == "USD"
+    assert currency.amount == Decimal("10.50")
+    assert str(currency) == "10.50 USD"
+    assert MinorUnitCurrency.from_units(1050, "USD") == currency
+    assert MinorUnitCurrency(5, "JPY").units == 5
+    assert not MinorUnitCurrency(0, "USD")
+    with pytest.raises(ValueError):
+        MinorUnitCurrency(Decimal("0.001"), "USD")
+
+
+def test_int_arithmetic():
+    a = MinorUnitCurrency(Decimal("1.25"), "USD")
+    b = MinorUnitCurrency(Decimal("0.75"), "USD")
+    assert isinstance(a + b, MinorUnitCurrency)
+    assert (a + b).units == 200
+    assert (a - b).units == 50
+    assert (a * 3).units == 375
+    assert (3 * a).units == 375
+    assert a > b
+    assert b < a
+    assert a >= a
+    assert b <= a
+    assert a == MinorUnitCurrency.from_units(125, "USD")
+    with pytest.raises(ValueError):
+        a + MinorUnitCurrency(1, "EUR")
+    with pytest.raises(ValueError):
+        a < MinorUnitCurrency(1, "EUR")
+
+
+def test_decimal_fallback():
+    a = MinorUnitCurrency(Decimal("1.25"), "USD")
+    assert a * Decimal("0.5") == Currency(Decimal("0.625"), "USD")
+    assert type(a * Decimal("0.5")) is Currency
+    assert a / 2 == Currency(Decimal("0.625"), "USD")
+    assert a / Currency(Decimal("0.25"), "USD") == Decimal(5)
+    assert a + Currency(Decimal("0.001"), "USD") == Currency(Decimal("1.251"), "USD")
+    assert Currency(1, "USD") + a == Currency(Decimal("2.25"), "USD")
+    assert a == Currency(Decimal("1.25"), "USD")
+    assert Currency(Decimal("1.25"), "USD") == a
+    assert a < Currency(2, "USD")
+    assert Currency(2, "USD") > a
+    assert a == MinorUnitCurrency(Decimal("1.25"), "USD", precision=3)
+
+
+def test_quantize():
+    a = MinorUnitCurrency(Decimal("1.005"), "USD", precision=3)
+    assert a.quantize() == Currency(Decimal("1.01"), "USD")
+    assert a.quantize().precision == 2
+    assert a.quantize(".01", rounding=ROUND_DOWN).units == 100
+    assert str(a.quantize(".0001")) == "1.0050 USD"
+    b = MinorUnitCurrency(1, "USD")
+    assert b.quantize() is b
+
+
+def test_interoperability():
+    net = MinorUnitCurrency(10, "USD")
+    gross = MinorUnitCurrency(12, "USD")
+    price = CurrencyWithTax(net, gross)
+    assert price.tax == MinorUnitCurrency(2, "USD")
+    assert isinstance((price + price).net, MinorUnitCurrency)
+    price_range = CurrencyRange(net, gross)
+    assert MinorUnitCurrency(11, "USD") in price_range
+    assert Currency(11, "USD") in price_range
+    assert fixed_discount(net, MinorUnitCurrency(3, "USD")) == Currency(7, "USD")
+    assert fixed_discount(net, MinorUnitCurrency(30, "USD")) == Currency(0, "USD")
+    assert percentage_discount(net, 15) == Currency(Decimal("8.50"), "USD")
+    assert flat_tax(net, Decimal("0.2")) == CurrencyWithTax(net, gross)
+    assert flat_tax(gross, Decimal("0.2"), keep_gross=True) == CurrencyWithTax(
+        net, gross
+    )
+
+
+def test_hash_and_immutability():
+    currency = MinorUnitCurrency(Decimal("1.25"), "USD")
+    assert hash(currency) == hash(Currency(Decimal("1.25"), "USD"))
+    assert len({currency, Currency(Decimal("1.250"), "USD")}) == 1
+    with pytest.raises(AttributeError):
+        currency.units = 5
+    restored = pickle.loads(pickle.dumps(currency))
+    assert isinstance(restored, MinorUnitCurrency)
+    assert restored.units == 125
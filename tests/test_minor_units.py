@@ -0,0 +1,87 @@
+import decimal
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.minor_units import (
+    divide_rounded,
+    from_minor_units,
+    parse_minor_units,
+    required_precision,
+    to_minor_units,
+)
+
+ROUNDING_MODES = [
+    decimal.ROUND_05UP,
+    decimal.ROUND_CEILING,
+    decimal.ROUND_DOWN,
+    decimal.ROUND_FLOOR,
+    decimal.ROUND_HALF_DOWN,
+    decimal.ROUND_HALF_EVEN,
+    decimal.ROUND_HALF_UP,
+    decimal.ROUND_UP,
+]
+
+
+def test_conversion():
+    assert to_minor_units(Decimal("12.34"), 2) == 1234
+    assert to_minor_units(5, 0) == 5
+    assert to_minor_units(Decimal("-0.5"), 3) == -500
+    assert str(from_minor_units(1234, 2)) == "12.34"
+    assert str(from_minor_units(1000, 2)) == "10.00"
+    with pytest.raises(ValueError):
+        to_minor_units(Decimal("0.125"), 2)
+
+
+def test_required_precision():
+    assert required_precision(Decimal("1.000")) == 0
+    assert required_precision(Decimal("1.250")) == 2
+    assert required_precision(100) == 0
+
+
+@pytest.mark.parametrize("rounding", ROUNDING_MODES)
+def test_divide_rounded_matches_quantize(rounding):
+    for denominator in (2, 3, 4, 10, -4):
+        for numerator in range(-60, 61):
+            expected = (Decimal(numerator) / Decimal(denominator)).quantize(
+                Decimal(1), rounding=rounding
+            )
+            assert divide_rounded(numerator, denominator, rounding) == int(expected)
+
+
+def test_divide_rounded_errors():
+    with pytest.raises(ZeroDivisionError):
+        divide_rounded(1, 0)
+    with pytest.raises(ValueError):
+        divide_rounded(1, 2, "ROUND_SIDEWAYS")
+
+
+@pytest.mark.parametrize(
+    "text, precision, units",
+    [
+        ("1", 2, 100),
+        ("-1.5", 2, -150),
+        ("+.25", 2, 25),
+        (" 12.340 ", 2, 1234),
+        ("7.", 0, 7),
+        ("0.12345678", 8, 12345678),
+    ],
+)
+def test_parse_minor_units(text, precision, units):
+    assert parse_minor_units(text, precision) == units
+    assert parse_minor_units(text, precision) == to_minor_units(
+        Decimal(text), precision
+    )
+
+
+@pytest.mark.parametrize(
+    "text", ["", ".", "-", "1e3", "1,5", "--1", "1.2.3", "NaN", "Infinity", "\u0661"]
+)
+def test_parse_minor_units_rejects_malformed(text):
+    with pytest.raises(ValueError, match="malformed"):
+        parse_minor_units(text, 2)
+
+
+def test_parse_minor_units_rejects_extra_places():
+    with pytest.raises(ValueError, match="2 decimal places"):
+        parse_minor_units("1.001", 2)
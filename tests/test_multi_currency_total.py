@@ -0,0 +1,82 @@
+import json
+import pickle
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.multi_currency_total import MultiCurrencyTotal
+
+
+def taxed(net, gross, code):
+    return CurrencyWithTax(Currency(net, code), Currency(gross, code))
+
+
+def test_totals_per_currency():
+    total = MultiCurrencyTotal(
+        [Currency(1, "USD"), Currency(2, "EUR"), Currency(Decimal("0.5"), "USD")]
+    )
+    total += Currency(3, "GBP")
+    total -= Currency(1, "EUR")
+    assert len(total) == 3
+    assert list(total) == ["USD", "EUR", "GBP"]
+    assert "USD" in total and "JPY" not in total
+    assert total["USD"] == Currency(Decimal("1.5"), "USD")
+    assert total.totals() == {
+        "USD": Currency(Decimal("1.5"), "USD"),
+        "EUR": Currency(1, "EUR"),
+        "GBP": Currency(3, "GBP"),
+    }
+
+
+def test_taxed_values_promote_bucket():
+    total = MultiCurrencyTotal([Currency(1, "EUR")])
+    total.add(taxed(10, 12, "EUR"))
+    total.add(Currency(1, "EUR"))
+    assert total["EUR"] == taxed(12, 14, "EUR")
+    total.subtract(taxed(2, 4, "EUR"))
+    assert total["EUR"] == taxed(10, 10, "EUR")
+
+
+def test_merge_all():
+    workers = [
+        MultiCurrencyTotal([Currency(1, "USD"), taxed(1, 2, "EUR")]),
+        MultiCurrencyTotal([Currency(2, "USD"), Currency(5, "JPY")]),
+        MultiCurrencyTotal([taxed(3, 4, "USD")]),
+    ]
+    merged = MultiCurrencyTotal.merge_all(workers)
+    assert merged.totals() == {
+        "USD": taxed(6, 7, "USD"),
+        "EUR": taxed(1, 2, "EUR"),
+        "JPY": Currency(5, "JPY"),
+    }
+    # merging copies buckets instead of sharing them
+    merged.add(Currency(1, "JPY"))
+    assert workers[1]["JPY"] == Currency(5, "JPY")
+    workers[0] += workers[1]
+    assert workers[0]["USD"] == Currency(3, "USD")
+
+
+def test_serialization():
+    total = MultiCurrencyTotal([Currency(Decimal("1.25"), "USD"), taxed(1, 2, "EUR")])
+    data = total.to_dict()
+    assert data == {"USD": "1.25", "EUR": ["1", "2"]}
+    assert MultiCurrencyTotal.from_dict(json.loads(json.dumps(data))) == total
+    assert pickle.loads(pickle.dumps(total)) == total
+
+
+def test_errors():
+    total = MultiCurrencyTotal()
+    with pytest.raises(TypeError):
+        total.add(Decimal(1))
+    with pytest.raises(TypeError):
+        total.merge({"USD": "1"})
+    with pytest.raises(TypeError):
+        hash(total)
+    with pytest.raises(TypeError):
+        total.add(CurrencyRange(Currency(1, "USD"), Currency(2, "USD")))
+    total.add(Currency(1, "USD"))
+    with pytest.raises(TypeError):
+        total.add(CurrencyRange(Currency(1, "USD"), Currency(2, "USD")))
@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor
+from decimal import ROUND_DOWN, Decimal
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+from tekmoney.discount import percentage_discount
+from tekmoney.flat_tax import flat_tax
+from tekmoney.pipeline import PricingPipeline
+
+PRICES = [Currency(Decimal(units) / 100, "USD") for units in range(-50, 950, 7)]
+
+
+def _expected(pipeline, values):
+    result = []
+    for value in values:
+        taxed = flat_tax(
+            value, Decimal(pipeline.tax_rate), keep_gross=pipeline.keep_gross
+        )
+        if pipeline.discount is not None:
+            taxed = percentage_discount(
+                taxed, pipeline.discount, from_gross=pipeline.from_gross
+            )
+        result.append(taxed.quantize(pipeline.exp, rounding=pipeline.rounding))
+    return result
+
+
+@pytest.mark.parametrize(
+    "pipeline",
+    [
+        PricingPipeline(Decimal("0.23")),
+        PricingPipeline(Decimal("0.23"), 15),
+        PricingPipeline(Decimal("0.08"), Decimal("12.5"), keep_gross=True),
+        PricingPipeline(Decimal("0.2"), 10, from_gross=False, exp=Decimal("0.1")),
+        PricingPipeline(Decimal("0.2"), 33, rounding=ROUND_DOWN),
+    ],
+)
+def test_apply_matches_single_values(pipeline):
+    batch = CurrencyArray.from_currencies(PRICES)
+    assert list(pipeline.apply(batch)) == _expected(pipeline, PRICES)
+
+
+def test_apply_taxed_batch():
+    values = [CurrencyWithTax(price, price * 2) for price in PRICES]
+    pipeline = PricingPipeline(Decimal("0.1"), 20)
+    result = pipeline.apply(CurrencyWithTaxArray.from_currencies(values))
+    assert list(result) == _expected(pipeline, values)
+
+
+def test_run_in_worker_processes():
+    pipeline = PricingPipeline(Decimal("0.23"), 15)
+    batch = CurrencyArray.from_currencies(PRICES)
+    expected = pipeline.apply(batch)
+    assert pipeline.run(batch, workers=2, chunk_size=16) == expected
+    with ProcessPoolExecutor(2) as executor:
+        assert pipeline.run(batch, chunk_size=7, executor=executor) == expected
+        parts = list(
+            pipeline.run_batches(
+                [batch[:10], batch[10:11], batch[11:]], workers=1, executor=executor
+            )
+        )
+    assert [len(part) for part in parts] == [10, 1, len(batch) - 11]
+    assert [price for part in parts for price in part] == list(expected)
+
+
+def test_run_in_process():
+    pipeline = PricingPipeline(Decimal("0.23"))
+    batch = CurrencyArray.from_currencies(PRICES)
+    assert pipeline.run(batch, workers=1, chunk_size=3) == pipeline.apply(batch)
+    assert len(pipeline.run(CurrencyArray([], "EUR"))) == 0
+
+
+def test_run_errors():
+    pipeline = PricingPipeline(Decimal("0.23"))
+    with pytest.raises(ValueError):
+        pipeline.run(CurrencyArray([1], "USD"), chunk_size=0)
+    with pytest.raises(TypeError):
+        pipeline.run(PRICES)
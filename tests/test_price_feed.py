@@ -0,0 +1,97 @@
+import io
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.discount import percentage_discount
+from tekmoney.flat_tax import flat_tax
+from tekmoney.price_feed import read_price_batches
+
+FEED = """sku,amount,currency
+A1,19.99,USD
+A2,5,eur
+A3,-0.50,USD
+A4,1000,JPY
+
+A5,0.10,USD
+"""
+
+
+def test_batches_per_currency():
+    batches = list(read_price_batches(io.StringIO(FEED)))
+    assert [(batch.currency, list(batch.units)) for batch in batches] == [
+        ("USD", [1999, -50, 10]),
+        ("EUR", [500]),
+        ("JPY", [1000]),
+    ]
+    assert batches[0].precision == 2
+    assert batches[2].precision == 0
+
+
+def test_batch_size_bounds_batches():
+    rows = "".join(f"{n}.25,USD\n" for n in range(10))
+    batches = list(
+        read_price_batches(
+            io.StringIO(rows), amount_column=0, currency_column=1, batch_size=4
+        )
+    )
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    units = [unit for batch in batches for unit in batch.units]
+    assert units == [n * 100 + 25 for n in range(10)]
+
+
+def test_read_from_path(tmp_path):
+    path = tmp_path / "feed.txt"
+    path.write_text("1.50\n2.25\n")
+    batches = list(
+        read_price_batches(path, amount_column=0, currency_column=None, currency="gbp")
+    )
+    assert batches == [CurrencyArray([150, 225], "GBP")]
+
+
+def test_batches_feed_pricing_functions():
+    (batch,) = read_price_batches(
+        io.StringIO("price;code\n10.00;USD\n19.99;USD\n"),
+        amount_column="price",
+        currency_column="code",
+        delimiter=";",
+    )
+    prices = [Currency(Decimal("10.00"), "USD"), Currency(Decimal("19.99"), "USD")]
+    taxed = flat_tax(batch, Decimal("0.23"))
+    assert taxed.to_currencies() == [flat_tax(p, Decimal("0.23")) for p in prices]
+    discounted = percentage_discount(taxed, 15)
+    expected = [percentage_discount(flat_tax(p, Decimal("0.23")), 15) for p in prices]
+    assert discounted.to_currencies() == expected
+
+
+@pytest.mark.parametrize(
+    "feed, message",
+    [
+        ("amount,currency\n1.001,USD\n", "line 2: 1.001 cannot be represented"),
+        ("amount,currency\n1,USD\n1.5,JPY\n", "line 3: 1.5 cannot be represented"),
+        ("amount,currency\n1e5,USD\n", "line 2: malformed amount"),
+        ("amount,currency\n1,ABC\n", "line 2: unknown currency 'ABC'"),
+        ("amount,currency\n1,\n", "line 2: unknown currency ''"),
+        ("amount,currency\n1\n", "line 2: expected more than 1 columns"),
+        ("amount,currency\n99999999999999999999,USD\n", "line 2: .* 64 bits"),
+        ("price,currency\n1,USD\n", "no 'amount' column"),
+    ],
+)
+def test_strict_validation(feed, message):
+    with pytest.raises(ValueError, match=message):
+        list(read_price_batches(io.StringIO(feed)))
+
+
+def test_allowed_currencies():
+    feed = "amount,currency\n1,USD\n2,EUR\n"
+    with pytest.raises(ValueError, match="unknown currency 'EUR'"):
+        list(read_price_batches(io.StringIO(feed), currencies=["usd"]))
+
+
+def test_argument_errors():
+    with pytest.raises(ValueError):
+        list(read_price_batches(io.StringIO(""), batch_size=0))
+    with pytest.raises(ValueError):
+        list(read_price_batches(io.StringIO(""), currency_column=None))
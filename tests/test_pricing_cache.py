@@ -0,0 +1,148 @@
+import threading
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.discount import fixed_discount, fractional_discount, percentage_discount
+from tekmoney.flat_tax import flat_tax
+from tekmoney.minor_unit_currency import MinorUnitCurrency
+from tekmoney.pricing_cache import LRUCache, PricingCache
+
+
+def test_results_match_uncached():
+    cache = PricingCache()
+    price = CurrencyWithTax(Currency(100, "USD"), Currency(120, "USD"))
+    for _ in range(2):
+        assert cache.flat_tax(price, Decimal("0.2"), keep_gross=True) == flat_tax(
+            price, Decimal("0.2"), keep_gross=True
+        )
+        assert cache.fixed_discount(price, Currency(5, "USD")) == fixed_discount(
+            price, Currency(5, "USD")
+        )
+        assert cache.fractional_discount(
+            price, Decimal("0.1"), from_gross=False
+        ) == fractional_discount(price, Decimal("0.1"), from_gross=False)
+        assert cache.percentage_discount(price, 15) == percentage_discount(price, 15)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (4, 4, 4)
+
+
+def _same(result, expected):
+    return type(result) is type(expected) and str(result) == str(expected)
+
+
+def test_types_and_exponents_are_part_of_key():
+    cache = PricingCache()
+    prices = [
+        Currency(Decimal("10"), "USD"),
+        Currency(Decimal("10.00"), "USD"),
+        MinorUnitCurrency(1000, "USD"),
+    ]
+    discounts = [
+        Currency(Decimal("1"), "USD"),
+        Currency(Decimal("1.000"), "USD"),
+        MinorUnitCurrency(100, "USD"),
+    ]
+    for _ in range(2):
+        for price in prices:
+            for discount in discounts:
+                assert _same(
+                    cache.fixed_discount(price, discount),
+                    fixed_discount(price, discount),
+                )
+            for rate in (Decimal("0.2"), Decimal("0.20"), 1):
+                assert _same(cache.flat_tax(price, rate), flat_tax(price, rate))
+            for fraction in (Decimal("0.5"), Decimal("0.500")):
+                assert _same(
+                    cache.fractional_discount(price, fraction),
+                    fractional_discount(price, fraction),
+                )
+            for percentage in (Decimal("10"), Decimal("10.0"), 10):
+                assert _same(
+                    cache.percentage_discount(price, percentage),
+                    percentage_discount(price, percentage),
+                )
+    assert cache.cache_info().misses == 3 * (3 + 3 + 2 + 3)
+
+
+def test_flags_are_part_of_key():
+    cache = PricingCache()
+    price = Currency(120, "USD")
+    assert cache.flat_tax(price, Decimal("0.2")).gross == Currency(144, "USD")
+    assert cache.flat_tax(price, Decimal("0.2"), keep_gross=True).net == Currency(
+        100, "USD"
+    )
+    assert cache.cache_info().misses == 2
+
+
+def test_eviction():
+    cache = PricingCache(maxsize=2)
+    prices = [Currency(n, "USD") for n in range(3)]
+    for price in prices:
+        cache.percentage_discount(price, 10)
+    cache.percentage_discount(prices[2], 10)
+    cache.percentage_discount(prices[0], 10)
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 4, 2, 2)
+    cache.clear()
+    assert cache.cache_info() == (0, 0, 0, 2, 0)
+    with pytest.raises(ValueError):
+        PricingCache(maxsize=0)
+
+
+def test_errors_are_not_cached():
+    cache = PricingCache()
+    with pytest.raises(TypeError):
+        cache.flat_tax(1, 1)
+    assert cache.cache_info().currsize == 0
+
+
+def test_per_thread():
+    cache = PricingCache(per_thread=True)
+    price = Currency(10, "USD")
+
+    counted = threading.Barrier(5)
+    done = threading.Barrier(5)
+
+    def work():
+        for _ in range(3):
+            cache.percentage_discount(price, 50)
+        counted.wait()
+        done.wait()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    counted.wait()
+    info = cache.cache_info()
+    done.wait()
+    for thread in threads:
+        thread.join()
+    assert (info.hits, info.misses, info.currsize) == (8, 4, 4)
+
+
+def test_per_thread_caches_exit_with_their_threads():
+    cache = PricingCache(maxsize=100, per_thread=True)
+
+    def work():
+        for n in range(100):
+            cache.flat_tax(Currency(n, "USD"), Decimal("0.2"))
+
+    threads = [threading.Thread(target=work) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    info = cache.cache_info()
+    assert info.currsize <= info.maxsize
+    assert len(cache._caches) == 0
+
+
+def test_lru_cache():
+    cache = LRUCache(1)
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("a", lambda: 2) == 1
+    assert cache.get("b", lambda: 3) == 3
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 2, 1)
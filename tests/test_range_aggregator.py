@@ -0,0 +1,79 @@
+import random
+from decimal import Decimal
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+from tekmoney.range_aggregator import RangeAggregator, price_range
+
+
+def taxed(net, gross, code="EUR"):
+    return CurrencyWithTax(Currency(net, code), Currency(gross, code))
+
+
+def test_price_range_matches_min_max():
+    rng = random.Random(3)
+    prices = [Currency(Decimal(rng.randint(0, 10000)) / 100, "USD") for _ in range(500)]
+    assert price_range(prices) == CurrencyRange(min(prices), max(prices))
+
+
+def test_price_range_taxed_compares_gross():
+    prices = [taxed(10, 13), taxed(11, 12), taxed(20, 21), taxed(19, 25)]
+    result = price_range(prices)
+    assert isinstance(result, CurrencyRangeTax)
+    assert result.start is prices[1]
+    assert result.stop is prices[3]
+
+
+def test_ties_keep_first_value():
+    first, second = Currency(1, "USD"), Currency(Decimal("1.00"), "USD")
+    aggregator = RangeAggregator([first, second])
+    assert aggregator.low is first
+    assert aggregator.high is first
+
+
+def test_incremental_updates():
+    aggregator = RangeAggregator()
+    assert aggregator.count == 0
+    aggregator.add(Currency(5, "USD"))
+    assert aggregator.result() == CurrencyRange(Currency(5, "USD"), Currency(5, "USD"))
+    aggregator.update([Currency(3, "USD"), Currency(4, "USD")])
+    aggregator.add(Currency(9, "USD"))
+    assert aggregator.count == 4
+    assert aggregator.result() == CurrencyRange(Currency(3, "USD"), Currency(9, "USD"))
+
+
+def test_batches():
+    aggregator = RangeAggregator([Currency(Decimal("2.50"), "USD")])
+    aggregator.update(CurrencyArray([400, 100, 900, 100], "USD"))
+    aggregator.update(CurrencyArray([], "USD"))
+    assert aggregator.count == 5
+    assert aggregator.result() == CurrencyRange(
+        Currency(Decimal("1.00"), "USD"), Currency(Decimal("9.00"), "USD")
+    )
+    prices = [taxed(10, 12), taxed(5, 6), taxed(20, 24)]
+    batch = CurrencyWithTaxArray.from_currencies(prices)
+    assert price_range(batch) == CurrencyRangeTax(prices[1], prices[2])
+    assert price_range(CurrencyArray(memoryview(bytearray(16)).cast("q"), "USD"))
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        RangeAggregator().result()
+    with pytest.raises(ValueError):
+        price_range([Currency(1, "USD"), Currency(2, "EUR")])
+    with pytest.raises(TypeError):
+        price_range([Currency(1, "EUR"), taxed(1, 2)])
+    with pytest.raises(TypeError):
+        price_range([taxed(1, 2), Currency(1, "EUR")])
+    with pytest.raises(TypeError):
+        price_range([1, 2])
+    with pytest.raises(TypeError):
+        RangeAggregator([taxed(1, 2)]).update(CurrencyArray([1], "EUR"))
+    with pytest.raises(ValueError):
+        RangeAggregator([Currency(1, "USD")]).update(CurrencyArray([1], "EUR"))
@@ -0,0 +1,139 @@
+from decimal import Decimal, ROUND_HALF_UP
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.currency_tax_array import CurrencyWithTaxArray
+from tekmoney.flat_tax import flat_tax
+from tekmoney.minor_units import divide_rounded
+from tekmoney.tax_schedule import TaxSchedule, _rounded
+
+BRACKETS = [
+    (0, Decimal("0.05")),
+    (Decimal("110"), Decimal("0.0875")),
+    (Decimal("999.995"), Decimal("0.2")),
+]
+AMOUNTS = [Decimal(n) / 100 for n in range(-5000, 150000, 313)] + [
+    Decimal("110"),
+    Decimal("109.99"),
+    Decimal("999.995"),
+    Decimal("19.999"),
+]
+
+
+def _progressive_gross(amount, brackets):
+    """Tax every part of amount at the rate of its bracket, then round."""
+    tax = Decimal(0)
+    bounds = [threshold for threshold, _ in brackets[1:]] + [None]
+    for (threshold, rate), bound in zip(brackets, bounds):
+        if amount <= threshold:
+            break
+        top = amount if bound is None else min(amount, bound)
+        tax += (top - threshold) * rate
+    return (amount + tax).quantize(Decimal("0.01"), ROUND_HALF_UP)
+
+
+def test_progressive_schedule():
+    schedule = TaxSchedule("USD", BRACKETS)
+    for amount in AMOUNTS:
+        price = Currency(amount, "USD")
+        result = schedule(price)
+        assert result.net is price
+        assert result.gross == Currency(_progressive_gross(amount, BRACKETS), "USD")
+        assert str(result.gross) == f"{_progressive_gross(amount, BRACKETS)} USD"
+
+
+def test_threshold_schedule_matches_flat_tax():
+    schedule = TaxSchedule("USD", BRACKETS, progressive=False)
+    for amount in AMOUNTS:
+        price = Currency(amount, "USD")
+        if amount < 0:
+            assert schedule.rate(price) == 0
+            assert schedule(price).gross == price
+            continue
+        assert schedule(price) == flat_tax(price, schedule.rate(price))
+        taxed = CurrencyWithTax(price, price * Decimal("1.1"))
+        assert schedule(taxed) == flat_tax(taxed, schedule.rate(taxed.gross))
+
+
+def test_rate_lookup():
+    schedule = TaxSchedule("USD", BRACKETS)
+    assert schedule.rate(Decimal("-1")) == 0
+    assert schedule.rate(0) == Decimal("0.05")
+    assert schedule.rate(Currency(Decimal("109.99"), "USD")) == Decimal("0.05")
+    assert schedule.rate(Currency(110, "USD")) == Decimal("0.0875")
+    assert schedule.rate(10**6) == Decimal("0.2")
+    assert len(schedule) == 3
+    with pytest.raises(ValueError):
+        schedule.rate(Currency(1, "EUR"))
+
+
+def test_ranges():
+    schedule = TaxSchedule("USD", BRACKETS)
+    start, stop = Currency(50, "USD"), Currency(200, "USD")
+    result = schedule(CurrencyRange(start, stop))
+    assert result == CurrencyRangeTax(schedule(start), schedule(stop))
+    taxed = CurrencyRangeTax(
+        CurrencyWithTax(start, start * 2), CurrencyWithTax(stop, stop * 2)
+    )
+    result = schedule(taxed)
+    assert result.start == schedule(taxed.start)
+    assert result.stop.net == stop
+    assert result.stop.gross == schedule(stop * 2).gross
+
+
+@pytest.mark.parametrize("progressive", [True, False])
+def test_batches_match_single_values(progressive):
+    schedule = TaxSchedule("USD", BRACKETS, progressive=progressive)
+    prices = [Currency(amount, "USD") for amount in AMOUNTS]
+    batch = CurrencyArray.from_currencies(prices, precision=3)
+    result = schedule(batch)
+    assert isinstance(result, CurrencyWithTaxArray)
+    assert result.net is batch
+    assert result.gross.precision == 2
+    assert list(result) == [schedule(price) for price in prices]
+    taxed = schedule.apply_batch(result)
+    assert list(taxed) == [schedule(value) for value in result]
+
+
+def test_thresholds_with_more_places_than_the_currency():
+    schedule = TaxSchedule("JPY", [(Decimal("0.5"), Decimal("0.1"))])
+    assert schedule(Currency(100, "JPY")).gross == Currency(110, "JPY")
+    assert schedule(Currency(0, "JPY")).gross == Currency(0, "JPY")
+    batch = CurrencyArray([0, 1, 100], "JPY")
+    assert list(schedule(batch).gross.units) == [0, 1, 110]
+
+
+def test_rounding_matches_divide_rounded():
+    for denominator in (2, 10, 400):
+        for numerator in range(-1000, 1000, 7):
+            assert _rounded(numerator, 2 * denominator) == divide_rounded(
+                numerator, denominator, ROUND_HALF_UP
+            )
+
+
+def test_invalid_schedules():
+    with pytest.raises(ValueError):
+        TaxSchedule("USD", [])
+    with pytest.raises(ValueError):
+        TaxSchedule("USD", [(10, Decimal("0.1")), (10, Decimal("0.2"))])
+    with pytest.raises(ValueError):
+        TaxSchedule("USD", [(0, Decimal("-0.1"))])
+    with pytest.raises(ValueError):
+        TaxSchedule("USD", [(Currency(0, "EUR"), Decimal("0.1"))])
+    with pytest.raises(TypeError):
+        TaxSchedule("USD", [(0, 0.1)])
+    with pytest.raises(TypeError):
+        TaxSchedule("USD", [("0", Decimal("0.1"))])
+    schedule = TaxSchedule("USD", [(Currency(0, "USD"), Decimal("0.1"))])
+    with pytest.raises(ValueError):
+        schedule(Currency(1, "EUR"))
+    with pytest.raises(ValueError):
+        schedule(CurrencyArray([100], "EUR"))
+    with pytest.raises(TypeError):
+        schedule(1)
+    assert "0.1" in repr(schedule)
@@ -0,0 +1,85 @@
+from decimal import Decimal
+from functools import reduce
+import operator
+
+import pytest
+
+from tekmoney.currency import Currency
+from tekmoney.currency_array import CurrencyArray
+from tekmoney.currency_range import CurrencyRange
+from tekmoney.currency_range_tax import CurrencyRangeTax
+from tekmoney.currency_tax import CurrencyWithTax
+from tekmoney.minor_unit_currency import MinorUnitCurrency
+from tekmoney.utils import sum_by_currency, tek_sum
+
+
+def taxed(net, gross, currency="USD"):
+    return CurrencyWithTax(Currency(net, currency), Currency(gross, currency))
+
+
+def test_sum_currency():
+    values = [Currency(Decimal(n) / 10, "USD") for n in range(100)]
+    assert tek_sum(values) == reduce(operator.add, values)
+    assert tek_sum(iter(values)) == Currency(495, "USD")
+    assert tek_sum([], Currency(5, "USD")) == Currency(5, "USD")
+    assert tek_sum([Currency(1, "USD")], start=Currency(5, "USD")) == Currency(6, "USD")
+    assert tek_sum([MinorUnitCurrency(1, "USD"), Currency(2, "USD")]) == Currency(
+        3, "USD"
+    )
+    with pytest.raises(TypeError):
+        tek_sum([])
+    with pytest.raises(ValueError):
+        tek_sum([Currency(1, "USD"), Currency(1, "EUR")])
+    with pytest.raises(TypeError):
+        tek_sum([Currency(1, "USD"), taxed(1, 1)])
+
+
+def test_sum_other_values():
+    assert tek_sum([1, 2, 3]) == 6
+    assert tek_sum([], 5) == 5
+    arrays = [CurrencyArray([1, 2], "USD"), CurrencyArray([3, 4], "USD")]
+    assert tek_sum(arrays) == reduce(operator.add, arrays)
+    assert list(tek_sum(iter(arrays)).units) == [4, 6]
+
+
+def test_sum_taxed_and_ranges():
+    prices = [taxed(10, 12), Currency(1, "USD"), taxed(5, 6)]
+    assert tek_sum(prices) == reduce(operator.add, prices)
+    ranges = [
+        CurrencyRange(Currency(1, "USD"), Currency(2, "USD")),
+        Currency(1, "USD"),
+        CurrencyRange(Currency(3, "USD"), Currency(5, "USD")),
+    ]
+    assert tek_sum(ranges) == reduce(operator.add, ranges)
+    taxed_ranges = [
+        CurrencyRangeTax(taxed(1, 2), taxed(3, 4)),
+        Currency(1, "USD"),
+        taxed(1, 2),
+        ranges[0],
+        CurrencyRangeTax(taxed(5, 6), taxed(7, 8)),
+    ]
+    assert tek_sum(taxed_ranges) == reduce(operator.add, taxed_ranges)
+    with pytest.raises(TypeError):
+        tek_sum([ranges[0], taxed(1, 1)])
+    with pytest.raises(ValueError):
+        tek_sum([taxed(1, 1), taxed(1, 1, "EUR")])
+
+
+def test_sum_by_currency():
+    values = [
+        Currency(1, "USD"),
+        Currency(2, "EUR"),
+        Currency(3, "USD"),
+        Currency(Decimal("0.5"), "EUR"),
+    ]
+    assert sum_by_currency(values) == {
+        "USD": Currency(4, "USD"),
+        "EUR": Currency(Decimal("2.5"), "EUR"),
+    }
+    assert sum_by_currency([]) == {}
+    assert sum_by_currency([taxed(1, 2), taxed(3, 4, "EUR"), taxed(1, 1)]) == {
+        "USD": taxed(2, 3),
+        "EUR": taxed(3, 4, "EUR"),
+    }
+    with pytest.raises(TypeError):
+        sum_by_currency([Currency(1, "USD"), 5])